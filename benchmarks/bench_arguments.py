@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""
+Benchmark tag data construction for tag with many templated arguments (time and allocated memory per render).
+
+    python benchmarks/bench_arguments.py
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import utils  # noqa
+
+utils.setup()
+
+from django.template import Context  # noqa
+
+import wrapper_tag  # noqa
+
+ARGUMENTS_COUNT = 15
+
+
+def make_tag_class():
+    attrs = {
+        'Meta': type(str('Meta'), (), {'start_tag': 'many', 'template': '<div>{{ content }}</div>'}),
+    }
+    for i in range(ARGUMENTS_COUNT):
+        attrs['arg{}'.format(i)] = wrapper_tag.Keyword(template=' arg{0}="{{{{ arg{0} }}}}"'.format(i))
+    return type(str('ManyTag'), (wrapper_tag.Tag,), attrs)
+
+
+def main():
+    tag_cls = make_tag_class()
+    source = '{% many ' + ' '.join('arg{0}=value'.format(i) for i in range(ARGUMENTS_COUNT)) + ' %}{% end:many %}'
+    node = utils.compile_nodelist(source, tag_cls)[0]
+
+    # large context makes per-argument context copies visible
+    context = Context(dict(('var_{}'.format(i), i) for i in range(1000)))
+    context.push(value='hello')
+
+    utils.bench('get_tag_data ({} templated arguments)'.format(ARGUMENTS_COUNT), lambda: node.get_tag_data(context),
+                number=500)
+
+    # peak memory allocated during single render
+    node.get_tag_data(context)
+    tracemalloc.start()
+    node.get_tag_data(context)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    print('{:<50} {:>10.1f} kB'.format('peak allocated memory per render', peak / 1024.0))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+"""
+Benchmark render of html attributes (`mixins.TagAttributes`, `mixins.Data`), compared with `str.format` based
+implementation used before.
+
+    python benchmarks/bench_attributes.py
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import os
+import sys
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import utils  # noqa
+
+utils.setup()
+
+import six  # noqa
+from django.template import Context  # noqa
+from django.utils.safestring import mark_safe  # noqa
+
+import wrapper_tag  # noqa
+from wrapper_tag import attributes, mixins  # noqa
+
+
+def old_render_attrs(attrs):
+    full = ' '.join(['{}="{}"'.format(key, value) for key, value in six.iteritems(attrs) if value])
+    full = ' ' + full if full else ''
+    return mark_safe(full)
+
+
+def old_render_data(value):
+    return ' '.join(['{}="{}"'.format(k.replace('_', '-'), v) for k, v in six.iteritems(value)])
+
+
+def build(factory):
+    attrs = factory(None)
+    attrs['class'].add('btn btn-default')
+    attrs['class'].add('active')
+    attrs['id'].add('id_1')
+    return attrs
+
+
+class ButtonTag(mixins.Identity, mixins.CssClass, mixins.Data, wrapper_tag.Tag):
+    static_attrs = {'type': 'button', 'class': 'btn'}
+
+    class Meta:
+        start_tag = 'button'
+        template = '<button{{ attrs__rendered }} {{ data__rendered }}>{{ content }}</button>'
+
+
+def main():
+    data = {'data_toggle': 'modal', 'data_target': '#dialog', 'data_placement': 'top'}
+    static = attributes.StaticAttributes({'type': 'button', 'role': 'tab'})
+
+    utils.bench('format      attrs', lambda: old_render_attrs(build(mixins.tag_attributes_default)))
+    utils.bench('joined      attrs', lambda: ' ' + attributes.format_attributes(build(mixins.tag_attributes_default)))
+    utils.bench('joined      attrs + static',
+                lambda: attributes.format_attributes(build(mixins.tag_attributes_default), static))
+    utils.bench('ordered     attrs',
+                lambda: ' ' + attributes.format_attributes(build(mixins.ordered_tag_attributes_default)))
+    utils.bench('replace     data', lambda: old_render_data(data))
+    utils.bench('normalized  data', lambda: attributes.format_data(data))
+
+    for count in (100, 1000):
+        nodelist = utils.compile_nodelist(
+            '{% for i in rows %}{% button id="btn" css_class="large" data_toggle="modal" %}x{% end:button %}'
+            '{% endfor %}',
+            ButtonTag)
+        context = Context({'rows': range(count)})
+        utils.bench('page render      tags {:>5}'.format(count), lambda: nodelist.render(context), number=5)
+
+
+if __name__ == '__main__':
+    main()
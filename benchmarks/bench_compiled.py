@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+"""
+Benchmark interpreted and compiled (WRAPPER_TAG_COMPILED) render of tag with many arguments.
+
+    python benchmarks/bench_compiled.py
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import utils  # noqa
+
+utils.setup()
+
+from django.template import Context  # noqa
+from django.test.utils import override_settings  # noqa
+
+import wrapper_tag  # noqa
+
+ARGUMENTS_COUNT = 15
+
+
+TEMPLATED_COUNT = 3
+
+
+def make_tag_class():
+    template = '<div{}>{{{{ content }}}}</div>'.format(
+        ''.join('{{{{ arg{}__rendered }}}}'.format(i) for i in range(TEMPLATED_COUNT)))
+    attrs = {
+        'Meta': type(str('Meta'), (), {'start_tag': 'many', 'template': template}),
+    }
+    for i in range(ARGUMENTS_COUNT):
+        argument_template = ' arg{0}="{{{{ arg{0} }}}}"'.format(i) if i < TEMPLATED_COUNT else None
+        attrs['arg{}'.format(i)] = wrapper_tag.Keyword(template=argument_template)
+    return type(str('ManyTag'), (wrapper_tag.Tag,), attrs)
+
+
+def main():
+    tag_cls = make_tag_class()
+    source = '{% many ' + ' '.join('arg{0}=value'.format(i) for i in range(ARGUMENTS_COUNT)) + ' %}{% end:many %}'
+    nodelist = utils.compile_nodelist(source, tag_cls)
+    context = Context({'value': 'hello'})
+
+    for compiled in (False, True):
+        with override_settings(WRAPPER_TAG_COMPILED=compiled):
+            utils.bench('render ({})'.format('compiled' if compiled else 'interpreted'),
+                        lambda: nodelist.render(context), number=2000)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+"""
+Benchmark rendering of deeply nested wrapper tags with large context. Render time should not depend on context size.
+
+    python benchmarks/bench_context.py
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import utils  # noqa
+
+utils.setup()
+
+from django.template import Context  # noqa
+
+import wrapper_tag  # noqa
+
+
+class NestedTag(wrapper_tag.Tag):
+    title = wrapper_tag.Keyword()
+
+    class Meta:
+        start_tag = 'nested'
+        template = '<div title="{{ title }}">{{ content }}</div>'
+
+
+def make_context(size, layers=5):
+    context = Context()
+    for layer in range(layers):
+        context.push(dict(('var_{}_{}'.format(layer, i), 'value {}'.format(i)) for i in range(size // layers)))
+    return context
+
+
+def main():
+    for depth in (1, 5, 10):
+        source = '{% nested title="t" %}' * depth + '{{ var_0_0 }}' + '{% end:nested %}' * depth
+        nodelist = utils.compile_nodelist(source, NestedTag)
+
+        for size in (10, 1000, 10000):
+            context = make_context(size)
+            utils.bench('depth {:>2}, context size {:>5}'.format(depth, size), lambda: nodelist.render(context),
+                        number=200)
+
+
+if __name__ == '__main__':
+    main()
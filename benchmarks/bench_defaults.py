@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""
+Benchmark argument defaults and tag data construction (copy-on-write defaults vs deepcopy)
+
+    python benchmarks/bench_defaults.py
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import copy
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import utils  # noqa
+
+utils.setup()
+
+from django.template import Context  # noqa
+
+import wrapper_tag  # noqa
+from wrapper_tag import mixins  # noqa
+
+
+class DefaultsTag(mixins.TagAttributes, mixins.Data, wrapper_tag.Tag):
+    href = wrapper_tag.Hyperlink()
+    size = wrapper_tag.KeywordGroup(('xs', 'sm', 'md', 'lg'), default={'md': 12})
+    title = wrapper_tag.Keyword(default='title')
+
+    class Meta:
+        start_tag = 'defaults'
+        template = '<div>{{ content }}</div>'
+
+
+def deepcopy_default(argument):
+    """
+    Default as it was computed before (deepcopy on every access)
+    """
+    if callable(argument._default):
+        return copy.deepcopy(argument._default(argument))
+    return copy.deepcopy(argument._default)
+
+
+def main():
+    arguments = DefaultsTag.arguments
+
+    for name in ('attrs', 'data', 'href', 'size', 'title'):
+        argument = arguments[name]
+        deepcopy_time = utils.bench('{} default (deepcopy)'.format(name), lambda: deepcopy_default(argument),
+                                    number=10000)
+        factory_time = utils.bench('{} default (factory)'.format(name), lambda: argument.default, number=10000)
+        print('{:<50} {:>10.1f}x'.format('speedup', deepcopy_time / factory_time))
+
+    node = utils.compile_nodelist('{% defaults data_one="1" title=title %}{% end:defaults %}', DefaultsTag)[0]
+    context = Context({'title': 'hello'})
+
+    utils.bench('get_tag_data', lambda: node.get_tag_data(context), number=5000)
+
+
+if __name__ == '__main__':
+    main()
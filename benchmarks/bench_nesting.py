@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+"""
+Benchmark render of deeply nested wrapper tags with large content. With simple template content is carried as chunk
+list and joined once, so render time grows linearly with depth (compare with template which joins on every level).
+
+    python benchmarks/bench_nesting.py
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import utils  # noqa
+
+utils.setup()
+
+from django.template import Context  # noqa
+
+import wrapper_tag  # noqa
+
+
+class ChunkedTag(wrapper_tag.Tag):
+
+    class Meta:
+        start_tag = 'chunked'
+        template = '<div class="level">{{ content }}</div>'
+
+
+class JoinedTag(wrapper_tag.Tag):
+
+    class Meta:
+        start_tag = 'joined'
+        # filter makes template non simple, so content is joined on every level
+        template = '<div class="level">{{ content|safe }}</div>'
+
+
+def main():
+    context = Context({'table': mark_safe_table(rows=20000)})
+
+    for tag_cls in (ChunkedTag, JoinedTag):
+        name = tag_cls.options.start_tag
+        for depth in (1, 10, 20, 40):
+            source = '{{% {} %}}'.format(name) * depth + '{{ table }}' + '{{% end:{} %}}'.format(name) * depth
+            nodelist = utils.compile_nodelist(source, tag_cls)
+            utils.bench('{} depth {:>2}'.format(name, depth), lambda: nodelist.render(context), number=20)
+
+
+def mark_safe_table(rows):
+    from django.utils.safestring import mark_safe
+
+    return mark_safe('<table>{}</table>'.format(''.join(
+        '<tr><td>{0}</td><td>row {0}</td><td>value</td></tr>'.format(i) for i in range(rows))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+"""
+Benchmark render of sibling wrapper tags with I/O bound hook (sleep), sequentially and with `Meta.parallel`.
+
+    python benchmarks/bench_parallel.py
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import utils  # noqa
+
+utils.setup()
+
+from django.template import Context  # noqa
+
+import wrapper_tag  # noqa
+
+# simulated latency of remote call in hook
+LATENCY = 0.005
+
+
+class WidgetTag(wrapper_tag.Tag):
+    title = wrapper_tag.Keyword()
+
+    class Meta:
+        start_tag = 'widget'
+        template = '<div class="widget">{{ title }}</div>'
+
+    def clean_title(self, argument, value):
+        time.sleep(LATENCY)
+        return value
+
+
+class SequentialTag(wrapper_tag.Tag):
+
+    class Meta:
+        start_tag = 'sequential'
+        template = '<section>{{ content }}</section>'
+
+
+class ParallelTag(wrapper_tag.Tag):
+
+    class Meta:
+        start_tag = 'parallel'
+        template = '<section>{{ content }}</section>'
+        parallel = 8
+
+
+def main():
+    context = Context({})
+
+    for tag_cls in (SequentialTag, ParallelTag):
+        name = tag_cls.options.start_tag
+        for widgets in (1, 8, 32):
+            source = '{{% {} %}}'.format(name) + '{% widget title="w" %}{% end:widget %}' * widgets + \
+                     '{{% end:{} %}}'.format(name)
+            nodelist = utils.compile_nodelist(source, tag_cls, WidgetTag)
+            utils.bench('{:<10} widgets {:>2}'.format(name, widgets), lambda: nodelist.render(context),
+                        number=5, repeat=3)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+"""
+Benchmark render of one tag class over many table rows: `{% for %}` loop, `Tag.render_many` and `{% for_each_tag %}`.
+
+    python benchmarks/bench_render_many.py
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import utils  # noqa
+
+utils.setup()
+
+from django import template  # noqa
+from django.template import Context  # noqa
+from django.template.base import Lexer, Parser  # noqa
+from django.template.engine import Engine  # noqa
+
+import wrapper_tag  # noqa
+from wrapper_tag.templatetags import wrapper_tag_bulk  # noqa
+
+
+class CellTag(wrapper_tag.Tag):
+    title = wrapper_tag.Keyword(template=' title="{{ title }}"')
+    align = wrapper_tag.Keyword(choices=['left', 'right'], default='left', pure=True)
+    css_class = wrapper_tag.Keyword(default='cell', pure=True)
+
+    class Meta:
+        start_tag = 'cell'
+        template = '<td{{ title__rendered }} class="{{ css_class }} {{ align }}">{{ content }}</td>'
+
+    def clean_align(self, argument, value):
+        return 'align-{}'.format(value)
+
+
+def compile_nodelist(source):
+    library = template.Library()
+    library.tag(CellTag.options.start_tag, CellTag)
+    engine = Engine.get_default()
+    parser = Parser(Lexer(source).tokenize(), builtins=engine.template_builtins + [library, wrapper_tag_bulk.register])
+    return parser.parse()
+
+
+def main():
+    for count in (100, 5000):
+        rows = [{'title': 'row {}'.format(i), 'align': 'right' if i % 2 else 'left'} for i in range(count)]
+        context = Context({'rows': rows})
+
+        looped = compile_nodelist('{% for row in rows %}{% cell title=row.title align=row.align %}x{% end:cell %}'
+                                  '{% endfor %}')
+        each = compile_nodelist('{% for_each_tag cell rows %}x{% end:for_each_tag %}')
+
+        number = max(1, 5000 // count)
+        utils.bench('for loop        rows {:>5}'.format(count), lambda: looped.render(context), number=number)
+        utils.bench('render_many     rows {:>5}'.format(count), lambda: CellTag.render_many(rows, content='x'),
+                    number=number)
+        utils.bench('for_each_tag    rows {:>5}'.format(count), lambda: each.render(context), number=number)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+"""
+Benchmark allocation time and memory of RenderedTag (pages with thousands of tags), compared with dict based
+implementation used before.
+
+    python benchmarks/bench_rendered_tag.py
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import utils  # noqa
+
+utils.setup()
+
+from django.template import Context  # noqa
+
+import wrapper_tag  # noqa
+from wrapper_tag.rendered import RenderedTag  # noqa
+
+
+class DictRenderedTag(dict):
+    """
+    Previous dict based RenderedTag
+    """
+    chunks = None
+    tag = None
+
+    def __init__(self, rendered_content, tag_name, **data):
+        self.chunks = rendered_content
+        self.tag = tag_name
+        super(DictRenderedTag, self).__init__(**data)
+
+    def __getattr__(self, attr):
+        if attr in self.__dict__:
+            return self.__dict__[attr]
+        return self[attr]
+
+
+class CellTag(wrapper_tag.Tag):
+    title = wrapper_tag.Keyword()
+
+    class Meta:
+        start_tag = 'cell'
+        template = '<td title="{{ title }}">{{ content }}</td>'
+
+
+def measure(name, func):
+    """
+    Print peak memory allocated by func
+    """
+    tracemalloc.start()
+    result = func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print('{:<50} {:>10.1f} kB'.format(name, peak / 1024.0))
+    return result
+
+
+def main():
+    arguments = {'title': 'title'}
+
+    for count in (1000, 10000):
+        for cls in (DictRenderedTag, RenderedTag):
+            allocate = lambda: [cls('<td>x</td>', 'cell', arguments=arguments) for _ in range(count)]  # noqa
+            utils.bench('{:<16} allocate {:>5}'.format(cls.__name__, count), allocate, number=10)
+            measure('{:<16} memory   {:>5}'.format(cls.__name__, count), allocate)
+
+    for count in (1000, 5000):
+        nodelist = utils.compile_nodelist('{% for i in rows %}{% cell title=i %}x{% end:cell %}{% endfor %}', CellTag)
+        context = Context({'rows': range(count)})
+        utils.bench('page render      tags     {:>5}'.format(count), lambda: nodelist.render(context), number=5)
+        measure('page memory      tags     {:>5}'.format(count), lambda: nodelist.render(context))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+"""
+Benchmark full render and streamed render (time to first chunk, time to last chunk) of deeply nested wrapper tags.
+
+    python benchmarks/bench_streaming.py
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import utils  # noqa
+
+utils.setup()
+
+from django.template import Context  # noqa
+
+import wrapper_tag  # noqa
+from wrapper_tag import streaming  # noqa
+
+
+class NestedTag(wrapper_tag.Tag):
+    title = wrapper_tag.Keyword()
+
+    class Meta:
+        start_tag = 'nested'
+        template = '<div title="{{ title }}">{{ content }}</div>'
+
+
+def main():
+    for depth, width in ((10, 10), (50, 10)):
+        body = '{% for i in items %}<p>{{ i }}</p>{% endfor %}'
+        source = ('{% nested title="t" %}' + body) * depth + '{% end:nested %}' * depth
+        nodelist = utils.compile_nodelist(source, NestedTag)
+        context = Context({'items': range(width)})
+
+        utils.bench('depth {:>2} full render'.format(depth), lambda: nodelist.render(context), number=50)
+        utils.bench('depth {:>2} streamed first chunk'.format(depth),
+                    lambda: next(streaming.iter_nodelist(nodelist, context)), number=50)
+        utils.bench('depth {:>2} streamed all chunks'.format(depth),
+                    lambda: list(streaming.iter_nodelist(nodelist, context)), number=50)
+
+
+if __name__ == '__main__':
+    main()
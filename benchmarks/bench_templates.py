@@ -0,0 +1,44 @@
+#!/usr/bin/env python
+"""
+Benchmark rendering of simple tag templates with SimpleTemplate and with django template engine.
+
+    python benchmarks/bench_templates.py
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks import utils  # noqa
+
+utils.setup()
+
+from django.template import Context, Template  # noqa
+
+from wrapper_tag.simple_template import SimpleTemplate  # noqa
+
+SOURCES = {
+    'content only': '{{ content }}',
+    'attributes': '<div{{ id__rendered }}{{ title__rendered }} class="{{ css_class }}">{{ content }}</div>',
+}
+
+
+def main():
+    context = Context({
+        'content': '<b>content</b>',
+        'id__rendered': ' id="x"',
+        'title__rendered': ' title="title"',
+        'css_class': 'a b',
+    })
+
+    for name, source in sorted(SOURCES.items()):
+        django_template = Template(source)
+        simple_template = SimpleTemplate.compile(source)
+        utils.bench('{:<12} django template'.format(name), lambda: django_template.render(context), number=5000)
+        utils.bench('{:<12} simple template'.format(name), lambda: simple_template.render(context), number=5000)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Helpers for wrapper tag benchmarks
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import os
+import sys
+import timeit
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def setup():
+    """
+    Configure minimal django settings for benchmarks (no debug, no logging)
+    """
+    if ROOT not in sys.path:
+        sys.path.insert(0, ROOT)
+
+    import django
+    from django.conf import settings
+
+    if settings.configured:
+        return
+
+    settings.configure(
+        DEBUG=False,
+        TEMPLATE_DEBUG=False,
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+            }
+        },
+        ROOT_URLCONF="wrapper_tag.urls",
+        INSTALLED_APPS=[
+            "django.contrib.auth",
+            "django.contrib.contenttypes",
+            "wrapper_tag",
+            "tests",
+        ],
+        TEMPLATES=[
+            {
+                'BACKEND': 'django.template.backends.django.DjangoTemplates',
+                'APP_DIRS': True,
+            },
+        ],
+        LOGGING_CONFIG=None,
+    )
+    django.setup()
+
+
+def bench(name, func, number=1000, repeat=5):
+    """
+    Run func `number` times (best of `repeat`) and print time per call
+    :param name: benchmark name
+    :param func: function to benchmark
+    :param number: calls per repeat
+    :param repeat: repeats
+    :return: best time per call in seconds
+    """
+    best = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+    print('{:<50} {:>10.2f} us'.format(name, best * 1e6))
+    return best
+
+
+def compile_nodelist(source, *tag_classes):
+    """
+    Compile template source with given wrapper tag classes available as builtins
+    :param source: template source
+    :param tag_classes: wrapper tag classes
+    :return: compiled NodeList
+    """
+    from django import template
+    from django.template.base import Lexer, Parser
+
+    library = template.Library()
+    for tag_cls in tag_classes:
+        library.tag(tag_cls.options.start_tag, tag_cls)
+
+    engine = template.Engine.get_default()
+    parser = Parser(Lexer(source).tokenize(), builtins=engine.template_builtins + [library])
+    return parser.parse()
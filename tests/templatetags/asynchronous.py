@@ -0,0 +1,57 @@
+import asyncio
+
+from django import template
+from django.utils.html import format_html
+
+import wrapper_tag
+
+register = template.Library()
+
+# log of async hooks, used to check that siblings are rendered concurrently
+events = []
+
+
+async def load_label(data, **kwargs):
+    await asyncio.sleep(0)
+    data['label'] = 'label of {}'.format(data.get('title'))
+
+
+@wrapper_tag.register_tag(register)
+class AsyncTag(wrapper_tag.Tag):
+    title = wrapper_tag.Keyword()
+
+    class Meta:
+        start_tag = "async"
+        template = "<div{{ title__rendered }} data-label=\"{{ label }}\">{{ content }}</div>"
+
+    async def clean_title(self, argument, value):
+        events.append('start {}'.format(value))
+        await asyncio.sleep(0)
+        events.append('end {}'.format(value))
+        return value
+
+    async def render_title(self, argument, data, context):
+        await asyncio.sleep(0)
+        return format_html(' title="{}"', data.get(argument.name))
+
+
+AsyncTag.on_data.connect(load_label)
+
+
+@wrapper_tag.register_tag(register)
+class LazyAsyncTag(wrapper_tag.Tag):
+    title = wrapper_tag.Keyword()
+    note = wrapper_tag.Keyword()
+
+    class Meta:
+        start_tag = "lazy_async"
+        template = "{% if show %}{{ note__rendered }}{% endif %}<b{{ title__rendered }}></b>"
+        lazy_render = True
+
+    async def render_title(self, argument, data, context):
+        await asyncio.sleep(0)
+        return format_html(' title="{}"', data.get(argument.name))
+
+    def render_note(self, argument, data, context):
+        events.append('render note')
+        return data.get(argument.name)
@@ -0,0 +1,32 @@
+from django import template
+
+import wrapper_tag
+from wrapper_tag import mixins
+
+register = template.Library()
+
+
+@wrapper_tag.register_tag(register)
+class AttributesTag(mixins.Identity, mixins.CssClass, mixins.Data, wrapper_tag.Tag):
+
+    class Meta:
+        start_tag = 'attributes'
+        template = '<div{{ attrs__rendered }} {{ data__rendered }}>{{ content }}</div>'
+
+
+@wrapper_tag.register_tag(register)
+class OrderedAttributesTag(mixins.OrderedTagAttributes, mixins.Identity, mixins.CssClass, mixins.Data,
+                           wrapper_tag.Tag):
+
+    class Meta:
+        start_tag = 'ordered_attributes'
+        template = '<div{{ attrs__rendered }} {{ data__rendered }}>{{ content }}</div>'
+
+
+@wrapper_tag.register_tag(register)
+class ButtonTag(mixins.Identity, mixins.CssClass, wrapper_tag.Tag):
+    static_attrs = {'type': 'button', 'class': 'btn btn-default', 'data-role': 'action'}
+
+    class Meta:
+        start_tag = 'button'
+        template = '<button{{ attrs__rendered }}>{{ content }}</button>'
@@ -0,0 +1,29 @@
+from django import template
+
+import wrapper_tag
+
+register = template.Library()
+
+
+@wrapper_tag.register_tag(register)
+class BindingTag(wrapper_tag.Tag):
+    first = wrapper_tag.Positional()
+    title = wrapper_tag.Keyword()
+    size = wrapper_tag.Keyword(choices=['sm', 'lg'], default='sm')
+    data = wrapper_tag.KeywordGroup('data_*')
+
+    class Meta:
+        start_tag = "binding"
+        template = "<div>{{ content }}</div>"
+
+
+@wrapper_tag.register_tag(register)
+class TemplatedTag(wrapper_tag.Tag):
+    title = wrapper_tag.Keyword(template=' title="{{ title }}"')
+    name = wrapper_tag.Keyword(template='{{ extra_data.prefix }}{{ argument.name }}={{ name }}',
+                               extra_data={'prefix': '-'})
+    label = wrapper_tag.Keyword(template='{{ title__rendered }}|{{ label }}')
+
+    class Meta:
+        start_tag = "templated"
+        template = "<div{{ title__rendered }}>{{ name__rendered }}{{ label__rendered }}{{ content }}</div>"
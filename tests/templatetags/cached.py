@@ -0,0 +1,58 @@
+import time
+
+from django import template
+from django.utils.html import format_html
+
+import wrapper_tag
+
+register = template.Library()
+
+
+@wrapper_tag.register_tag(register)
+class CachedTag(wrapper_tag.Tag):
+    title = wrapper_tag.Keyword()
+    css_class = wrapper_tag.Keyword(default='')
+
+    rendered = 0
+
+    class Meta:
+        start_tag = "cached"
+        cache = {
+            'timeout': 60,
+            'vary_on': ['title'],
+            'vary_on_context': ['user'],
+        }
+
+    def render_tag(self, tag_kwargs, context):
+        CachedTag.rendered += 1
+        return format_html('<div title="{}">{}</div>', tag_kwargs.get('title', ''), tag_kwargs['content'])
+
+
+@wrapper_tag.register_tag(register)
+class DefaultCachedTag(wrapper_tag.Tag):
+    title = wrapper_tag.Keyword()
+
+    class Meta:
+        start_tag = "default_cached"
+        template = "<div>{{ content }}</div>"
+        cache = True
+
+
+@wrapper_tag.register_tag(register)
+class SlowCachedTag(wrapper_tag.Tag):
+    title = wrapper_tag.Keyword()
+
+    rendered = 0
+    delay = 0
+
+    class Meta:
+        start_tag = "slow_cached"
+        cache = {
+            'timeout': 60,
+            'soft_timeout': 0.05,
+        }
+
+    def render_tag(self, tag_kwargs, context):
+        SlowCachedTag.rendered += 1
+        time.sleep(SlowCachedTag.delay)
+        return format_html('<div>{}:{}</div>', tag_kwargs['content'], SlowCachedTag.rendered)
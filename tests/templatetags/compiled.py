@@ -0,0 +1,66 @@
+from django import template
+
+import wrapper_tag
+from wrapper_tag import validators
+
+register = template.Library()
+
+
+class LegacyKeyword(wrapper_tag.Keyword):
+    """
+    Argument which still overrides get_tag_value (resolved from raw args/kwargs)
+    """
+
+    def get_tag_value(self, args, kwargs):
+        return kwargs.pop(self.name, 'legacy')
+
+
+class UpperKeyword(wrapper_tag.Keyword):
+
+    def clean(self, tag, value):
+        return value.upper() if value else value
+
+
+def add_marker(data, **kwargs):
+    data['marker'] = 'on_data'
+
+
+@wrapper_tag.register_tag(register)
+class CompiledTag(wrapper_tag.Tag):
+    first = wrapper_tag.Positional()
+    title = wrapper_tag.Keyword(validators=validators.string(), default='untitled',
+                                template=' title="{{ title }}"')
+    size = wrapper_tag.Keyword(choices=['sm', 'lg'], default='sm')
+    label = UpperKeyword(on_data=add_marker)
+    legacy = LegacyKeyword()
+    data = wrapper_tag.KeywordGroup('data_*')
+    fixed = wrapper_tag.Keyword(readonly=True, default='fixed')
+
+    class Meta:
+        start_tag = "compiled"
+        template = ('<div{{ title__rendered }} class="{{ size }}" data-first="{{ first }}">'
+                    '{{ label }}|{{ legacy }}|{{ fixed }}|{{ marker }}|{{ data__rendered }}|{{ missing.lookup }}'
+                    '{{ content }}</div>')
+
+    def clean_size(self, argument, value):
+        return 'size-{}'.format(value)
+
+    def render_data(self, argument, data, context):
+        return ' '.join('{}={}'.format(k, v) for k, v in sorted(data.get(argument.name, {}).items()))
+
+
+@wrapper_tag.register_tag(register)
+class CompiledBlockTag(wrapper_tag.Tag):
+    title = wrapper_tag.Keyword()
+
+    class Meta:
+        start_tag = "compiled_block"
+        template = '{% if title %}<b>{{ title }}</b>{% endif %}{{ content }}'
+
+
+@wrapper_tag.register_tag(register)
+class CompiledVarTag(CompiledTag):
+
+    class Meta(CompiledTag.Meta):
+        start_tag = "compiled_var"
+        as_var_only = True
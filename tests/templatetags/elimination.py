@@ -0,0 +1,65 @@
+from django import template
+
+import wrapper_tag
+
+register = template.Library()
+
+# names of rendered arguments, used to check which arguments were eliminated
+rendered = []
+
+
+class RenderMixin(object):
+
+    def render_title(self, argument, data, context):
+        rendered.append(argument.name)
+        return ' title="{}"'.format(data.get(argument.name, ''))
+
+    def render_hidden(self, argument, data, context):
+        rendered.append(argument.name)
+        return 'hidden'
+
+    def render_forced(self, argument, data, context):
+        rendered.append(argument.name)
+        return 'forced'
+
+
+@wrapper_tag.register_tag(register)
+class EliminatedTag(RenderMixin, wrapper_tag.Tag):
+    title = wrapper_tag.Keyword()
+    hidden = wrapper_tag.Keyword()
+    forced = wrapper_tag.Keyword()
+
+    class Meta:
+        start_tag = "eliminated"
+        template = "<div{{ title__rendered }}>{{ hidden }}{{ content }}</div>"
+        used_arguments = ['forced']
+
+
+@wrapper_tag.register_tag(register)
+class EliminatedBlockTag(RenderMixin, wrapper_tag.Tag):
+    title = wrapper_tag.Keyword()
+    hidden = wrapper_tag.Keyword()
+    forced = wrapper_tag.Keyword()
+
+    class Meta:
+        start_tag = "eliminated_block"
+        template = ("{% if parent.title__rendered and forced %}<b{{ title__rendered }}>{% endif %}"
+                    "{% for item in items %}{{ item|default:forced__rendered }}{% endfor %}{{ content }}")
+        used_arguments = 'auto'
+
+
+@wrapper_tag.register_tag(register)
+class HookReadsTag(wrapper_tag.Tag):
+    icon = wrapper_tag.Keyword()
+    title = wrapper_tag.Keyword()
+
+    class Meta:
+        start_tag = "hook_reads"
+        template = "<div>{{ title__rendered }}</div>"
+
+    def render_icon(self, argument, data, context):
+        return '[{}]'.format(data.get(argument.name))
+
+    def render_title(self, argument, data, context):
+        # reads rendered value of other argument, which isn't in template
+        return '{}{}'.format(data.get('icon__rendered', ''), data.get(argument.name))
@@ -44,3 +44,20 @@ class ExampleRenderedTag(wrapper_tag.Tag):
     class Meta:
         start_tag = "ex_rendered"
         template = "<div>{{ content }}</div>"
+
+
+@wrapper_tag.register_tag(register)
+class DeferredRenderedTag(ExampleRenderedTag):
+    title = wrapper_tag.Keyword()
+
+    # number of rendered templates, used to check that html is rendered only when printed
+    rendered = 0
+
+    class Meta:
+        start_tag = "ex_deferred"
+        template = "<div title=\"{{ title }}\">{{ content }}</div>"
+        deferred = True
+
+    def render_tag(self, tag_kwargs, context):
+        DeferredRenderedTag.rendered += 1
+        return super(DeferredRenderedTag, self).render_tag(tag_kwargs, context)
@@ -0,0 +1,72 @@
+from django import template
+
+import wrapper_tag
+from wrapper_tag import mixins
+
+register = template.Library()
+
+
+@wrapper_tag.register_tag(register)
+class PureTag(wrapper_tag.Tag):
+    title = wrapper_tag.Keyword()
+    css_class = wrapper_tag.Keyword(default='')
+
+    cleaned = 0
+
+    class Meta:
+        start_tag = "pure"
+        template = "<div{{ title__rendered }}>{{ content }}</div>"
+        pure = True
+
+    def clean_title(self, argument, value):
+        PureTag.cleaned += 1
+        return value
+
+    def render_title(self, argument, data, context):
+        return ' title="{}"'.format(data[argument.name])
+
+
+@wrapper_tag.register_tag(register)
+class PureArgumentsTag(wrapper_tag.Tag):
+    title = wrapper_tag.Keyword(pure=True)
+    name = wrapper_tag.Keyword(pure=True)
+
+    class Meta:
+        start_tag = "pure_arguments"
+        template = "<div>{{ content }}</div>"
+
+
+@wrapper_tag.register_tag(register)
+class PureAttributesTag(mixins.CssClass, mixins.TagAttributes, wrapper_tag.Tag):
+    data = wrapper_tag.KeywordGroup('data_*')
+
+    class Meta:
+        start_tag = "pure_attributes"
+        template = "<div{{ attrs__rendered }}>{{ content }}</div>"
+        pure = True
+
+
+@wrapper_tag.register_tag(register)
+class NoArgumentsTag(wrapper_tag.Tag):
+
+    class Meta:
+        start_tag = "no_arguments"
+        template = "<i>{{ x }}</i>"
+
+
+def add_x(data, context, **kwargs):
+    data['x'] = context.get('x')
+
+
+NoArgumentsTag.on_data.connect(add_x)
+
+
+@wrapper_tag.register_tag(register)
+class PureTemplatedTag(wrapper_tag.Tag):
+    title = wrapper_tag.Keyword(template='{{ title }}')
+    greeting = wrapper_tag.Keyword(template='{{ greeting }} {{ user }}')
+
+    class Meta:
+        start_tag = "pure_templated"
+        template = "<div>{{ title__rendered }}{{ greeting__rendered }}</div>"
+        pure = True
@@ -0,0 +1,47 @@
+from django import template
+from django.utils.html import format_html
+
+import wrapper_tag
+
+register = template.Library()
+
+# names of rendered arguments, used to check that arguments are rendered on access
+rendered = []
+
+
+@wrapper_tag.register_tag(register)
+class LazyTag(wrapper_tag.Tag):
+    link = wrapper_tag.Keyword()
+    icon = wrapper_tag.Keyword()
+    title = wrapper_tag.Keyword()
+
+    class Meta:
+        start_tag = "lazy"
+        template = ("{% if show %}<a{{ link__rendered }}>{{ link__rendered }}</a>{% endif %}"
+                    "<b>{{ title__rendered }}</b>{{ content }}")
+        used_arguments = ['icon']
+        lazy_render = True
+
+    def render_link(self, argument, data, context):
+        rendered.append(argument.name)
+        if argument.name not in data:
+            return None
+        return format_html(' href="{}"', data.get(argument.name))
+
+    def render_icon(self, argument, data, context):
+        rendered.append(argument.name)
+        if argument.name not in data:
+            return None
+        return format_html('<i class="{}"></i>', data.get(argument.name))
+
+    def render_title(self, argument, data, context):
+        rendered.append(argument.name)
+        return format_html('{}{}', data.get('icon__rendered', ''), data.get(argument.name))
+
+
+@wrapper_tag.register_tag(register)
+class EagerTag(LazyTag):
+
+    class Meta(LazyTag.Meta):
+        start_tag = "eager"
+        lazy_render = False
@@ -0,0 +1,37 @@
+from django import template
+from django.contrib.auth.models import User
+from django.utils.html import format_html
+
+import wrapper_tag
+from wrapper_tag import loaders
+
+register = template.Library()
+
+user_loader = loaders.ModelLoader(User)
+username_loader = loaders.ModelLoader(User, field_name='username')
+
+
+@wrapper_tag.register_tag(register)
+class UserTag(wrapper_tag.Tag):
+    user = wrapper_tag.Keyword()
+    friend = wrapper_tag.Keyword()
+
+    rendered = 0
+
+    class Meta:
+        start_tag = "user"
+        template = "<span>{{ user__rendered }}{{ content }}</span>"
+
+    def clean_user(self, argument, value):
+        return user_loader.load(value)
+
+    def clean_friend(self, argument, value):
+        return username_loader.load(value)
+
+    def render_user(self, argument, data, context):
+        UserTag.rendered += 1
+        user = data.get('user')
+        if user is None:
+            return 'unknown'
+        friend = data.get('friend')
+        return format_html('{}{}', user.username, ' & {}'.format(friend.username) if friend else '')
@@ -0,0 +1,46 @@
+import threading
+import time
+
+from django import template
+from django.utils import translation
+
+import wrapper_tag
+
+register = template.Library()
+
+# names of threads which cleaned `slow` tags, used to check that siblings are rendered in parallel
+threads = []
+
+DELAY = 0.05
+
+
+@wrapper_tag.register_tag(register)
+class ParallelTag(wrapper_tag.Tag):
+
+    class Meta:
+        start_tag = "parallel"
+        template = "<section>{{ content }}</section>"
+        parallel = 4
+
+
+@wrapper_tag.register_tag(register)
+class SlowTag(wrapper_tag.Tag):
+    title = wrapper_tag.Keyword()
+
+    class Meta:
+        start_tag = "slow"
+        template = "<i lang=\"{{ language }}\">{{ title }}{{ content }}</i>"
+
+    def clean_title(self, argument, value):
+        time.sleep(DELAY)
+        threads.append(threading.current_thread().name)
+        if value.startswith('fail'):
+            raise ValueError(value)
+        return value
+
+
+def add_language(data, **kwargs):
+    data['language'] = translation.get_language()
+
+
+SlowTag.on_data.connect(add_language)
@@ -0,0 +1,17 @@
+from django import template
+
+import wrapper_tag
+from wrapper_tag import mixins
+
+register = template.Library()
+
+
+@wrapper_tag.register_tag(register)
+class ExtraContentTag(mixins.ExtraContent, wrapper_tag.Tag):
+    title = wrapper_tag.Keyword()
+
+    extra_content_template = 'tests/extra_content.html'
+
+    class Meta:
+        start_tag = "extra_content"
+        template = "<div>{{ content }}{{ extra_content }}</div>"
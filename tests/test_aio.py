@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-wrapper-tag
+------------
+
+Tests for `django-wrapper-tag` async render.
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import mock
+import six
+from django.template import Context, Template, engines
+from django.test import TestCase, override_settings
+
+import wrapper_tag
+from wrapper_tag import aio, codegen
+from tests.templatetags import asynchronous
+
+SIBLINGS = ('{% load asynchronous %}{% async title="a" %}{% async title="a1" %}{% end:async %}{% end:async %}'
+            '<hr>{% async title="b" %}{{ value }}{% end:async %}')
+
+
+class TestAsyncRender(TestCase):
+
+    def setUp(self):
+        asynchronous.events[:] = []
+
+    def get_node(self, source):
+        t = Template(source)
+        return [node for node in t.nodelist if isinstance(node, wrapper_tag.Tag)][0]
+
+    def test_arender(self):
+        node = self.get_node('{% load asynchronous %}{% async title=value %}{{ value }}{% end:async %}')
+
+        rendered = aio.run_in_new_loop(node.arender(Context({'value': '<x>'})))
+        self.assertEqual(six.text_type(rendered),
+                         '<div title="&lt;x&gt;" data-label="label of &lt;x&gt;">&lt;x&gt;</div>')
+
+    def test_sync_render(self):
+        template = engines['django'].from_string(SIBLINGS)
+        expected = ('<div title="a" data-label="label of a"><div title="a1" data-label="label of a1"></div></div>'
+                    '<hr><div title="b" data-label="label of b">v</div>')
+
+        self.assertEqual(aio.run_in_new_loop(aio.render_template(template, {'value': 'v'})), expected)
+
+        # synchronous render (WSGI) runs async hooks to completion
+        self.assertEqual(template.render({'value': 'v'}), expected)
+
+        # also when event loop is running in current thread
+        async def render():
+            return template.render({'value': 'v'})
+        self.assertEqual(aio.run_in_new_loop(render()), expected)
+
+    def test_nested(self):
+        inner = engines['django'].from_string(SIBLINGS)
+        base = Template('<main>{% block body %}{% endblock %}</main>')
+        sources = (
+            '{% if True %}' + SIBLINGS + '{% endif %}',
+            '{% for i in "x" %}' + SIBLINGS + '{% endfor %}',
+            '{% with x=1 %}' + SIBLINGS + '{% endwith %}',
+            '{% block body %}' + SIBLINGS + '{% endblock %}',
+            '{% extends base %}{% block body %}' + SIBLINGS + '{% endblock %}',
+            '{% include inner %}',
+            '{% include inner only %}',
+        )
+
+        for source in sources:
+            asynchronous.events[:] = []
+            template = engines['django'].from_string(source)
+            context = {'value': 'v', 'inner': inner, 'base': base}
+
+            # nested tags are awaited by async render, not run by synchronous fallback
+            with mock.patch.object(aio, 'run_sync', side_effect=AssertionError) as run_sync:
+                rendered = aio.run_in_new_loop(aio.render_template(template, context))
+                self.assertFalse(run_sync.called, source)
+
+            self.assertEqual(rendered, template.render(context), source)
+            self.assertLess(asynchronous.events.index('start b'), asynchronous.events.index('end a'), source)
+
+    def test_concurrent_siblings(self):
+        template = engines['django'].from_string(SIBLINGS)
+        aio.run_in_new_loop(aio.render_template(template, {'value': 'v'}))
+
+        # clean of sibling `b` starts before clean of `a` ends
+        self.assertLess(asynchronous.events.index('start b'), asynchronous.events.index('end a'))
+
+    def test_concurrent_context(self):
+        t = Template('{% load asynchronous %}{% async title="a" %}{% firstof "x" as leaked %}{% end:async %}'
+                     '{% async title="b" %}[{{ leaked }}]{% end:async %}')
+        context = Context()
+        bits = [None] * len(t.nodelist)
+        with context.render_context.push_state(t), context.bind_template(t):
+            aio.run_in_new_loop(aio.render_concurrent(t.nodelist, [1, 2], bits, context))
+
+        # every task has its own top dict
+        self.assertNotIn('leaked', context)
+        self.assertEqual(six.text_type(bits[2]), '<div title="b" data-label="label of b">[]</div>')
+
+    def test_lazy_render(self):
+        template = engines['django'].from_string('{% load asynchronous %}{% lazy_async title="t" note="n" %}'
+                                                 '{% end:lazy_async %}')
+
+        rendered = aio.run_in_new_loop(aio.render_template(template, {'show': False}))
+        self.assertEqual(rendered, '<b title="t"></b>')
+        self.assertNotIn('render note', asynchronous.events)
+
+        rendered = aio.run_in_new_loop(aio.render_template(template, {'show': True}))
+        self.assertEqual(rendered, 'n<b title="t"></b>')
+
+    def test_sync_data(self):
+        template = engines['django'].from_string('{% load binding %}{% binding "a" title=value %}{% end:binding %}')
+
+        # tag without async hooks is computed by synchronous path (compiled mode)
+        with override_settings(WRAPPER_TAG_COMPILED=True):
+            with mock.patch.object(codegen, 'get_compiled', wraps=codegen.get_compiled) as get_compiled:
+                rendered = aio.run_in_new_loop(aio.render_template(template, {'value': 'v'}))
+                self.assertTrue(get_compiled.called)
+
+        self.assertEqual(rendered, template.render({'value': 'v'}))
+
+    def test_as_var_barrier(self):
+        template = engines['django'].from_string(
+            '{% load asynchronous %}{% async title="a" as var %}{% end:async %}'
+            '{% async title="b" %}{{ var }}{% end:async %}'
+        )
+        rendered = aio.run_in_new_loop(aio.render_template(template))
+        self.assertIn('label of a', rendered)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-wrapper-tag
+------------
+
+Tests for `django-wrapper-tag` dead argument elimination.
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+from django.template import Template, engines
+from django.test import TestCase
+
+from wrapper_tag import analysis
+from tests.templatetags import elimination
+from tests.templatetags.elimination import EliminatedBlockTag, EliminatedTag, HookReadsTag
+
+
+def add_marker(data, **kwargs):
+    data['marker'] = True
+
+
+class TestDeadArgumentElimination(TestCase):
+
+    def setUp(self):
+        elimination.rendered[:] = []
+
+    def render(self, source, context=None):
+        return engines['django'].from_string('{% load elimination %}' + source).render(context or {})
+
+    def test_unused_rendered_keys(self):
+        self.assertEqual(analysis.get_rendered_keys(EliminatedTag), frozenset(['title__rendered', 'forced__rendered']))
+
+        output = self.render('{% eliminated title="a" hidden="h" forced="f" %}c{% end:eliminated %}')
+        self.assertEqual(output, '<div title=&quot;a&quot;>hc</div>')
+        self.assertEqual(elimination.rendered, ['title', 'forced'])
+
+    def test_as_var(self):
+        output = self.render('{% eliminated title="a" as var %}{% end:eliminated %}'
+                             '{{ var.arguments.hidden__rendered }}')
+        self.assertEqual(output, 'hidden')
+        self.assertEqual(elimination.rendered, ['title', 'hidden', 'forced'])
+
+    def test_template_tags(self):
+        self.assertEqual(analysis.get_rendered_keys(EliminatedBlockTag),
+                         frozenset(['title__rendered', 'forced__rendered']))
+
+        self.render('{% eliminated_block title="a" %}{% end:eliminated_block %}')
+        self.assertEqual(elimination.rendered, ['title', 'forced'])
+
+    def test_not_opted_in(self):
+        # render hook reads rendered value of argument which isn't in template
+        self.assertIsNone(analysis.get_rendered_keys(HookReadsTag))
+
+        output = self.render('{% hook_reads icon="i" title="t" %}{% end:hook_reads %}')
+        self.assertEqual(output, '<div>[i]t</div>')
+
+    def test_template_variables(self):
+        template = Template('{% if a and not b.c %}{{ d|default:e }}{% else %}{% with f=g %}{% endwith %}{% endif %}'
+                            '{% for x in h %}{% empty %}{{ i }}{% endfor %}')
+        self.assertEqual(sorted(analysis.get_template_variables(template)), ['a', 'b.c', 'd', 'e', 'g', 'h', 'i'])
+
+        self.assertIsNone(analysis.get_template_variables(Template('{% include "x.html" %}')))
+        self.assertIsNone(analysis.get_template_names(Template('{{ parent }}')))
+        self.assertEqual(analysis.get_template_names(Template('{{ parent.a.b }}{{ c.d }}')), set(['a', 'c']))
+
+    def test_receivers(self):
+        EliminatedTag.on_render_data.connect(add_marker)
+        try:
+            self.assertIsNone(analysis.get_rendered_keys(EliminatedTag))
+        finally:
+            EliminatedTag.on_render_data.disconnect(add_marker)
+
+        self.assertIsNotNone(analysis.get_rendered_keys(EliminatedTag))
+
+    def test_compiled(self):
+        with self.settings(WRAPPER_TAG_COMPILED=True):
+            output = self.render('{% eliminated title="a" hidden="h" %}c{% end:eliminated %}')
+
+        self.assertEqual(output, '<div title=&quot;a&quot;>hc</div>')
+        self.assertEqual(elimination.rendered, ['title', 'forced'])
@@ -8,9 +8,11 @@ test_django-wrapper-tag
 Tests for `django-wrapper-tag` simple render.
 """
 from __future__ import absolute_import, print_function, unicode_literals
+from django.template import Context, Template, TemplateSyntaxError
 from django.test import TestCase
 
 import wrapper_tag
+from wrapper_tag import validators
 
 
 class TestArgument(TestCase):
@@ -21,4 +23,111 @@ class TestArgument(TestCase):
             title = wrapper_tag.Keyword()
 
 
+class TestArgumentPlan(TestCase):
 
+    def test_argument_plan(self):
+
+        class ExampleTag(wrapper_tag.Tag):
+            title = wrapper_tag.Keyword(validators=validators.string())
+            size = wrapper_tag.Keyword(choices=['sm', 'lg'], readonly=True, template="{{ size }}")
+
+            def clean_title(self, argument, value):
+                return value
+
+            def render_title(self, argument, data, context):
+                return data.get(argument.name)
+
+        title, size = ExampleTag.argument_plan
+
+        self.assertEqual(title.name, 'title')
+        self.assertEqual(title.rendered_key, 'title__rendered')
+        self.assertTrue(title.has_validators)
+        self.assertFalse(title.has_choices)
+        self.assertIsNotNone(title.tag_clean)
+        self.assertIsNotNone(title.render)
+
+        self.assertTrue(size.readonly)
+        self.assertTrue(size.has_choices)
+        self.assertTrue(size.has_template)
+        self.assertIsNone(size.tag_clean)
+        self.assertIsNone(size.clean)
+
+
+class TestArgumentBinding(TestCase):
+
+    def get_node(self, source):
+        t = Template('{% load binding %}' + source)
+        return [node for node in t.nodelist if isinstance(node, wrapper_tag.Tag)][0]
+
+    def test_bind(self):
+        node = self.get_node('{% binding "a" title=title size="xl" data_one=1 data_two=value %}{% end:binding %}')
+
+        self.assertEqual(node.unbound_args, [])
+        self.assertEqual(node.unbound_kwargs, {})
+
+        data = node.get_tag_data(Context({'title': 'hello', 'value': 'two'}))
+        self.assertEqual(data['first'], ['a'])
+        self.assertEqual(data['title'], 'hello')
+        self.assertEqual(data['size'], 'sm')
+        self.assertEqual(data['data'], {'data_one': 1, 'data_two': 'two'})
+
+    def test_bind_group_order(self):
+        node = self.get_node('{% binding "a" data_z=1 data_b=2 data_m=3 %}{% end:binding %}')
+
+        data = node.get_tag_data(Context())
+        self.assertEqual(list(data['data'].keys()), ['data_z', 'data_b', 'data_m'])
+
+    def test_bind_raw(self):
+        node = self.get_node('{% binding "a" title="title" __raw__title="raw" %}{% end:binding %}')
+
+        data = node.get_tag_data(Context())
+        self.assertEqual(data['title'], 'raw')
+
+    def test_unbound_kwargs(self):
+        node = self.get_node('{% binding "a" unknown="value" %}{% end:binding %}')
+
+        self.assertEqual(list(node.unbound_kwargs.keys()), ['unknown'])
+        self.assertRaises(TemplateSyntaxError, node.get_tag_data, Context())
+
+
+class TestArgumentDefault(TestCase):
+
+    def test_immutable_default(self):
+        value = 'a long default value'
+        argument = wrapper_tag.Keyword(default=value)
+        self.assertIs(argument.default, value)
+
+    def test_mutable_default(self):
+        argument = wrapper_tag.KeywordGroup('data_*', default={'data_a': 'b'})
+
+        first = argument.default
+        first['data_c'] = 'd'
+        self.assertEqual(argument.default, {'data_a': 'b'})
+
+        argument = wrapper_tag.Positional(default=[['nested']])
+        first = argument.default
+        first[0].append('item')
+        self.assertEqual(argument.default, [['nested']])
+
+    def test_callable_default(self):
+        argument = wrapper_tag.Keyword(default=lambda arg: [arg.name])
+        argument.name = 'title'
+        self.assertEqual(argument.default, ['title'])
+        self.assertIsNot(argument.default, argument.default)
+
+        argument.default = 'changed'
+        self.assertEqual(argument.default, 'changed')
+
+
+class TestArgumentRender(TestCase):
+
+    def test_render_frame(self):
+        context = Context({'value': 'x'})
+        dicts = len(context.dicts)
+
+        rendered = Template(
+            '{% load binding %}{% templated title=value name="n" label="l" %}{{ value }}{% end:templated %}'
+        ).render(context)
+
+        self.assertEqual(rendered, '<div title="x">-name=n title="x"|lx</div>')
+        self.assertEqual(len(context.dicts), dicts)
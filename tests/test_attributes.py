@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-wrapper-tag
+------------
+
+Tests for `django-wrapper-tag` html attributes.
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import six
+from django.template import Context, Template
+from django.test import TestCase
+from django.utils.safestring import mark_safe
+
+from tests.templatetags.attributes import ButtonTag
+from wrapper_tag import attributes, mixins, utils
+
+
+class TestAttributes(TestCase):
+
+    def render(self, template, **context):
+        return Template('{% load attributes %}' + template).render(Context(context))
+
+    def test_token_list(self):
+        tokens = attributes.TokenList('btn  active')
+        tokens.add('btn large')
+        tokens.add('first')
+
+        self.assertEqual(six.text_type(tokens), 'btn active large first')
+
+        tokens.discard('active first')
+        self.assertEqual(six.text_type(tokens), 'btn large')
+
+    def test_attributes(self):
+        attrs = mixins.tag_attributes_default(None)
+        attrs['class'].add('a b')
+        attrs['class'].add('a')
+        attrs['class'].update(['c'])
+        attrs['class'].discard('b')
+        attrs['id'].add('x')
+        attrs['data_toggle'] = 'modal'
+        attrs['title'] = None
+        attrs['tabindex'] = 0
+        attrs['name']
+
+        self.assertIsInstance(attrs['class'], utils.StringSet)
+        # keys are not renamed, empty values are skipped
+        self.assertIn(attributes.format_attributes(attrs), ('class="a c" id="x" data_toggle="modal"',
+                                                            'class="c a" id="x" data_toggle="modal"'))
+        self.assertEqual(attributes.format_attributes({}), '')
+
+    def test_ordered_attributes(self):
+        attrs = mixins.ordered_tag_attributes_default(None)
+        attrs['class'].add('b a')
+        attrs['class'].add('a c')
+        attrs['id'].add('x')
+
+        self.assertEqual(attributes.format_attributes(attrs), 'class="b a c" id="x"')
+
+    def test_data(self):
+        self.assertEqual(attributes.format_data({'toggle': 'modal', 'original_title': '', 'count': 0}),
+                         'toggle="modal" original-title="" count="0"')
+        self.assertEqual(attributes.format_data({}), '')
+
+    def test_escape(self):
+        self.assertEqual(attributes.format_attributes({'title': '"><script>'}), 'title="&quot;&gt;&lt;script&gt;"')
+        self.assertEqual(attributes.format_attributes({'title': mark_safe('&amp;')}), 'title="&amp;"')
+
+    def test_static(self):
+        static = attributes.StaticAttributes({'type': 'button', 'class': 'btn'})
+
+        self.assertEqual(attributes.format_attributes({}, static), 'type="button" class="btn"')
+        self.assertEqual(attributes.format_attributes({'class': attributes.TokenList('btn large'), 'id': 'x'}, static),
+                         'type="button" class="btn large" id="x"')
+        self.assertEqual(set(static.prefixes), {(), ('class',)})
+
+    def test_identity_css_class(self):
+        html = self.render('{% attributes id="main" css_class="a a" data_toggle="modal" data_empty="" %}x'
+                           '{% end:attributes %}')
+        self.assertEqual(html, '<div class="a" id="main" data-toggle="modal" data-empty="">x</div>')
+
+        html = self.render('{% ordered_attributes id="main" css_class="b a b" data_toggle="modal" %}x'
+                           '{% end:ordered_attributes %}')
+        self.assertEqual(html, '<div class="b a" id="main" data-toggle="modal">x</div>')
+
+    def test_static_attrs(self):
+        html = self.render('{% button id="ok" css_class="large btn" %}OK{% end:button %}')
+        self.assertEqual(html, '<button type="button" data-role="action" class="btn btn-default large" id="ok">'
+                               'OK</button>')
+
+        html = self.render('{% button id="ok" %}OK{% end:button %}')
+        self.assertEqual(html, '<button type="button" data-role="action" class="btn btn-default" id="ok">'
+                               'OK</button>')
+
+        self.assertIs(attributes.get_static_attributes(ButtonTag), attributes.get_static_attributes(ButtonTag))
+
+    def test_escape_values(self):
+        html = self.render('{% attributes id="main" css_class=value %}x{% end:attributes %}', value='"a')
+
+        self.assertEqual(html, '<div class="&quot;a" id="main" >x</div>')
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-wrapper-tag
+------------
+
+Tests for `django-wrapper-tag` bulk render.
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import six
+from django.template import TemplateSyntaxError, engines
+from django.test import TestCase
+
+from tests.templatetags.compiled import CompiledTag
+from tests.templatetags.folding import PureTag
+
+
+class TestRenderMany(TestCase):
+
+    def render(self, source, context=None):
+        return engines['django'].from_string(source).render(context or {})
+
+    def test_same_output(self):
+        rows = [{'title': 'a', 'css_class': 'x'}, {'title': 'b'}, {'title': 'a', 'css_class': 'x'}]
+        looped = self.render('{% load folding %}{% for row in rows %}{% pure title=row.title %}c{% end:pure %}'
+                             '{% endfor %}', {'rows': rows})
+
+        rendered = PureTag.render_many(rows, content='c')
+        self.assertEqual(''.join(six.text_type(rendered_tag) for rendered_tag in rendered), looped)
+        self.assertEqual(rendered[0]['arguments']['css_class'], 'x')
+
+    def test_pure_memoized(self):
+        cleaned = PureTag.cleaned
+        rendered = PureTag.render_many([{'title': 'a'}, {'title': 'b'}, {'title': 'a'}, {'title': 'a'}])
+
+        self.assertEqual(PureTag.cleaned, cleaned + 2)
+        self.assertEqual([six.text_type(rendered_tag) for rendered_tag in rendered],
+                         ['<div title=&quot;a&quot;></div>', '<div title=&quot;b&quot;></div>',
+                          '<div title=&quot;a&quot;></div>', '<div title=&quot;a&quot;></div>'])
+
+    def test_arguments(self):
+        rows = [
+            {'first': 1, 'title': 'one', 'size': 'lg', 'label': 'l', 'data_x': 'y'},
+            {'first': [2], 'size': 'xl'},
+        ]
+        rendered = CompiledTag.render_many(rows, content=lambda row: row.get('title', '-'), context={'missing': ''})
+
+        self.assertEqual(six.text_type(rendered[0]), '<div title="one" class="size-lg" data-first="[1]">'
+                                                     'L|legacy|fixed|on_data|data_x=y|one</div>')
+        self.assertEqual(six.text_type(rendered[1]), '<div title="untitled" class="size-sm" data-first="[2]">'
+                                                     '|legacy|fixed|on_data||-</div>')
+
+    def test_unhandled_kwargs(self):
+        with self.settings(TEMPLATE_DEBUG=True):
+            self.assertRaises(TemplateSyntaxError, PureTag.render_many, [{'title': 'a', 'unknown': 1}])
+
+    def test_for_each_tag(self):
+        rows = [{'title': 'a'}, {'title': '<b>'}]
+        rendered = self.render('{% load folding wrapper_tag_bulk %}'
+                               '{% for_each_tag pure rows as item %}{{ item.title }}{{ value }}{% end:for_each_tag %}',
+                               {'rows': rows, 'value': '!'})
+
+        self.assertEqual(rendered, '<div title=&quot;a&quot;>a!</div><div title=&quot;&lt;b&gt;&quot;>&lt;b&gt;!</div>')
+        self.assertEqual(self.render('{% load folding wrapper_tag_bulk %}{% for_each_tag pure rows %}x'
+                                     '{% end:for_each_tag %}', {'rows': rows}),
+                         '<div title=&quot;a&quot;>x</div><div title=&quot;&lt;b&gt;&quot;>x</div>')
+        self.assertEqual(self.render('{% load folding wrapper_tag_bulk %}{% for_each_tag pure rows %}'
+                                     '{% end:for_each_tag %}', {'rows': []}), '')
+
+    def test_for_each_tag_syntax(self):
+        self.assertRaises(TemplateSyntaxError, self.render,
+                          '{% load wrapper_tag_bulk %}{% for_each_tag missing rows %}{% end:for_each_tag %}')
+        self.assertRaises(TemplateSyntaxError, self.render,
+                          '{% load folding wrapper_tag_bulk %}{% for_each_tag pure %}{% end:for_each_tag %}')
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-wrapper-tag
+------------
+
+Tests for `django-wrapper-tag` fragment caching.
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import mock
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.template import Context, Template
+from django.test import TestCase
+
+from tests.templatetags.cached import CachedTag, DefaultCachedTag, SlowCachedTag
+
+
+class TestFragmentCache(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        CachedTag.options.cache.reset_stats()
+
+    def render(self, source, **context):
+        return Template('{% load cached %}' + source).render(Context(context))
+
+    def test_cache_hit(self):
+        source = '{% cached title=title %}{{ text }}{% end:cached %}'
+        rendered = CachedTag.rendered
+
+        first = self.render(source, title='hello', text='world')
+        second = self.render(source, title='hello', text='world')
+
+        self.assertEqual(first, '<div title="hello">world</div>')
+        self.assertEqual(first, second)
+        self.assertEqual(CachedTag.rendered, rendered + 1)
+        self.assertEqual(CachedTag.options.cache.hits, 1)
+        self.assertEqual(CachedTag.options.cache.misses, 1)
+
+    def test_cache_vary(self):
+        source = '{% cached title=title css_class=css_class %}{{ text }}{% end:cached %}'
+
+        self.render(source, title='hello', text='world')
+        self.assertEqual(self.render(source, title='other', text='world'), '<div title="other">world</div>')
+        self.assertEqual(self.render(source, title='hello', text='content'), '<div title="hello">content</div>')
+        self.render(source, title='hello', text='world', user='admin')
+
+        # css_class is not in vary_on
+        self.render(source, title='hello', text='world', css_class='btn')
+
+        self.assertEqual(CachedTag.options.cache.misses, 4)
+        self.assertEqual(CachedTag.options.cache.hits, 1)
+
+    def test_default_timeout(self):
+        with mock.patch.object(cache, 'set', wraps=cache.set) as cache_set:
+            self.assertEqual(self.render('{% default_cached %}a{% end:default_cached %}'), '<div>a</div>')
+            self.render('{% cached title="a" %}a{% end:cached %}')
+
+        # timeout of cache backend is used, fragments don't live forever
+        self.assertEqual([call[0][2] for call in cache_set.call_args_list], [DEFAULT_TIMEOUT, 60])
+        self.assertIs(DefaultCachedTag.options.cache.timeout, DEFAULT_TIMEOUT)
+
+    def test_as_var_not_cached(self):
+        source = '{% cached title="hello" as tmp %}world{% end:cached %}'
+        self.render(source)
+        self.render(source)
+
+        self.assertEqual(CachedTag.options.cache.hits + CachedTag.options.cache.misses, 0)
+
+
+class TestStaleWhileRevalidate(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        SlowCachedTag.options.cache.reset_stats()
+        SlowCachedTag.delay = 0
+
+    def test_stale_refreshed_once(self):
+        template = Template('{% load cached %}{% slow_cached title="hello" %}world{% end:slow_cached %}')
+
+        first = template.render(Context())
+        rendered = SlowCachedTag.rendered
+
+        # let fragment become stale
+        time.sleep(0.1)
+        SlowCachedTag.delay = 0.3
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: template.render(Context()), range(8)))
+
+        self.assertEqual(SlowCachedTag.rendered, rendered + 1)
+        self.assertEqual(SlowCachedTag.options.cache.refreshes, 1)
+        self.assertEqual(SlowCachedTag.options.cache.stale_hits, 7)
+        self.assertEqual(results.count(first), 7)
+
+    def test_fresh_hit(self):
+        template = Template('{% load cached %}{% slow_cached title="hello" %}world{% end:slow_cached %}')
+
+        self.assertEqual(template.render(Context()), template.render(Context()))
+        self.assertEqual(SlowCachedTag.options.cache.hits, 1)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-wrapper-tag
+------------
+
+Tests for `django-wrapper-tag` chunked content.
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import six
+from django.template import Context, Engine, Template, TemplateSyntaxError
+from django.utils.html import conditional_escape
+from django.utils.safestring import SafeData
+
+from django.test import TestCase
+
+import wrapper_tag
+from wrapper_tag.rendered import ChunkList, RenderedTag
+from wrapper_tag.simple_template import SimpleTemplate
+
+
+class TestChunkList(TestCase):
+
+    def test_join(self):
+        inner = ChunkList(['<b>', ChunkList(['x', ChunkList([])]), '</b>'])
+        chunks = ChunkList(['<div>', inner, '</div>'])
+
+        joined = chunks.join()
+        self.assertEqual(joined, '<div><b>x</b></div>')
+        self.assertIsInstance(joined, SafeData)
+        # chunks are not replaced by joined text
+        self.assertEqual(list(chunks), ['<div>', inner, '</div>'])
+        self.assertEqual(list(inner), ['<b>', ['x', []], '</b>'])
+        self.assertEqual(conditional_escape(chunks), '<div><b>x</b></div>')
+
+    def test_rendered_tag(self):
+        tag = RenderedTag(ChunkList(['a', ChunkList(['b'])]), 'tag')
+        self.assertIsInstance(tag.chunks, ChunkList)
+        self.assertEqual(six.text_type(tag), 'ab')
+        self.assertEqual(six.text_type(tag), 'ab')
+        self.assertEqual(tag.chunks, ['a', ['b']])
+
+
+class TestChunkedContent(TestCase):
+
+    def get_node(self, source):
+        t = Template(source)
+        return [node for node in t.nodelist if isinstance(node, wrapper_tag.Tag)][0]
+
+    def test_nested_chunks(self):
+        node = self.get_node('{% load binding %}{% binding "a" %}<p>{% binding "b" %}{{ value }}{% end:binding %}'
+                             '</p>{% end:binding %}')
+        context = Context({'value': '<x>'})
+
+        content = node.render_content(context)
+        self.assertIsInstance(content, ChunkList)
+
+        # rendered inner tag is kept as single chunk, not joined
+        self.assertIsInstance(content[1], ChunkList)
+        self.assertEqual(six.text_type(node.render(context)), '<div><p><div>&lt;x&gt;</div></p></div>')
+
+    def test_accepts_chunks(self):
+        template = SimpleTemplate.compile('<div>{{ content }}{{ parent.content }}</div>')
+        self.assertTrue(template.accepts_chunks('content'))
+        self.assertFalse(SimpleTemplate.compile('<div>{{ content.upper }}</div>').accepts_chunks('content'))
+
+    def test_not_chunked(self):
+        # template with tags/filters
+        node = self.get_node('{% load compiled %}{% compiled_block %}{{ value }}{% end:compiled_block %}')
+        self.assertIsInstance(node.render_content(Context({'value': 'x'})), six.text_type)
+
+        # tag assigned to variable
+        node = self.get_node('{% load binding %}{% binding "a" as var %}{{ value }}{% end:binding %}')
+        self.assertIsInstance(node.render_content(Context({'value': 'x'})), six.text_type)
+
+        # on_render_tag receivers see content
+        node = self.get_node('{% load events %}{% ex_rendered %}{{ value }}{% end:ex_rendered %}')
+        self.assertFalse(node.accepts_chunks())
+        self.assertIsInstance(node.render_content(Context({'value': 'x'})), six.text_type)
+
+        # custom render_tag
+        node = self.get_node('{% load cached %}{% cached title="t" %}{{ value }}{% end:cached %}')
+        self.assertFalse(node.accepts_chunks())
+
+    def test_nested_debug_info(self):
+        engine = Engine(debug=True, libraries={'binding': 'tests.templatetags.binding'})
+        t = engine.from_string('{% load binding %}{% binding "a" %}\n{% binding "b" unknown="x" %}{% end:binding %}'
+                               '{% end:binding %}')
+        with self.assertRaises(TemplateSyntaxError) as cm:
+            t.render(Context())
+
+        # exception is annotated by nested tag, not by outer one
+        self.assertEqual(cm.exception.template_debug['line'], 2)
+        self.assertIn('unknown', cm.exception.template_debug['during'])
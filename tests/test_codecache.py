@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-wrapper-tag
+------------
+
+Tests for `django-wrapper-tag` on-disk cache of generated code.
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import os
+import shutil
+import tempfile
+
+import mock
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+from django.utils.six import StringIO
+
+import wrapper_tag
+from wrapper_tag import codecache, codegen
+from tests.templatetags.compiled import CompiledTag
+
+
+class TestCodeCache(TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.settings_override = override_settings(WRAPPER_TAG_CODE_CACHE_DIR=self.cache_dir)
+        self.settings_override.enable()
+
+    def tearDown(self):
+        self.settings_override.disable()
+        shutil.rmtree(self.cache_dir)
+
+    def test_store_load(self):
+        self.assertIsNone(codecache.load(CompiledTag))
+
+        source, code = codegen.generate_code(CompiledTag)
+        path = codecache.store(CompiledTag, source, code)
+        self.assertTrue(os.path.isfile(path))
+
+        self.assertEqual(codecache.load(CompiledTag), (source, code))
+
+    def test_compile_tag_uses_cache(self):
+        compiled = codegen.compile_tag(CompiledTag)
+        self.assertIsNotNone(codecache.load(CompiledTag))
+
+        with mock.patch.object(codegen, 'generate_source') as generate_source:
+            self.assertEqual(codegen.compile_tag(CompiledTag).source, compiled.source)
+            self.assertFalse(generate_source.called)
+
+    def test_key(self):
+        key = codecache.get_key(CompiledTag)
+        self.assertIsNotNone(key)
+
+        with mock.patch.object(wrapper_tag, '__version__', '0.0.0'):
+            self.assertNotEqual(codecache.get_key(CompiledTag), key)
+
+        # changed module of tag class
+        with mock.patch.object(codecache, 'get_module_stamp', return_value='changed'):
+            self.assertNotEqual(codecache.get_key(CompiledTag), key)
+
+        # dynamically created class has no module file
+        tag_cls = type(str('DynamicTag'), (CompiledTag,), {'__module__': 'tests.dynamic'})
+        self.assertIsNone(codecache.get_key(tag_cls))
+
+    def test_corrupted_file(self):
+        source, code = codegen.generate_code(CompiledTag)
+        path = codecache.store(CompiledTag, source, code)
+        with open(path, 'wb') as f:
+            f.write(b'corrupted')
+
+        self.assertIsNone(codecache.load(CompiledTag))
+
+    def test_command(self):
+        self.assertRaises(CommandError, call_command, 'tagcache', 'verify', stdout=StringIO())
+
+        out = StringIO()
+        call_command('tagcache', 'build', stdout=out)
+        self.assertIn('compiled: built', out.getvalue())
+
+        out = StringIO()
+        call_command('tagcache', 'verify', stdout=out)
+        self.assertIn('compiled: ok', out.getvalue())
+
+        out = StringIO()
+        call_command('tagcache', 'clear', stdout=out)
+        self.assertFalse(os.listdir(self.cache_dir))
+
+    def test_build_removes_stale_files(self):
+        stale = os.path.join(self.cache_dir, 'tests.templatetags.compiled.CompiledTag-stale.marshal')
+        with open(stale, 'wb') as f:
+            f.write(b'stale')
+
+        call_command('tagcache', 'build', stdout=StringIO())
+
+        self.assertFalse(os.path.exists(stale))
+        self.assertIsNotNone(codecache.load(CompiledTag))
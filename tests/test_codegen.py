@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-wrapper-tag
+------------
+
+Tests for `django-wrapper-tag` compiled mode.
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+from django.core.cache import cache
+from django.template import Context, Template, TemplateSyntaxError
+from django.test import TestCase, override_settings
+
+from wrapper_tag import codegen, utils
+from wrapper_tag.tag import TagOptions
+from tests.templatetags.cached import CachedTag
+from tests.templatetags.compiled import CompiledTag, CompiledBlockTag
+
+PARITY_TEMPLATES = [
+    '{% load compiled %}{% compiled "a" title=title size="xl" label=label data_one=1 data_two=value %}'
+    '{{ value }}{% end:compiled %}',
+    '{% load compiled %}{% compiled "b" title=1 size="lg" legacy="given" __raw__label="raw" %}{% end:compiled %}',
+    '{% load compiled %}{% compiled "c" title=title %}{% compiled_block title=title %}{{ value }}'
+    '{% end:compiled_block %}{% end:compiled %}',
+    '{% load compiled %}{% compiled_block %}{% compiled "d" as var %}{% end:compiled %}{{ var }}'
+    '{% end:compiled_block %}',
+    '{% load binding %}{% templated title=value name="n" label="l" %}{{ value }}{% end:templated %}',
+    '{% load binding %}{% binding "a" title=title data_one=value %}{% end:binding %}',
+    '{% load folding %}{% pure title="t" %}{% pure_arguments title="t" %}{% end:pure_arguments %}{% end:pure %}',
+    '{% load events %}{% ex_rendered on_click="x" %}{{ value }}{% end:ex_rendered %}',
+    '{% load wrapper_tag_test_tags %}{% test title="value" name="n" %}{{ value }}{% end:test %}',
+]
+
+# template for every Meta option, compiled mode must render the same output as interpreted
+OPTION_TEMPLATES = {
+    'pure': '{% load folding %}{% pure title="t" css_class="c" %}{{ value }}{% end:pure %}',
+    'cache': '{% load cached %}{% cached title=title %}{{ value }}{% end:cached %}',
+    'parallel': '{% load parallel %}{% parallel %}{% slow title=title %}{{ value }}{% end:slow %}'
+                '{% slow title="b" %}{{ label }}{% end:slow %}{% end:parallel %}',
+    'deferred': '{% load events %}{% ex_deferred title=title as tmp %}{{ value }}{% end:ex_deferred %}'
+                '{{ tmp.arguments.title }}{{ tmp }}',
+    'lazy_render': '{% load lazy %}{% lazy link="a" icon="i" title=title %}{{ value }}{% end:lazy %}',
+    'used_arguments': '{% load elimination %}{% eliminated title=title hidden="h" forced="f" %}{{ value }}'
+                      '{% end:eliminated %}',
+    'as_var_only': '{% load compiled %}{% compiled_var "v" title=title as tmp %}{{ value }}{% end:compiled_var %}'
+                   '{{ tmp }}',
+}
+
+# options which don't change how tag is rendered
+NAMING_OPTIONS = ('_start_tag', 'end_tag', 'tag_name', 'aliases', 'class_prepared', '_template', '_template_name')
+
+
+class TestCompiledParity(TestCase):
+
+    def render(self, source, compiled):
+        context = {'title': 'Title <b>', 'label': 'label', 'value': 'value & more'}
+        cache.clear()
+        with override_settings(WRAPPER_TAG_COMPILED=compiled):
+            return Template(source).render(Context(context))
+
+    def test_parity(self):
+        for source in PARITY_TEMPLATES:
+            self.assertEqual(self.render(source, True), self.render(source, False), source)
+
+    def test_options_parity(self):
+        options = set(vars(TagOptions(None, tag_name='ExampleTag'))) - set(NAMING_OPTIONS)
+        self.assertEqual(options, set(OPTION_TEMPLATES))
+
+        for option, source in OPTION_TEMPLATES.items():
+            self.assertEqual(self.render(source, True), self.render(source, False), option)
+
+    def test_compiled_output(self):
+        rendered = self.render(PARITY_TEMPLATES[0], True)
+        self.assertEqual(rendered, '<div title="Title &lt;b&gt;" class="size-sm" data-first="[&#39;a&#39;]">'
+                                   'LABEL|legacy|fixed|on_data|data_one=1 data_two=value &amp; more|'
+                                   'value &amp; more</div>')
+
+    def test_unhandled_kwargs(self):
+        for compiled in (True, False):
+            with override_settings(WRAPPER_TAG_COMPILED=compiled):
+                t = Template('{% load binding %}{% binding "a" unknown="value" %}{% end:binding %}')
+                self.assertRaises(TemplateSyntaxError, t.render, Context())
+
+
+class TestCodegen(TestCase):
+
+    def test_generated_source(self):
+        source = codegen.compile_tag(CompiledTag).source
+
+        self.assertIn('def compute_tag_data(tag, context, data):', source)
+        self.assertIn('def render_tag(tag, tag_kwargs, context):', source)
+        self.assertNotIn('getattr', source)
+        self.assertNotIn('isinstance', source)
+        self.assertNotIn('for entry', source)
+
+    def test_fallback(self):
+        # template with tags is not compiled
+        compiled = codegen.compile_tag(CompiledBlockTag)
+        self.assertIsNotNone(compiled.compute_tag_data)
+        self.assertIsNone(compiled.render_tag)
+
+        # custom render_tag is not compiled
+        self.assertIsNone(codegen.compile_tag(CachedTag).render_tag)
+
+    def test_get_compiled(self):
+        codegen.invalidate_compiled(CompiledTag)
+        compiled = codegen.get_compiled(CompiledTag)
+        self.assertIs(codegen.get_compiled(CompiledTag), compiled)
+
+        codegen.invalidate_compiled(CompiledTag)
+        self.assertIsNot(codegen.get_compiled(CompiledTag), compiled)
+
+    def test_setting(self):
+        with override_settings(WRAPPER_TAG_COMPILED=True):
+            self.assertTrue(utils.is_compiled_mode())
+        self.assertFalse(utils.is_compiled_mode())
@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-wrapper-tag
+------------
+
+Tests for `django-wrapper-tag` constant folding.
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+from django.template import Context, Template
+from django.test import TestCase
+
+import wrapper_tag
+from tests.templatetags.folding import PureTag
+
+
+class TestConstantFolding(TestCase):
+
+    def get_node(self, source):
+        t = Template('{% load binding folding %}' + source)
+        return [node for node in t.nodelist if isinstance(node, wrapper_tag.Tag)][0]
+
+    def test_literal_arguments(self):
+        node = self.get_node('{% pure title="hello" css_class="btn" %}{% end:pure %}')
+        self.assertTrue(node.foldable)
+
+        cleaned = PureTag.cleaned
+        first = node.get_tag_data(Context())
+        second = node.get_tag_data(Context())
+
+        self.assertEqual(PureTag.cleaned, cleaned + 1)
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(first['title__rendered'], ' title="hello"')
+
+    def test_variable_arguments(self):
+        node = self.get_node('{% pure title=title %}{% end:pure %}')
+        self.assertFalse(node.foldable)
+
+        node = self.get_node('{% pure title="hello"|upper %}{% end:pure %}')
+        self.assertFalse(node.foldable)
+
+    def test_pure_arguments(self):
+        node = self.get_node('{% pure_arguments title="a" name="b" %}{% end:pure_arguments %}')
+        self.assertTrue(node.foldable)
+
+    def test_mutable_values(self):
+        node = self.get_node('{% pure_attributes css_class="btn" data_a="b" %}{% end:pure_attributes %}')
+        self.assertTrue(node.foldable)
+
+        first = node.get_tag_data(Context())
+        first['attrs']['class'].add('active')
+        first['data']['data_c'] = 'd'
+
+        second = node.get_tag_data(Context())
+        self.assertEqual(list(second['attrs']['class']), ['btn'])
+        self.assertEqual(second['data'], {'data_a': 'b'})
+
+    def test_template_reads_context(self):
+        node = self.get_node('{% pure_templated title="a" greeting="hi" %}{% end:pure_templated %}')
+        self.assertFalse(node.foldable)
+
+        output = Template('{% load folding %}{% pure_templated title="a" greeting="hi" %}{% end:pure_templated %}')
+        self.assertEqual(output.render(Context({'user': 'joe'})), '<div>ahi joe</div>')
+        self.assertEqual(output.render(Context({'user': 'ann'})), '<div>ahi ann</div>')
+
+    def test_no_arguments(self):
+        node = self.get_node('{% no_arguments %}{% end:no_arguments %}')
+        self.assertFalse(node.foldable)
+
+        # on_data receiver reads context, every render has own data
+        output = Template('{% load folding %}{% no_arguments %}{% end:no_arguments %}')
+        self.assertEqual(output.render(Context({'x': 'A'})), '<i>A</i>')
+        self.assertEqual(output.render(Context({'x': 'B'})), '<i>B</i>')
+
+    def test_impure_tag(self):
+        node = self.get_node('{% binding "a" title="a" %}{% end:binding %}')
+        self.assertFalse(node.foldable)
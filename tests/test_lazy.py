@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-wrapper-tag
+------------
+
+Tests for `django-wrapper-tag` lazy render of arguments.
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+from django.template import Context, Template, engines
+from django.test import TestCase
+
+import wrapper_tag
+from wrapper_tag import utils
+from tests.templatetags import lazy
+
+SOURCE = '{% lazy link="/a" icon="x" title="t" %}c{% end:lazy %}'
+
+
+class TestLazyRender(TestCase):
+
+    def setUp(self):
+        lazy.rendered[:] = []
+
+    def render(self, source, context=None):
+        return engines['django'].from_string('{% load lazy %}' + source).render(context or {})
+
+    def test_not_accessed(self):
+        output = self.render(SOURCE)
+
+        self.assertEqual(output, '<b><i class="x"></i>t</b>c')
+        self.assertEqual(lazy.rendered, ['title', 'icon'])
+
+    def test_rendered_once(self):
+        output = self.render(SOURCE, {'show': True})
+
+        self.assertEqual(output, '<a href="/a"> href="/a"</a><b><i class="x"></i>t</b>c')
+        self.assertEqual(lazy.rendered, ['link', 'title', 'icon'])
+
+    def test_same_as_eager(self):
+        for show in (True, False):
+            self.assertEqual(self.render(SOURCE, {'show': show}),
+                             self.render(SOURCE.replace('lazy', 'eager'), {'show': show}))
+
+    def test_missing_value(self):
+        output = self.render('{% lazy title="t" %}{% end:lazy %}', {'show': True})
+        self.assertEqual(output, '<a></a><b>t</b>')
+
+    def test_pending_closed(self):
+        node = [node for node in Template('{% load lazy %}' + SOURCE).nodelist if isinstance(node, wrapper_tag.Tag)][0]
+
+        rendered_tag = node.render_to_tag(Context())
+        self.assertIsInstance(rendered_tag['arguments'], utils.LazyData)
+        self.assertEqual(rendered_tag['arguments'].pending, {})
+        self.assertNotIn('link__rendered', rendered_tag['arguments'])
+
+    def test_as_var(self):
+        output = self.render('{% lazy link="/a" as var %}{% end:lazy %}{{ var.arguments.link__rendered }}')
+
+        self.assertEqual(output, ' href="/a"')
+        self.assertEqual(lazy.rendered, ['link', 'icon', 'title'])
+
+    def test_lazy_data(self):
+        data = utils.LazyData(a=1)
+        data.defer('b', lambda: 2)
+        data.defer('c', lambda: None)
+
+        self.assertIn('b', data)
+        self.assertNotIn('c', data)
+        self.assertEqual(data.get('b'), 2)
+        self.assertIsNone(data.get('c'))
+        self.assertEqual(data, {'a': 1, 'b': 2})
+
+    def test_lazy_data_iteration(self):
+        data = utils.LazyData(a=1)
+        data.defer('b', lambda: 2)
+        data.defer('c', lambda: utils.NULL)
+        data.defer('a', lambda: 3)
+
+        # same as eager data, value set directly is kept
+        self.assertEqual(sorted(data.keys()), ['a', 'b'])
+        self.assertEqual(dict(**data), {'a': 1, 'b': 2})
+        self.assertEqual(data.pending, {})
+
+    def test_outer_context(self):
+        # missing value falls through to outer context as in eager mode
+        context = {'show': True, 'link__rendered': ' outer'}
+        output = self.render('{% lazy title="t" %}{% end:lazy %}', context)
+
+        self.assertEqual(output, '<a outer> outer</a><b>t</b>')
+        self.assertEqual(output, self.render('{% eager title="t" %}{% end:eager %}', context))
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-wrapper-tag
+------------
+
+Tests for `django-wrapper-tag` batched loaders.
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import threading
+import time
+
+import mock
+from django.contrib.auth.models import User
+from django.template import engines
+from django.test import TestCase
+
+from wrapper_tag import loaders
+from tests.templatetags.cached import CachedTag
+from tests.templatetags.loading import UserTag, user_loader
+
+TEMPLATE = ('{% load loading %}{% for pk in pks %}{% user user=pk friend="user0" %}{% if forloop.first %}'
+            '{% user user=pk %}{% end:user %}{% endif %}{% end:user %}{% endfor %}')
+
+
+class TestBatchLoader(TestCase):
+
+    def setUp(self):
+        self.users = [User.objects.create(username='user{}'.format(i)) for i in range(5)]
+        self.pks = [user.pk for user in self.users]
+        self.template = engines['django'].from_string(TEMPLATE)
+
+    def test_render_batched(self):
+        with self.assertNumQueries(11):
+            expected = self.template.render({'pks': self.pks})
+
+        # one query per loader
+        with self.assertNumQueries(2):
+            rendered = loaders.render_batched(self.template, {'pks': self.pks})
+
+        self.assertEqual(rendered, expected)
+        self.assertIn('<span>user0 &amp; user0<span>user0</span></span><span>user1 &amp; user0</span>', rendered)
+
+    def test_collect_nodes(self):
+        calls = []
+        template = engines['django'].from_string('{% load loading %}{% for pk in pks %}{% user user=pk %}'
+                                                 '{{ spy }}{% end:user %}{% endfor %}')
+
+        with self.assertNumQueries(1):
+            loaders.render_batched(template, {'pks': self.pks, 'spy': lambda: calls.append(1)})
+
+        # nodes which are not wrapper tags are executed only in render phase
+        self.assertEqual(len(calls), len(self.pks))
+
+    def test_collect_as_var(self):
+        template = engines['django'].from_string(
+            '{% load loading %}{% user user=pks.0 as tmp %}{% end:user %}'
+            '{% if tmp.tag %}{% user user=pks.1 %}{% end:user %}{% endif %}{{ tmp }}'
+        )
+
+        with self.assertNumQueries(1):
+            rendered = loaders.render_batched(template, {'pks': self.pks})
+        self.assertEqual(rendered, '<span>user1</span><span>user0</span>')
+
+    def test_collect_cached(self):
+        template = engines['django'].from_string('{% load cached %}{% cached title="t" %}{% end:cached %}')
+
+        with mock.patch.object(CachedTag, 'clean_tag_data') as clean_tag_data:
+            with loaders.Batch() as batch:
+                batch.collecting = True
+                loaders.collect_template(template)
+            self.assertFalse(clean_tag_data.called)
+
+    def test_collect_clean_only(self):
+        rendered = UserTag.rendered
+        loaders.render_batched(self.template, {'pks': self.pks})
+
+        # render hooks run in render phase only
+        self.assertEqual(UserTag.rendered, rendered + len(self.pks) + 1)
+
+    def test_collect_extends_include(self):
+        base = engines['django'].from_string('<main>{% block body %}{% endblock %}</main>')
+        inner = engines['django'].from_string('{% load loading %}{% user user=pks.0 %}{% end:user %}')
+        template = engines['django'].from_string(
+            '{% extends base %}{% load loading %}{% block body %}{% for pk in pks %}{% user user=pk %}{% end:user %}'
+            '{% endfor %}{% include inner %}{% include inner with pks=other only %}{% endblock %}'
+        )
+        context = {'pks': self.pks[:2], 'other': self.pks[2:], 'base': base, 'inner': inner}
+
+        with self.assertNumQueries(1):
+            rendered = loaders.render_batched(template, context)
+
+        self.assertEqual(rendered, '<main><span>user0</span><span>user1</span><span>user0</span>'
+                                   '<span>user2</span></main>')
+
+    def test_missing_key(self):
+        rendered = loaders.render_batched(self.template, {'pks': [0]})
+        self.assertIn('unknown', rendered)
+
+    def test_not_collected_key(self):
+        with loaders.Batch() as batch:
+            self.assertIs(loaders.get_batch(), batch)
+            with self.assertNumQueries(1):
+                self.assertEqual(user_loader.load(str(self.pks[0])), self.users[0])
+                self.assertEqual(user_loader.load(self.pks[0]), self.users[0])
+
+        self.assertIsNone(loaders.get_batch())
+
+    def test_threads(self):
+        calls = []
+
+        class SlowLoader(loaders.BatchLoader):
+            def load_many(self, keys):
+                calls.append(keys)
+                time.sleep(0.01)
+                return dict((key, key * 2) for key in keys)
+
+        loader = SlowLoader()
+        results = []
+        with loaders.Batch() as batch:
+            def load():
+                with batch:
+                    results.append(loader.load(1))
+
+            threads = [threading.Thread(target=load) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        # key is fetched once, shared results are not overwritten by concurrent fetches
+        self.assertEqual(calls, [[1]])
+        self.assertEqual(results, [2] * 4)
+
+    def test_load_without_batch(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(user_loader.load(self.pks[1]), self.users[1])
+        self.assertIsNone(user_loader.load(None))
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-wrapper-tag
+------------
+
+Tests for `django-wrapper-tag` parallel render.
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import threading
+
+import mock
+from django.template import engines
+from django.test import TestCase
+from django.utils import translation
+
+from wrapper_tag import parallel
+from tests.templatetags import parallel as parallel_tags
+
+SIBLINGS = ('{% load parallel %}{% parallel %}'
+            '{% slow title="a" %}{% slow title="a1" %}{% end:slow %}{% end:slow %}'
+            '<hr>{{ value }}{% slow title="b" %}{{ value }}{% end:slow %}{% slow title="c" %}{% end:slow %}'
+            '{% end:parallel %}')
+
+
+class TestParallelRender(TestCase):
+
+    def setUp(self):
+        parallel_tags.threads[:] = []
+
+    def render(self, source, context=None):
+        return engines['django'].from_string(source).render(context or {})
+
+    def test_same_output(self):
+        rendered = self.render(SIBLINGS, {'value': '<v>'})
+        sequential = self.render(SIBLINGS.replace('{% parallel %}', '').replace('{% end:parallel %}', ''),
+                                 {'value': '<v>'})
+
+        self.assertEqual(rendered, '<section>{}</section>'.format(sequential))
+        self.assertEqual(rendered, '<section><i lang="en-us">a<i lang="en-us">a1</i></i><hr>&lt;v&gt;'
+                                   '<i lang="en-us">b&lt;v&gt;</i><i lang="en-us">c</i></section>')
+
+    def test_worker_threads(self):
+        self.render(SIBLINGS, {'value': 'v'})
+
+        self.assertEqual(len(parallel_tags.threads), 4)
+        self.assertNotIn(threading.current_thread().name, parallel_tags.threads)
+        self.assertGreater(len(set(parallel_tags.threads)), 1)
+
+    def test_language(self):
+        with translation.override('de'):
+            rendered = self.render(SIBLINGS, {'value': 'v'})
+
+        self.assertEqual(rendered.count('lang="de"'), 4)
+
+    def test_isolated_context(self):
+        rendered = self.render('{% load parallel %}{% parallel %}'
+                               '{% slow title="a" %}{% slow title="x" as var %}{% end:slow %}{{ var }}{% end:slow %}'
+                               '{% slow title="b" %}{{ var }}{% end:slow %}'
+                               '{% end:parallel %}')
+
+        self.assertEqual(rendered, '<section><i lang="en-us">a<i lang="en-us">x</i></i>'
+                                   '<i lang="en-us">b</i></section>')
+
+    def test_as_var_barrier(self):
+        rendered = self.render('{% load parallel %}{% parallel %}'
+                               '{% slow title="a" as var %}{% end:slow %}{% slow title="b" %}{{ var }}{% end:slow %}'
+                               '{% slow title="c" %}{{ var }}{% end:slow %}'
+                               '{% end:parallel %}')
+
+        self.assertEqual(rendered, '<section><i lang="en-us">b<i lang="en-us">a</i></i>'
+                                   '<i lang="en-us">c<i lang="en-us">a</i></i></section>')
+
+    def test_nested_parallel(self):
+        source = '{% load parallel %}{% parallel %}' + SIBLINGS.replace('{% load parallel %}', '') * 2 + \
+                 '{% end:parallel %}'
+
+        rendered = self.render(source, {'value': 'v'})
+        self.assertEqual(rendered.count('<section>'), 3)
+        self.assertEqual(len(parallel_tags.threads), 8)
+
+    def test_errors(self):
+        source = ('{% load parallel %}{% parallel %}{% slow title="fail1" %}{% end:slow %}{% slow title="ok" %}'
+                  '{% end:slow %}{% slow title="fail2" %}{% end:slow %}{% end:parallel %}')
+
+        # first error is raised, others are logged
+        with self.assertLogs('wrapper_tag.parallel', 'ERROR') as logs:
+            with self.assertRaisesMessage(ValueError, 'fail1'):
+                self.render(source)
+
+        self.assertEqual(len(logs.records), 1)
+        self.assertIn('fail2', logs.output[0])
+
+    def test_connections_closed(self):
+        with mock.patch.object(parallel, 'close_old_connections') as close_old_connections:
+            with mock.patch.object(parallel.connections, 'close_all') as close_all:
+                self.render(SIBLINGS, {'value': 'v'})
+
+        # broken connections before and all connections of worker thread after every task
+        self.assertEqual(close_old_connections.call_count, 3)
+        self.assertEqual(close_all.call_count, 3)
+
+    def test_max_workers(self):
+        self.assertEqual(parallel.get_max_workers(2), 2)
+        self.assertEqual(parallel.get_max_workers(True), parallel.DEFAULT_MAX_WORKERS)
+
+        with self.settings(WRAPPER_TAG_PARALLEL_WORKERS=8):
+            self.assertEqual(parallel.get_max_workers(True), 8)
+            self.assertIs(parallel.get_executor(8), parallel.get_executor(8))
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-wrapper-tag
+------------
+
+Tests for `django-wrapper-tag` RenderedTag.
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import pickle
+
+import six
+from django.template import Context, Template
+from django.test import TestCase
+from django.utils.safestring import mark_safe
+
+from wrapper_tag.rendered import RenderedTag
+
+
+class TestRenderedTag(TestCase):
+
+    def test_bool(self):
+        self.assertTrue(RenderedTag(mark_safe('<b>x</b>'), 'tag'))
+        self.assertFalse(RenderedTag(mark_safe(' \n'), 'tag', arguments={'title': 't'}))
+        self.assertFalse(isinstance(RenderedTag('', 'tag'), dict))
+
+    def test_slots(self):
+        rendered_tag = RenderedTag(mark_safe('<b>x</b>'), 'tag', arguments={'title': 't'})
+
+        self.assertFalse(hasattr(rendered_tag, '__dict__'))
+        self.assertIsNone(rendered_tag._data)
+        self.assertEqual(six.text_type(rendered_tag), '<b>x</b>')
+        self.assertEqual(rendered_tag.tag, 'tag')
+
+    def test_mapping(self):
+        rendered_tag = RenderedTag('x', 'tag', arguments={'title': 't'})
+
+        self.assertEqual(rendered_tag['arguments'], {'title': 't'})
+        self.assertNotIn('events', rendered_tag)
+        self.assertIsNone(rendered_tag.get('events'))
+        self.assertRaises(KeyError, lambda: rendered_tag['events'])
+        self.assertRaises(AttributeError, lambda: rendered_tag.events)
+
+        rendered_tag.setdefault('events', {})['on_click'] = 'click()'
+        rendered_tag['methods'] = {}
+
+        self.assertEqual(rendered_tag.events, {'on_click': 'click()'})
+        self.assertEqual(sorted(rendered_tag.keys()), ['arguments', 'events', 'methods'])
+        self.assertEqual(len(rendered_tag), 3)
+
+        del rendered_tag['methods']
+        self.assertNotIn('methods', rendered_tag)
+
+    def test_template_access(self):
+        rendered_tag = RenderedTag(mark_safe('<b>x</b>'), 'tag', arguments={'title': 't'}, events={'on_click': 'c'})
+
+        rendered = Template('{{ tmp }}|{{ tmp.arguments.title }}|{{ tmp.events.on_click }}|{{ tmp.tag }}|'
+                            '{{ tmp.missing }}').render(Context({'tmp': rendered_tag}))
+        self.assertEqual(rendered, '<b>x</b>|t|c|tag|')
+
+    def test_pickle(self):
+        rendered_tag = pickle.loads(pickle.dumps(RenderedTag('x', 'tag', arguments={'title': 't'}, events={})))
+
+        self.assertEqual(six.text_type(rendered_tag), 'x')
+        self.assertEqual(rendered_tag['arguments'], {'title': 't'})
+        self.assertEqual(rendered_tag['events'], {})
@@ -12,6 +12,8 @@ from __future__ import absolute_import, print_function, unicode_literals
 from django.template import Context, Template
 from django.test import TestCase
 
+from tests.templatetags.events import DeferredRenderedTag
+
 
 class TestRenderedCallback(TestCase):
 
@@ -25,3 +27,49 @@ class TestRenderedCallback(TestCase):
         """
         rendered = Template(template).render(Context())
         self.assertEquals(rendered.strip(), 'asdf')
+
+
+class TestDeferredRender(TestCase):
+
+    def setUp(self):
+        DeferredRenderedTag.rendered = 0
+
+    def render(self, source, context=None):
+        return Template('{% load events %}' + source).render(Context(context or {}))
+
+    def test_events_without_render(self):
+        rendered = self.render('{% ex_deferred on_click="asdf" title="t" as tmp %}hello{% end:ex_deferred %}'
+                               '{{ tmp.events.on_click }}|{{ tmp.arguments.title }}')
+
+        self.assertEqual(rendered, 'asdf|t')
+        self.assertEqual(DeferredRenderedTag.rendered, 0)
+
+    def test_rendered_once(self):
+        rendered = self.render('{% ex_deferred title="t" as tmp %}{{ value }}{% end:ex_deferred %}{{ tmp }}{{ tmp }}',
+                               {'value': '<x>'})
+
+        self.assertEqual(rendered, '<div title="t">&lt;x&gt;</div>' * 2)
+        self.assertEqual(DeferredRenderedTag.rendered, 1)
+
+    def test_context_snapshot(self):
+        rendered = self.render('{% ex_deferred title=value as tmp %}{{ value }}{% end:ex_deferred %}'
+                               '{% with value="b" %}{{ tmp }}{% endwith %}', {'value': 'a'})
+
+        self.assertEqual(rendered, '<div title="a">a</div>')
+
+    def test_repr(self):
+        context = Context()
+        self.assertEqual(Template('{% load events %}{% ex_deferred title="t" as tmp %}c{% end:ex_deferred %}')
+                         .render(context), '')
+
+        self.assertEqual(repr(context['tmp']), '<RenderedTag: ex_deferred (deferred)>')
+        self.assertEqual(DeferredRenderedTag.rendered, 0)
+
+        self.assertEqual(str(context['tmp']), '<div title="t">c</div>')
+        self.assertEqual(repr(context['tmp']), "<RenderedTag: ex_deferred '<div title=\"t\">c</div>'>")
+
+    def test_not_deferred_without_var(self):
+        rendered = self.render('{% ex_deferred title="t" %}c{% end:ex_deferred %}')
+
+        self.assertEqual(rendered, '<div title="t">c</div>')
+        self.assertEqual(DeferredRenderedTag.rendered, 1)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-wrapper-tag
+------------
+
+Tests for `django-wrapper-tag` signals.
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+from logging import getLogger
+
+from django.test import TestCase
+
+import wrapper_tag
+from wrapper_tag import signals
+
+logger = getLogger('wrapper_tag.tests')
+
+
+class TestTagSignal(TestCase):
+
+    def test_no_receivers(self):
+        signal = signals.TagSignal(providing_args=['data'])
+        signal.dispatch(self, logger, 'test', data={})
+        self.assertEqual(signal.get_receivers(self), ())
+
+    def test_connect_disconnect(self):
+        signal = signals.TagSignal(providing_args=['data'])
+        calls = []
+
+        def receiver(sender, data, **kwargs):
+            calls.append(data)
+
+        signal.dispatch(self, logger, 'test', data=1)
+        signal.connect(receiver)
+        signal.dispatch(self, logger, 'test', data=2)
+        signal.disconnect(receiver)
+        signal.dispatch(self, logger, 'test', data=3)
+
+        self.assertEqual(calls, [2])
+
+    def test_version(self):
+        signal = signals.TagSignal(providing_args=['data'])
+
+        def receiver(sender, data, **kwargs):
+            pass
+
+        version = signal.version
+        signal.connect(receiver)
+        self.assertNotEqual(signal.version, version)
+
+        version = signal.version
+        signal.disconnect(receiver)
+        self.assertNotEqual(signal.version, version)
+
+    def test_robust(self):
+        signal = signals.TagSignal(providing_args=['data'])
+        calls = []
+
+        def failing(sender, data, **kwargs):
+            raise ValueError('failed')
+
+        def receiver(sender, data, **kwargs):
+            calls.append(data)
+
+        signal.connect(failing)
+        signal.connect(receiver)
+
+        with self.assertLogs(logger, 'ERROR'):
+            signal.dispatch(self, logger, 'test', data=1)
+
+        self.assertEqual(calls, [1])
+
+    def test_weak_receiver(self):
+        signal = signals.TagSignal(providing_args=['data'])
+
+        def receiver(sender, data, **kwargs):
+            pass
+
+        signal.connect(receiver)
+        self.assertEqual(len(signal.get_receivers(self)), 1)
+
+        del receiver
+        self.assertEqual(signal.get_receivers(self), ())
+
+    def test_tag_signals(self):
+
+        class SignalTag(wrapper_tag.Tag):
+            on_click = wrapper_tag.Event()
+            open = wrapper_tag.Method()
+
+        self.assertEqual(len(SignalTag.on_render_data.get_receivers(SignalTag)), 1)
+        self.assertEqual(len(SignalTag.on_render_tag.get_receivers(SignalTag)), 1)
+        self.assertEqual(SignalTag.on_data.get_receivers(SignalTag), ())
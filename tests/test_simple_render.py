@@ -46,3 +46,27 @@ class TestArgumentClean(TestCase):
 
         self.assertTrue('render_title' in dir(TestTag))
         self.assertTrue(callable(TestTag.render_title))
+
+
+class TestContextRender(TestCase):
+
+    def test_nested_render(self):
+        t = template.Template('{% load wrapper_tag_test_tags %}'
+                              '{% test title="outer" %}{% test title="inner" %}{{ text }}{% end:test %}{% end:test %}'
+                              '{{ title }}')
+        rendered = t.render(template.Context({'text': 'hello'}))
+        self.assertEqual(rendered, '<test title="outer"><test title="inner">hello</test></test>')
+
+    def test_context_untouched(self):
+        context = template.Context({'text': 'hello'})
+        dicts = len(context.dicts)
+
+        t = template.Template('{% load wrapper_tag_test_tags %}{% test title="outer" %}{{ text }}{% end:test %}')
+        t.render(context)
+
+        self.assertEqual(len(context.dicts), dicts)
+        self.assertNotIn('title', context)
+
+    def test_extra_content(self):
+        t = template.Template('{% load rendering %}{% extra_content title="a" %}b{% end:extra_content %}')
+        self.assertEqual(t.render(template.Context({'text': 'hello'})), '<div>b[a|hello]\n</div>')
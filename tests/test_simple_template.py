@@ -0,0 +1,65 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-wrapper-tag
+------------
+
+Tests for `django-wrapper-tag` simple template.
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+from django.template import Context, Engine, Template
+from django.test import TestCase
+from django.utils.safestring import mark_safe
+
+from wrapper_tag import utils
+from wrapper_tag.simple_template import SimpleTemplate
+
+
+class TestSimpleTemplate(TestCase):
+
+    def test_compile(self):
+        self.assertIsNotNone(SimpleTemplate.compile('<div{{ title__rendered }}>{{ content }}</div>'))
+        self.assertIsNotNone(SimpleTemplate.compile('{{ parent.title }} {{ 1 }}'))
+        self.assertIsNotNone(SimpleTemplate.compile('no variables'))
+
+        self.assertIsNone(SimpleTemplate.compile('{{ content|safe }}'))
+        self.assertIsNone(SimpleTemplate.compile('{% if content %}{{ content }}{% endif %}'))
+        self.assertIsNone(SimpleTemplate.compile('{# comment #}'))
+        self.assertIsNone(SimpleTemplate.compile('{{ "string" }}'))
+        self.assertIsNone(SimpleTemplate.compile('{{ _private }}'))
+
+    def test_variables(self):
+        template = SimpleTemplate.compile('<div{{ title__rendered }}>{{ content }}</div>')
+        self.assertEqual(template.variables, ['title__rendered', 'content'])
+
+    def test_render_parity(self):
+        sources = [
+            '<div{{ title }}>{{ content }}</div>',
+            '{{ obj.name }}-{{ missing }}-{{ items.0 }}-{{ number }}',
+        ]
+        contexts = [
+            {'title': ' title="a"', 'content': '<b>&</b>'},
+            {'title': mark_safe(' title="a"'), 'content': mark_safe('<b>&</b>')},
+            {'obj': {'name': '<x>'}, 'items': ['first'], 'number': 1.5},
+        ]
+
+        for source in sources:
+            for data in contexts:
+                for autoescape in (True, False):
+                    expected = Template(source).render(Context(data, autoescape=autoescape))
+                    rendered = SimpleTemplate.compile(source).render(Context(data, autoescape=autoescape))
+                    self.assertEqual(rendered, expected)
+
+    def test_string_if_invalid(self):
+        source = '<div>{{ missing }}</div>'
+        for string_if_invalid in ('<invalid>', '<%s>'):
+            engine = Engine(string_if_invalid=string_if_invalid)
+            expected = Template(source, engine=engine).render(Context())
+            rendered = SimpleTemplate.compile(source, engine=engine).render(Context())
+            self.assertEqual(rendered, expected)
+
+    def test_template_mixin(self):
+        self.assertIsInstance(utils.TemplateMixin(template='<div>{{ content }}</div>').template, SimpleTemplate)
+        self.assertIsInstance(utils.TemplateMixin(template='{% if a %}{% endif %}').template, Template)
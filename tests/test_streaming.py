@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+test_django-wrapper-tag
+------------
+
+Tests for `django-wrapper-tag` streaming render.
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import six
+from django.http import StreamingHttpResponse
+from django.template import Context, Template, engines
+from django.test import TestCase
+
+import wrapper_tag
+from wrapper_tag import streaming
+from wrapper_tag.simple_template import SimpleTemplate
+
+NESTED = ('{% load binding %}{% templated title=value name="n" %}<p>{{ value }}</p>'
+          '{% templated title="inner" %}{% if value %}{{ value }}{% endif %}{% end:templated %}'
+          '{% end:templated %}')
+
+
+class TestSimpleTemplateSplit(TestCase):
+
+    def test_split(self):
+        template = SimpleTemplate.compile('<div{{ title }}>{{ content }}</div>')
+        prefix, suffix = template.split('content')
+        self.assertEqual(prefix.render(Context({'title': ' a'})), '<div a>')
+        self.assertEqual(suffix.render(Context()), '</div>')
+        self.assertIs(template.split('content'), template.split('content'))
+
+        self.assertIsNone(SimpleTemplate.compile('{{ content }}{{ content }}').split('content'))
+        self.assertIsNone(SimpleTemplate.compile('<div></div>').split('content'))
+
+
+class TestRenderIter(TestCase):
+
+    def get_node(self, source):
+        t = Template(source)
+        return [node for node in t.nodelist if isinstance(node, wrapper_tag.Tag)][0]
+
+    def test_render_iter(self):
+        node = self.get_node(NESTED)
+        context = Context({'value': 'x & y'})
+
+        chunks = list(node.render_iter(context))
+        self.assertGreater(len(chunks), 3)
+        self.assertTrue(chunks[0].startswith('<div title="x &amp; y">-name=n'))
+        self.assertEqual(''.join(chunks), six.text_type(node.render(Context({'value': 'x & y'}))))
+
+    def test_render_into(self):
+        node = self.get_node(NESTED)
+        chunks = []
+        node.render_into(Context({'value': 'x'}), chunks.append)
+        self.assertEqual(''.join(chunks), six.text_type(node.render(Context({'value': 'x'}))))
+
+    def test_not_streamed(self):
+        # tag assigned to variable
+        node = self.get_node('{% load binding %}{% templated title="t" as var %}{% end:templated %}')
+        self.assertIsNone(node.get_stream_templates())
+        context = Context()
+        self.assertEqual(list(node.render_iter(context)), [''])
+        self.assertIn('var', context)
+
+        # on_render_tag receivers
+        node = self.get_node('{% load events %}{% ex_rendered %}{% end:ex_rendered %}')
+        self.assertIsNone(node.get_stream_templates())
+
+        # custom render_tag
+        node = self.get_node('{% load cached %}{% cached title="t" %}{% end:cached %}')
+        self.assertIsNone(node.get_stream_templates())
+
+
+class TestStreamingResponse(TestCase):
+
+    def test_iter_template(self):
+        template = engines['django'].from_string('<body>' + NESTED + '</body>')
+        chunks = list(streaming.iter_template(template, {'value': 'x'}))
+
+        self.assertEqual(chunks[0], '<body>')
+        self.assertEqual(''.join(chunks), template.render({'value': 'x'}))
+
+    def test_buffered(self):
+        self.assertEqual(list(streaming.buffered(['a', '', 'bc', 'd', 'e'], size=2)), ['abc', 'de'])
+
+    def test_streaming_response(self):
+        template = engines['django'].from_string(NESTED)
+        response = streaming.streaming_response(template, {'value': 'x'}, content_type='text/html')
+
+        self.assertIsInstance(response, StreamingHttpResponse)
+        self.assertEqual(b''.join(response.streaming_content).decode('utf-8'), template.render({'value': 'x'}))
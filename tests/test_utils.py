@@ -50,3 +50,40 @@ class TestVerifyFuncSignature(TestCase):
         for item in data:
             self.assertRaises(ImproperlyConfigured, utils.verify_func_signature, *item, exact_names=True)
 
+
+class TestTemplateMixin(TestCase):
+
+    def test_template_compiled_once(self):
+        mixin = utils.TemplateMixin(template="<div>{{ content }}</div>")
+        self.assertIs(mixin.template, mixin.template)
+
+    def test_invalidate_template(self):
+        mixin = utils.TemplateMixin(template="<div>{{ content }}</div>")
+        compiled = mixin.template
+
+        mixin.invalidate_template()
+        self.assertIsNot(compiled, mixin.template)
+
+        compiled = mixin.template
+        utils.invalidate_templates()
+        self.assertIsNot(compiled, mixin.template)
+
+    def test_template_cache_disabled(self):
+        mixin = utils.TemplateMixin(template="<div>{{ content }}</div>")
+        with self.settings(WRAPPER_TAG_CACHE_TEMPLATES=False):
+            self.assertIsNot(mixin.template, mixin.template)
+
+
+class TestWildcards(TestCase):
+
+    def test_compile_wildcard(self):
+        self.assertIs(utils.compile_wildcard('data_*'), utils.compile_wildcard('data_*'))
+        self.assertEqual(utils.find_elements('url_kwarg_*', ['url', 'url_kwarg_pk', 'url_arg_1']), ['url_kwarg_pk'])
+
+    def test_compile_wildcards(self):
+        regex = utils.compile_wildcards(('href', 'url_kwarg_*', 'data_+'))
+        self.assertIs(regex, utils.compile_wildcards(('href', 'url_kwarg_*', 'data_+')))
+
+        for key, expected in [('href', True), ('url_kwarg_pk', True), ('data_', False), ('data_x', True),
+                              ('hrefs', False)]:
+            self.assertEqual(bool(regex.match(key)), expected, key)
@@ -0,0 +1,363 @@
+"""
+Async rendering of wrapper tags (ASGI)
+
+Tag hooks `clean_<argument>`, `render_<argument>`, argument `clean`/`render` and signal receivers (e.g. `on_data`)
+can be `async def`. `BaseTag.arender(context)` (or `render_template` for whole template) awaits them, sibling wrapper
+tags are rendered concurrently (asyncio.gather), every one with its own copy of context.
+
+Tag data are computed by the same pipeline as in synchronous render (`BaseTag.iter_tag_data`), which yields
+awaitables of async hooks. Tags without async hooks are computed synchronously (folding, compiled mode and lazy render
+apply as usual). Wrapper tags assigned to variable (`as var`) and other template nodes (which can change context) are
+barriers, they are rendered in order after all preceding siblings. Content of `{% if %}`, `{% for %}`, `{% with %}`,
+`{% block %}`, `{% extends %}` and `{% include %}` is rendered by this module too (see `NODE_RENDERERS`), other nodes
+(and wrapper tags which customize `render`) are rendered synchronously.
+
+Synchronous render (WSGI) still works, awaitables returned by async hooks are run to completion by `run_sync`.
+
+    async def view(request):
+        html = await aio.render_template('page.html', {'items': items}, request=request)
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from logging import ERROR
+
+from django.template.base import VariableDoesNotExist
+from django.template.context import make_context
+from django.template.defaulttags import ForNode, IfNode, WithNode
+from django.template.loader import get_template
+from django.template.loader_tags import BlockNode, ExtendsNode, IncludeNode
+from django.utils.safestring import mark_safe
+
+from wrapper_tag import parallel
+from wrapper_tag import utils
+from wrapper_tag.tag import BaseTag
+
+
+def run_sync(awaitable):
+    """
+    Run awaitable to completion from synchronous code. If event loop is already running in current thread, awaitable
+    is run in new event loop in another thread (current thread is blocked).
+    :param awaitable: awaitable returned by async hook
+    :return: result
+    """
+    # asyncio._get_running_loop is available in all supported python versions (get_running_loop is 3.7+)
+    if asyncio._get_running_loop() is None:
+        return run_in_new_loop(awaitable)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(run_in_new_loop, awaitable).result()
+
+
+def run_in_new_loop(awaitable):
+    """
+    Run awaitable in new event loop (e.g. in tests or management commands)
+    :param awaitable: awaitable
+    :return: result
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(awaitable)
+    finally:
+        loop.close()
+
+
+def is_async_node(node):
+    """
+    Returns whether node is wrapper tag rendered by `render` of this module
+    """
+    return isinstance(node, BaseTag) and utils.defining_class(node.__class__, 'render') is BaseTag
+
+
+async def render(tag, context):
+    """
+    Render tag, await async hooks
+    :param tag: tag instance
+    :param context: render context
+    :return: rendered tag
+    """
+    # fragment cache and customized render_to_tag are synchronous
+    if tag.options.cache is not None and not tag.varname or \
+            utils.defining_class(tag.__class__, 'render_to_tag') is not BaseTag:
+        return tag.render_to_tag(context)
+
+    tag_kwargs = await get_tag_data(tag, context)
+    if tag.varname and tag.options.deferred:
+        return tag.defer(tag_kwargs, context)
+
+    bits = await render_nodelist(tag.nodelist, context)
+    return tag.render_with_data(tag_kwargs, tag.join_content(bits), context)
+
+
+async def get_tag_data(tag, context):
+    """
+    Async variant of `BaseTag.get_tag_data`, tags without async hooks are computed synchronously
+    """
+    if not tag.has_async_hooks():
+        return tag.get_tag_data(context)
+
+    if tag.foldable:
+        if tag.folded_data is None:
+            tag.folded_data = utils.FoldedData(await compute_tag_data(tag, context, {}))
+        return tag.folded_data.copy()
+
+    return await compute_tag_data(tag, context, {})
+
+
+async def compute_tag_data(tag, context, data):
+    """
+    Async variant of `BaseTag.compute_tag_data`, awaitables yielded by data pipeline are awaited in order of arguments
+    """
+    tag_data = tag.new_tag_data(data)
+    steps = tag.iter_tag_data(context, tag_data)
+
+    result = None
+    while True:
+        try:
+            awaitable = steps.send(result)
+        except StopIteration:
+            return tag_data
+
+        try:
+            result = await awaitable
+        except BaseException:
+            steps.close()
+            raise
+
+
+async def render_nodelist(nodelist, context):
+    """
+    Render nodelist, sibling wrapper tags are rendered concurrently
+    :param nodelist: NodeList
+    :param context: render context
+    :return: list of rendered nodes (RenderedTag or text)
+    """
+    bits = [None] * len(nodelist)
+    concurrent = []
+
+    for i, node in enumerate(nodelist):
+        if is_async_node(node) and not node.varname:
+            concurrent.append(i)
+        elif isinstance(node, parallel.READ_ONLY_NODES):
+            bits[i] = node.render_annotated(context)
+        else:
+            await render_concurrent(nodelist, concurrent, bits, context)
+            concurrent = []
+            bits[i] = await render_node(node, context)
+
+    await render_concurrent(nodelist, concurrent, bits, context)
+    return bits
+
+
+async def render_text(nodelist, context):
+    """
+    Render nodelist to safe text (same as `NodeList.render`)
+    """
+    bits = await render_nodelist(nodelist, context)
+    return mark_safe(''.join(str(bit) for bit in bits))
+
+
+async def render_node(node, context):
+    """
+    Render single node, wrapper tags are rendered with `arender`, control flow nodes with `NODE_RENDERERS` (so wrapper
+    tags in their nodelists are reached), other nodes synchronously
+    """
+    if is_async_node(node):
+        return await node.arender(context)
+
+    render_async = NODE_RENDERERS.get(node.__class__)
+    if render_async is not None:
+        return await render_async(node, context)
+    return node.render_annotated(context)
+
+
+async def render_for(node, context):
+    """
+    Same as `ForNode.render`, loop body is rendered by `render_nodelist`
+    """
+    parentloop = context['forloop'] if 'forloop' in context else {}
+    with context.push():
+        values = node.sequence.resolve(context, ignore_failures=True)
+        if values is None:
+            values = []
+        if not hasattr(values, '__len__'):
+            values = list(values)
+        len_values = len(values)
+        if len_values < 1:
+            return await render_text(node.nodelist_empty, context)
+        if node.is_reversed:
+            values = reversed(values)
+
+        num_loopvars = len(node.loopvars)
+        unpack = num_loopvars > 1
+        bits = []
+        loop_dict = context['forloop'] = {'parentloop': parentloop}
+        for i, item in enumerate(values):
+            loop_dict['counter0'] = i
+            loop_dict['counter'] = i + 1
+            loop_dict['revcounter'] = len_values - i
+            loop_dict['revcounter0'] = len_values - i - 1
+            loop_dict['first'] = (i == 0)
+            loop_dict['last'] = (i == len_values - 1)
+
+            if unpack:
+                try:
+                    len_item = len(item)
+                except TypeError:
+                    len_item = 1
+                if num_loopvars != len_item:
+                    raise ValueError('Need {} values to unpack in for loop; got {}. '.format(num_loopvars, len_item))
+                with context.push(**dict(zip(node.loopvars, item))):
+                    bits.append(await render_text(node.nodelist_loop, context))
+            else:
+                context[node.loopvars[0]] = item
+                bits.append(await render_text(node.nodelist_loop, context))
+
+    return mark_safe(''.join(bits))
+
+
+async def render_if(node, context):
+    """
+    Same as `IfNode.render`
+    """
+    for condition, nodelist in node.conditions_nodelists:
+        if condition is not None:
+            try:
+                match = condition.eval(context)
+            except VariableDoesNotExist:
+                match = None
+        else:
+            match = True
+
+        if match:
+            return await render_text(nodelist, context)
+    return ''
+
+
+async def render_with(node, context):
+    """
+    Same as `WithNode.render`
+    """
+    values = dict((key, value.resolve(context)) for key, value in node.extra_context.items())
+    with context.push(**values):
+        return await render_text(node.nodelist, context)
+
+
+async def render_block(node, context):
+    """
+    Same as `BlockNode.render`, block overridden by child template is rendered
+    """
+    with utils.block_scope(node, context) as nodelist:
+        return await render_text(nodelist, context)
+
+
+async def render_extends(node, context):
+    """
+    Same as `ExtendsNode.render`, parent template is rendered by `render_nodelist`
+    """
+    parent = utils.get_extended_template(node, context)
+    with context.render_context.push_state(parent, isolated_context=False):
+        return await render_text(parent.nodelist, context)
+
+
+async def render_include(node, context):
+    """
+    Same as `IncludeNode.render`, included template is rendered by `render_nodelist`
+    """
+    template = utils.get_included_template(node, context)
+    values = dict((name, value.resolve(context)) for name, value in node.extra_context.items())
+    if node.isolated_context:
+        context = context.new(values)
+        values = {}
+
+    with context.push(**values):
+        with context.render_context.push_state(template):
+            return await render_text(template.nodelist, context)
+
+
+# nodes rendered by this module, so wrapper tags in their nodelists await async hooks
+NODE_RENDERERS = {
+    ForNode: render_for,
+    IfNode: render_if,
+    WithNode: render_with,
+    BlockNode: render_block,
+    ExtendsNode: render_extends,
+    IncludeNode: render_include,
+}
+
+
+async def render_concurrent(nodelist, positions, bits, context):
+    """
+    Render wrapper tags at given positions of nodelist concurrently, each with its own copy of context (see
+    `parallel.isolate`)
+    """
+    if not positions:
+        return
+
+    if len(positions) == 1:
+        bits[positions[0]] = await nodelist[positions[0]].arender(context)
+        return
+
+    results = await asyncio.gather(*[nodelist[i].arender(parallel.isolate(context)) for i in positions])
+    for i, result in zip(positions, results):
+        bits[i] = result
+
+
+async def render_template(template, context=None, request=None):
+    """
+    Render template, wrapper tags are rendered with `arender`
+    :param template: template name or template returned by `get_template`
+    :param context: context dict
+    :param request: request
+    :return: rendered text
+    """
+    if isinstance(template, str):
+        template = get_template(template)
+
+    # unwrap backend template
+    backend = getattr(template, 'backend', None)
+    template = getattr(template, 'template', template)
+
+    autoescape = backend.engine.autoescape if backend is not None else template.engine.autoescape
+    context = make_context(context, request, autoescape=autoescape)
+
+    # same as django.template.Template.render
+    with context.render_context.push_state(template):
+        with context.bind_template(template):
+            context.template_name = template.name
+            bits = await render_nodelist(template.nodelist, context)
+
+    return mark_safe(''.join(str(bit) for bit in bits))
+
+
+async def dispatch(signal, sender, logger, name, **named):
+    """
+    Send signal to all receivers, synchronous receivers are called in order, awaitables returned by async receivers
+    are awaited concurrently. Errors are logged to logger.
+    """
+    awaitables = []
+    for receiver in signal.get_live_receivers(sender):
+        try:
+            result = receiver(signal=signal, sender=sender, **named)
+        except Exception as error:
+            log_receiver_error(logger, name, receiver, error)
+            continue
+
+        if inspect.isawaitable(result):
+            awaitables.append((receiver, result))
+
+    if not awaitables:
+        return
+
+    results = await asyncio.gather(*[awaitable for _, awaitable in awaitables], return_exceptions=True)
+    for (receiver, _), result in zip(awaitables, results):
+        if isinstance(result, Exception):
+            log_receiver_error(logger, name, receiver, result)
+
+
+def log_receiver_error(logger, name, receiver, error):
+    if logger.isEnabledFor(ERROR):
+        logger.error('%s: %s, returned error', name, receiver)
+        logger.error(error, exc_info=error)
@@ -0,0 +1,208 @@
+"""
+Dead argument elimination
+
+Tag opts in with `Meta.used_arguments`: `'auto'` or list of arguments which are always rendered (e.g. read by other
+render hooks or custom `render_tag`). Rendered argument (`<argument>__rendered`) which is never read is not rendered
+then. Tag template and argument templates are scanned for variables once per tag class (again after template is
+recompiled), only rendered keys found there (and listed arguments) are rendered. All rendered keys are rendered
+(nothing is eliminated) when:
+
+* `Meta.used_arguments` is not set (default, hooks and receivers of existing tags can read any rendered key) or is
+  `'__all__'`
+* tag is assigned to variable (`as var`), so rendered tag `arguments` can be read by anyone
+* template can't be analyzed (template tags other than if/for/with, `parent` used as whole)
+* tag customizes rendering (`render_tag` and others) and doesn't list used arguments (`'auto'`)
+* `on_render_data`/`on_render_tag` receivers are connected (except of Event/Method arguments)
+
+Event and Method arguments and arguments with `on_data` receiver are always rendered.
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+from django.template.base import VARIABLE_ATTRIBUTE_SEPARATOR, FilterExpression, TextNode, Variable, VariableNode
+from django.template.defaulttags import ForNode, IfNode, WithNode
+
+from wrapper_tag import arguments
+from wrapper_tag import utils
+from wrapper_tag.simple_template import SimpleTemplate
+
+# methods which render tag, tag which overrides any of them doesn't have to use tag template
+RENDER_METHODS = ('render', 'render_to_tag', 'render_with_data', 'render_template', 'render_tag')
+
+# arguments connected to on_render_data/on_render_tag, they read rendered keys
+ALWAYS_RENDERED = (arguments.Event, arguments.Method)
+
+# names pushed to context together with tag data when argument is rendered (see `utils.render_frame`)
+FRAME_NAMES = ('argument', 'extra_data', 'parent')
+
+
+def get_rendered_keys(tag_cls):
+    """
+    Returns rendered keys which are read by tag templates
+    :param tag_cls: tag class
+    :return: frozenset of rendered keys or None if all keys must be rendered
+    """
+    key = (tag_cls.options.template, tag_cls.on_render_data.version, tag_cls.on_render_tag.version)
+
+    cached = tag_cls.__dict__.get('_rendered_keys')
+    if cached is not None and cached[0][0] is key[0] and cached[0][1:] == key[1:]:
+        return cached[1]
+
+    rendered_keys = compute_rendered_keys(tag_cls, key[0])
+    tag_cls._rendered_keys = (key, rendered_keys)
+    return rendered_keys
+
+
+def compute_rendered_keys(tag_cls, template):
+    from wrapper_tag.tag import BaseTag
+
+    used_arguments = tag_cls.options.used_arguments
+    if used_arguments is None or used_arguments == '__all__':
+        return None
+
+    if used_arguments == 'auto':
+        if any(utils.defining_class(tag_cls, name) is not BaseTag for name in RENDER_METHODS):
+            return None
+        used_arguments = ()
+
+    for signal in (tag_cls.on_render_data, tag_cls.on_render_tag):
+        for receiver in signal.get_live_receivers(tag_cls):
+            if not isinstance(getattr(receiver, '__self__', None), ALWAYS_RENDERED):
+                return None
+
+    names = get_template_names(template)
+    if names is None:
+        return None
+
+    for entry in tag_cls.argument_plan:
+        if entry.has_template:
+            argument_names = get_template_names(entry.argument.template)
+            if argument_names is None:
+                return None
+            names.update(argument_names)
+
+    return frozenset(
+        entry.rendered_key for entry in tag_cls.argument_plan
+        if entry.rendered_key in names or entry.name in used_arguments or
+        isinstance(entry.argument, ALWAYS_RENDERED) or entry.argument.on_data
+    )
+
+
+def reads_context(tag_cls, template):
+    """
+    Returns whether template reads anything but tag data (so its output depends on render context)
+    :param tag_cls: tag class
+    :param template: SimpleTemplate or django Template
+    :return:
+    """
+    names = get_template_names(template)
+    if names is None:
+        return True
+
+    known = set(FRAME_NAMES)
+    for entry in tag_cls.argument_plan:
+        known.add(entry.name)
+        known.add(entry.rendered_key)
+
+    return not names <= known
+
+
+def get_template_names(template):
+    """
+    Returns names of tag data read by template (`name` and `parent.name` lookups)
+    :param template: SimpleTemplate or django Template
+    :return: set of names or None if template can't be analyzed
+    """
+    variables = get_template_variables(template)
+    if variables is None:
+        return None
+
+    names = set()
+    for variable in variables:
+        bits = variable.split(VARIABLE_ATTRIBUTE_SEPARATOR)
+        if bits[0] == 'parent':
+            if len(bits) == 1:
+                return None
+            names.add(bits[1])
+        else:
+            names.add(bits[0])
+    return names
+
+
+def get_template_variables(template):
+    """
+    Returns variables used in template
+    :param template: SimpleTemplate or django Template
+    :return: list of variable names or None if template can't be analyzed
+    """
+    if isinstance(template, SimpleTemplate):
+        return template.variables
+
+    nodelist = getattr(template, 'nodelist', None)
+    if nodelist is None:
+        return None
+
+    variables = []
+    if not collect_nodelist(nodelist, variables):
+        return None
+    return variables
+
+
+def collect_nodelist(nodelist, variables):
+    """
+    Collect variables of nodes to list
+    :return: False if nodelist contains node which can't be analyzed
+    """
+    for node in nodelist:
+        if isinstance(node, TextNode):
+            continue
+        elif isinstance(node, VariableNode):
+            collect_expression(node.filter_expression, variables)
+        elif isinstance(node, IfNode):
+            for condition, child in node.conditions_nodelists:
+                collect_condition(condition, variables)
+                if not collect_nodelist(child, variables):
+                    return False
+        elif isinstance(node, ForNode):
+            collect_expression(node.sequence, variables)
+            if not collect_nodelist(node.nodelist_loop, variables):
+                return False
+            if node.nodelist_empty and not collect_nodelist(node.nodelist_empty, variables):
+                return False
+        elif isinstance(node, WithNode):
+            for expression in node.extra_context.values():
+                collect_expression(expression, variables)
+            if not collect_nodelist(node.nodelist, variables):
+                return False
+        else:
+            return False
+
+    return True
+
+
+def collect_condition(condition, variables):
+    """
+    Collect variables of `{% if %}` condition (tree of operators with TemplateLiteral leaves)
+    """
+    if condition is None:
+        return
+
+    value = getattr(condition, 'value', None)
+    if isinstance(value, FilterExpression):
+        collect_expression(value, variables)
+
+    for child in (getattr(condition, 'first', None), getattr(condition, 'second', None)):
+        if child is not None and child is not condition:
+            collect_condition(child, variables)
+
+
+def collect_expression(expression, variables):
+    """
+    Collect variables of filter expression and its filter arguments
+    """
+    if isinstance(expression.var, Variable) and expression.var.lookups is not None:
+        variables.append(expression.var.var)
+
+    for _, args in expression.filters:
+        for lookup, arg in args:
+            if lookup and isinstance(arg, Variable):
+                variables.append(arg.var)
@@ -1,5 +1,6 @@
 from django.apps import AppConfig
 from django.conf import settings
+from django.core.signals import setting_changed
 from logging import getLogger
 
 try:
@@ -22,6 +23,9 @@ class WrapperTagConfig(AppConfig):
     logger = getLogger('wrapper_tag')
     template_debug = utils.is_template_debug()
 
+    def ready(self):
+        setting_changed.connect(template_settings_changed)
+
     def get_templatetag_libs(self):
         """
         Returns all templatetag libraries
@@ -52,4 +56,14 @@ class WrapperTagConfig(AppConfig):
                 except ImportError:
                     continue
 
-        return result
\ No newline at end of file
+        return result
+
+
+def template_settings_changed(setting, **kwargs):
+    """
+    Invalidate compiled templates when template settings change
+    """
+    if setting in ('TEMPLATES', 'WRAPPER_TAG_CACHE_TEMPLATES'):
+        utils.invalidate_templates()
+    elif setting == 'WRAPPER_TAG_COMPILED':
+        utils.reset_compiled_mode()
@@ -1,7 +1,9 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
-import copy
+import asyncio
 import re
+from collections import namedtuple
+from functools import partial
 
 import six
 from django.core.exceptions import ValidationError
@@ -22,6 +24,19 @@ RENDER_METHOD_TAG = 1
 RENDER_METHOD_ARGUMENT = 2
 
 
+# Precompiled execution plan of single argument, built once per tag class by TagMetaclass.
+#   tag_clean - clean_<argument> tag method (None if not provided)
+#   clean - argument clean method (None if not overridden)
+#   render - render callable with signature (tag, data, context), None if argument has nothing to render
+#   resolve - resolve_binding method, None if argument overrides get_tag_value and must get raw args/kwargs
+#   async_tag_clean, async_clean, async_render - whether hook is `async def` (returns awaitable)
+ArgumentPlan = namedtuple('ArgumentPlan', [
+    'argument', 'name', 'rendered_key', 'raw_key', 'extra_data', 'validators', 'tag_clean', 'clean', 'render',
+    'resolve', 'readonly', 'has_validators', 'has_choices', 'has_template', 'async_tag_clean', 'async_clean',
+    'async_render',
+])
+
+
 class Argument(utils.TemplateMixin):
 
     # Tracks each time a Field instance is created. Used to retain order.
@@ -35,9 +50,11 @@ class Argument(utils.TemplateMixin):
 
     _choices = None
     _default = None
+    _default_factory = None
 
     help_text = None
     readonly = False
+    pure = False
     _tag_render_method = None
     validators = None
     extra_data = None
@@ -51,7 +68,7 @@ class Argument(utils.TemplateMixin):
     doc_group = docgen.ArgumentsGroup(_('Arguments'), help_text=_('Group of generic arguments'))
 
     def __init__(self, help_text=None, on_data=None, readonly=False, default=None,
-                 validators=None, extra_data=None, choices=None, tag_render_method=None, **kwargs):
+                 validators=None, extra_data=None, choices=None, tag_render_method=None, pure=False, **kwargs):
         # Increase the creation counter, and save our local copy.
         self.creation_counter = Argument.creation_counter
         Argument.creation_counter += 1
@@ -60,6 +77,7 @@ class Argument(utils.TemplateMixin):
         self.extra_data = extra_data or {}
         self.help_text = help_text
         self.readonly = readonly
+        self.pure = pure
         self._tag_render_method = tag_render_method
         self._default = default
 
@@ -97,16 +115,32 @@ class Argument(utils.TemplateMixin):
     @property
     def default(self):
         """
-        Default must be copied.
+        Default value, mutable defaults are copied, so every render gets its own value.
         :return:
         """
-        if callable(self._default):
-            return copy.deepcopy(self._default(self))
-        return copy.deepcopy(self._default)
+        factory = self._default_factory
+        if factory is None:
+            factory = self._default_factory = self.get_default_factory()
+        return factory()
 
     @default.setter
     def default(self, value):
         self._default = value
+        self._default_factory = None
+
+    def get_default_factory(self):
+        """
+        Return factory that constructs default value. Immutable defaults are returned as they are, mutable defaults
+        are copied (shallow copy if their items are immutable). Callable defaults are called with argument and must
+        return new value on every call.
+        :return:
+        """
+        default = self._default
+
+        if callable(default):
+            return partial(default, self)
+
+        return utils.copy_factory(default)
 
     @property
     def choices(self):
@@ -130,12 +164,17 @@ class Argument(utils.TemplateMixin):
         :return:
         """
 
+        # prepare default factory (class preparation time)
+        self._default_factory = self.get_default_factory()
+
         def _clean_argument_(tag, argument, value):
             """
             Dummy clean_<argument> method
             """
             return value
 
+        _clean_argument_.dummy = True
+
         # check if clean_<argument> method is defined on tag, if not create dummy one
         tcl = getattr(tag_cls, self.tag_clean_method, None)
         if tcl is None:
@@ -163,6 +202,57 @@ class Argument(utils.TemplateMixin):
                 if on_data and callable(on_data):
                     tag_cls.on_data.connect(on_data)
 
+    def get_plan(self, tag_cls):
+        """
+        Build execution plan for this argument on given tag class (called once at class creation).
+        :param tag_cls: tag class
+        :return: ArgumentPlan
+        """
+        tag_clean = getattr(tag_cls, self.tag_clean_method, None)
+        if getattr(tag_clean, 'dummy', False):
+            tag_clean = None
+
+        clean = self.clean if type(self).clean is not Argument.clean else None
+        has_template = bool(self._template or self._template_name)
+
+        if self.render_method_type == RENDER_METHOD_TAG:
+            render_method = self.render
+
+            def render(tag, data, context):
+                return render_method(tag, self, data, context)
+
+        elif type(self).render is not Argument.render or has_template:
+            render_method = render = self.render
+        else:
+            render_method = render = None
+
+        # argument subclass that overrides only get_tag_value cannot be bound at compile time
+        resolve = self.resolve_binding
+        get_tag_value_cls = utils.defining_class(type(self), 'get_tag_value')
+        if get_tag_value_cls is not utils.defining_class(type(self), 'resolve_binding') and \
+                issubclass(get_tag_value_cls, utils.defining_class(type(self), 'resolve_binding')):
+            resolve = None
+
+        return ArgumentPlan(
+            argument=self,
+            name=self.name,
+            rendered_key=self.rendered_key,
+            raw_key=self.raw_key,
+            extra_data=self.extra_data,
+            validators=tuple(self.validators),
+            tag_clean=tag_clean,
+            clean=clean,
+            render=render,
+            resolve=resolve,
+            readonly=self.readonly,
+            has_validators=bool(self.validators),
+            has_choices=callable(self._choices) or bool(self.choices),
+            has_template=has_template,
+            async_tag_clean=asyncio.iscoroutinefunction(tag_clean),
+            async_clean=asyncio.iscoroutinefunction(clean),
+            async_render=asyncio.iscoroutinefunction(render_method),
+        )
+
     def full_clean(self, tag, value):
         """
         Internal!
@@ -198,6 +288,50 @@ class Argument(utils.TemplateMixin):
 
         return result
 
+    def bind(self, args, kwargs):
+        """
+        Bind compiled args/kwargs (FilterExpression instances) to argument. Called once when tag is compiled, bound
+        items are removed from args/kwargs.
+        :param args: list of compiled positional arguments
+        :param kwargs: dict of compiled keyword arguments
+        :return: binding passed to `resolve_binding` on render
+        """
+        if self.readonly:
+            return None
+
+        return kwargs.pop(self.name, None), kwargs.pop(self.raw_key, None)
+
+    def is_constant_binding(self, binding):
+        """
+        Returns whether binding resolves to the same value in every context
+        :param binding: binding returned by `bind`
+        :return:
+        """
+        if binding is None:
+            return True
+
+        return all(value is None or utils.is_constant_expression(value) for value in binding)
+
+    def resolve_binding(self, binding, context):
+        """
+        Resolve value from binding returned by `bind`
+        :param binding: binding
+        :param context: render context
+        :return:
+        """
+        if binding is None:
+            return self.default
+
+        value, raw = binding
+
+        # if __raw__<name> was provided we use it as raw value (probably inherited from parent)
+        if raw is not None:
+            return raw.resolve(context)
+        if value is not None:
+            return value.resolve(context)
+
+        return self.default
+
     def clean(self, tag, value):
         """
         This method should be overridden
@@ -214,7 +348,10 @@ class Argument(utils.TemplateMixin):
         :return:
         """
 
-        with context.push(extra_data=self.extra_data, argument=self):
+        with utils.render_frame(context, data) as frame:
+            frame['extra_data'] = self.extra_data
+            frame['argument'] = self
+
             if self.render_method_type == RENDER_METHOD_TAG:
                 return self.render(tag, self, data, context)
             elif self.render_method_type == RENDER_METHOD_ARGUMENT:
@@ -222,7 +359,7 @@ class Argument(utils.TemplateMixin):
 
     def render(self, tag, data, context):
         """
-        Rendering function
+        Rendering function, tag data are already pushed to context (see `utils.render_frame`)
         :param data:
         :return:
         """
@@ -231,9 +368,7 @@ class Argument(utils.TemplateMixin):
         if not template:
             return utils.NULL
 
-        with context.push(**data):
-            return template.render(context)
-            # return template.render(Context(data))
+        return template.render(context)
 
     def gen_doc(self):
         """
@@ -273,6 +408,12 @@ class Keyword(Argument):
             value = self.default
         return value
 
+    def resolve_binding(self, binding, context):
+        value = super(Keyword, self).resolve_binding(binding, context)
+        if self.choices and value not in self.choices:
+            value = self.default
+        return value
+
     def gen_doc(self):
         doc = super(Keyword, self).gen_doc()
         if self.choices:
@@ -330,13 +471,18 @@ class KeywordGroup(Argument):
     @property
     def compiled_source(self):
         """
-        Return list of regexes of sources.
+        Return tuple of regexes of sources (compiled once per process).
         :return:
         """
-        result = []
-        for item in self.source:
-            result.append(re.compile('^{}$'.format(item.replace('+', '.+').replace('*', '.*'))))
-        return result
+        return tuple(utils.compile_wildcard(item) for item in self.source)
+
+    @property
+    def source_regex(self):
+        """
+        Return single regex that matches any of sources (compiled once per process).
+        :return:
+        """
+        return utils.compile_wildcards(tuple(self.source))
 
     def is_source(self, source):
         """
@@ -344,10 +490,9 @@ class KeywordGroup(Argument):
         :param source:
         :return:
         """
-        for cs in self.compiled_source:
-            if cs.match(source):
-                return True
-        return False
+        if not self.source:
+            return False
+        return self.source_regex.match(source) is not None
 
     def get_tag_value(self, args, kwargs):
         """
@@ -361,10 +506,33 @@ class KeywordGroup(Argument):
         if self.readonly:
             return result
 
-        for key in kwargs.keys():
-            for source in self.compiled_source:
-                if source.match(key):
-                    result[key] = kwargs.pop(key)
+        for key in list(kwargs.keys()):
+            if self.is_source(key):
+                result[key] = kwargs.pop(key)
+
+        return result
+
+    def bind(self, args, kwargs):
+        if self.readonly:
+            return None
+
+        # keep order of template kwargs, it's order of rendered group (e.g. data-* attributes)
+        return tuple((key, kwargs.pop(key)) for key in list(kwargs.keys()) if self.is_source(key))
+
+    def is_constant_binding(self, binding):
+        if binding is None:
+            return True
+
+        return all(utils.is_constant_expression(value) for _, value in binding)
+
+    def resolve_binding(self, binding, context):
+        result = self.default
+
+        if binding is None:
+            return result
+
+        for key, value in binding:
+            result[key] = value.resolve(context)
 
         return result
 
@@ -374,13 +542,10 @@ class KeywordGroup(Argument):
         :param data:
         :return:
         """
-        result = {}
-        cs = self.compiled_source
-        for key in data.keys():
-            for source in cs:
-                if source.match(key):
-                    result[key] = data[key]
-        return result
+        if not self.source:
+            return {}
+        match = self.source_regex.match
+        return dict((key, value) for key, value in six.iteritems(data) if match(key))
 
     def gen_doc(self):
         doc = super(KeywordGroup, self).gen_doc()
@@ -431,6 +596,30 @@ class Positional(Argument):
 
         return result
 
+    def bind(self, args, kwargs):
+        if self.readonly:
+            return None
+
+        if self.varargs:
+            bound = tuple(args)
+            del args[:]
+            return bound
+
+        if not args:
+            if utils.is_template_debug():
+                raise TemplateSyntaxError('expected arg but no given')
+            return ()
+
+        return args.pop(0),
+
+    def resolve_binding(self, binding, context):
+        result = self.default or []
+
+        if binding:
+            result.extend(value.resolve(context) for value in binding)
+
+        return result
+
     def gen_doc(self):
         """
         Generate documentation for argument
@@ -557,7 +746,7 @@ class Hyperlink(KeywordGroup):
         if 'url' in value:
             kwarg_keys = utils.find_elements('url_kwarg_*', value.keys())
             arg_keys = utils.find_elements('url_arg_*', sorted(value.keys()))
-            url_kwargs = {k.lstrip('url_kwarg_'): v for k, v in six.iteritems(value) if k in kwarg_keys}
+            url_kwargs = {k[len('url_kwarg_'):]: value[k] for k in kwarg_keys}
             url_args = [value[v] for v in arg_keys]
 
             rev = reverse(value['url'], args=url_args, kwargs=url_kwargs)
@@ -0,0 +1,207 @@
+"""
+HTML attributes of tags (used by `mixins.TagAttributes` and `mixins.Data`)
+
+Attributes are joined to single string in one pass, values are escaped. Attributes known when tag class is created
+(`static_attrs`) are rendered once to fixed prefix::
+
+    class Button(mixins.Identity, mixins.CssClass, wrapper_tag.Tag):
+        static_attrs = {'type': 'button', 'class': 'btn'}
+
+Attribute values of `TagAttributes` are `utils.StringSet` (keys are rendered as they are, empty values are skipped).
+`mixins.OrderedTagAttributes` opts in to `TokenList` values, which keep tokens (e.g. css classes) in order in which
+they were added (duplicates are dropped). Keys of `Data` are normalized (`data_toggle` to `data-toggle`) once per key,
+all values are rendered.
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import six
+from django.utils.encoding import force_text, python_2_unicode_compatible
+from django.utils.safestring import mark_safe
+
+from wrapper_tag.utils import StringSet
+
+# same as django.utils.html.escape, values are joined before they are marked safe
+HTML_ESCAPES = {
+    ord('&'): '&amp;',
+    ord('<'): '&lt;',
+    ord('>'): '&gt;',
+    ord('"'): '&quot;',
+    ord("'"): '&#39;',
+}
+
+# normalized attribute names, set of keys is small (argument names, data_* keys)
+_keys = {}
+
+
+def normalize_key(key):
+    """
+    Returns html attribute name of key (underscores are replaced with dashes)
+    :param key: key
+    :return:
+    """
+    name = _keys.get(key)
+    if name is None:
+        name = _keys[key] = key.replace('_', '-')
+    return name
+
+
+def escape(value):
+    """
+    Escape attribute value, safe values (with `__html__`) are not escaped again
+    :param value: value
+    :return: text
+    """
+    if hasattr(value, '__html__'):
+        return value.__html__()
+    return force_text(value).translate(HTML_ESCAPES)
+
+
+@python_2_unicode_compatible
+class TokenList(list):
+    """
+    Ordered list of unique tokens, `add` accepts whitespace separated tokens
+    """
+
+    def __init__(self, value=None):
+        # list is empty when created, list.__init__ is not needed
+        if value:
+            self.add(value)
+
+    def add(self, value):
+        """
+        Add tokens which are not in list yet
+        :param value: whitespace separated tokens or list of tokens
+        """
+        if isinstance(value, list):
+            tokens = value
+        elif isinstance(value, six.string_types):
+            tokens = value.split()
+        else:
+            tokens = force_text(value).split()
+
+        for token in tokens:
+            if token not in self:
+                self.append(token)
+
+    def discard(self, value):
+        for token in force_text(value).split():
+            if token in self:
+                self.remove(token)
+
+    def merge(self, value):
+        """
+        Returns new TokenList with tokens of value added after own tokens
+        :param value: whitespace separated tokens or TokenList
+        :return: TokenList
+        """
+        tokens = TokenList()
+        tokens.extend(self)
+        if value:
+            tokens.add(value)
+        return tokens
+
+    def __str__(self):
+        return ' '.join(self)
+
+
+class StaticAttributes(object):
+    """
+    Attributes known when tag class is created, rendered once to prefix. Attributes which are also set on render are
+    merged with rendered values (static tokens first), prefixes without them are cached too.
+    """
+
+    def __init__(self, attrs):
+        self.tokens = dict((key, TokenList(value)) for key, value in six.iteritems(attrs))
+        self.prefixes = {}
+
+    def get_prefix(self, exclude=()):
+        """
+        Returns rendered static attributes
+        :param exclude: tuple of keys which are not rendered
+        :return: safe text
+        """
+        prefix = self.prefixes.get(exclude)
+        if prefix is None:
+            prefix = self.prefixes[exclude] = format_attributes(
+                dict((key, value) for key, value in six.iteritems(self.tokens) if key not in exclude))
+        return prefix
+
+
+def get_static_attributes(tag_cls):
+    """
+    Returns StaticAttributes of tag class `static_attrs` (cached per class)
+    :param tag_cls: tag class
+    :return: StaticAttributes or None
+    """
+    static_attrs = getattr(tag_cls, 'static_attrs', None)
+    if not static_attrs:
+        return None
+
+    cached = tag_cls.__dict__.get('_static_attributes')
+    if cached is not None and cached[0] is static_attrs:
+        return cached[1]
+
+    static = StaticAttributes(static_attrs)
+    tag_cls._static_attributes = (static_attrs, static)
+    return static
+
+
+def format_attributes(attrs, static=None):
+    """
+    Render attributes to `key="value"` pairs separated by space, values are escaped, empty values (None, 0, empty
+    string or token set) are skipped
+    :param attrs: dict of attribute values (StringSet, TokenList or any value)
+    :param static: StaticAttributes rendered before attrs
+    :return: safe text
+    """
+    bits = []
+    append = bits.append
+    tokens = static.tokens if static is not None else None
+    merged = []
+
+    # items() instead of six.iteritems, which is expensive for few attributes
+    for key, value in attrs.items():
+        if tokens is not None and key in tokens:
+            merged.append(key)
+            value = tokens[key].merge(value)
+
+        if not value:
+            continue
+
+        append(key + '="' + escape_value(value) + '"')
+
+    if static is not None:
+        prefix = static.get_prefix(tuple(merged))
+        if prefix:
+            bits.insert(0, prefix)
+
+    return mark_safe(' '.join(bits))
+
+
+def format_data(data):
+    """
+    Render data attributes to `key="value"` pairs separated by space, keys are normalized (`data_toggle` to
+    `data-toggle`), all values are rendered (escaped)
+    :param data: dict of attribute values
+    :return: safe text
+    """
+    keys = _keys
+    return mark_safe(' '.join([(keys.get(key) or normalize_key(key)) + '="' + escape_value(value) + '"'
+                               for key, value in data.items()]))
+
+
+def escape_value(value):
+    """
+    Returns escaped attribute value, token sets and lists are joined by space
+    :param value: value
+    :return: text
+    """
+    value_type = type(value)
+    if value_type is TokenList or value_type is StringSet:
+        value = ' '.join(value)
+
+    # escape is called only for values which need it, plain text without special characters is the common case
+    if type(value) is not six.text_type or '&' in value or '<' in value or '>' in value or '"' in value or \
+            "'" in value:
+        return escape(value)
+    return value
@@ -0,0 +1,208 @@
+"""
+Bulk render of single tag class over many rows (`Tag.render_many`, `{% for_each_tag %}`)
+
+Rendering tag in `{% for %}` loop repeats all per tag work for every row. `render_many` computes tag data column-wise:
+every argument is resolved, validated and cleaned for all rows at once, then arguments are rendered for all rows.
+Arguments of pure tags (`Meta.pure`) and pure arguments are cleaned once per distinct value and rendered once per
+distinct tag data, so repeated values (e.g. the same css class in every row) are not processed again::
+
+    rows = [{'title': user.username, 'css_class': 'user'} for user in users]
+    html = ''.join(six.text_type(tag) for tag in ButtonTag.render_many(rows, content='profile'))
+
+or in template (rows are dicts of tag arguments, body is rendered for every row with row in context)::
+
+    {% load wrapper_tag_bulk %}
+    {% for_each_tag button rows as row %}{{ row.title }}{% end:for_each_tag %}
+
+Rows are not resolved from context, values are passed to arguments as they are. Positional arguments take list
+of values under argument name. Fragment cache (`Meta.cache`) is not used. Bulk render is synchronous, async hooks
+are run to completion (see `aio.run_sync`).
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+from django.core.exceptions import ValidationError
+from django.template import Context
+from django.template.base import NodeList
+from django.template.context import BaseContext
+from django.template.exceptions import TemplateSyntaxError
+
+from wrapper_tag import arguments
+from wrapper_tag import utils
+
+
+def render_many(tag_cls, rows, content='', context=None):
+    """
+    Render tag class once for every row
+    :param tag_cls: tag class
+    :param rows: iterable of dicts with argument values
+    :param content: content of all tags, or callable (row) returning content of tag
+    :param context: Context or dict
+    :return: list of RenderedTag
+    """
+    rows = list(rows)
+    if not isinstance(context, BaseContext):
+        context = Context(context or {})
+
+    tag = get_tag(tag_cls)
+
+    result = []
+    for row, tag_kwargs in zip(rows, compute_rows_data(tag, rows, context)):
+        row_content = content(row) if callable(content) else content
+        result.append(tag.render_with_data(tag_kwargs, row_content, context))
+    return result
+
+
+def get_tag(tag_cls):
+    """
+    Returns tag instance which is not compiled from template (no bound arguments, empty nodelist)
+    :param tag_cls: tag class
+    :return: tag
+    """
+    tag = tag_cls.__new__(tag_cls)
+    tag.nodelist = NodeList()
+    tag.unbound_args = []
+    tag.unbound_kwargs = {}
+    tag.bindings = (None,) * len(tag.argument_plan)
+    return tag
+
+
+def compute_rows_data(tag, rows, context):
+    """
+    Column-wise variant of `BaseTag.compute_tag_data`
+    :param tag: tag instance
+    :param rows: list of dicts with argument values
+    :param context: render context
+    :return: list of tag data
+    """
+    row_kwargs = [dict(row) for row in rows]
+    data = [{} for _ in rows]
+
+    for entry in tag.argument_plan:
+        memo = {} if is_pure(tag, entry) else None
+
+        for kwargs, tag_data in zip(row_kwargs, data):
+            value = entry.argument.default if entry.readonly else get_row_value(entry.argument, kwargs)
+            value = memoized(memo, (type(value), value), clean_value, tag, entry, value)
+
+            if value is not None:
+                tag_data[entry.name] = value
+
+    if utils.get_config().template_debug:
+        for kwargs in row_kwargs:
+            if kwargs:
+                raise TemplateSyntaxError('Tag `{}` received unhandled kwargs: {}'.format(
+                    tag.options.start_tag, kwargs.keys()))
+
+    for tag_data in data:
+        tag.on_data.dispatch(tag.__class__, tag.logger, 'on_data', data=tag_data, context=context)
+
+    rendered_keys = tag.get_rendered_keys()
+    for entry in tag.argument_plan:
+        if entry.render is None:
+            continue
+        if rendered_keys is not None and entry.rendered_key not in rendered_keys:
+            continue
+
+        memo = {} if is_pure(tag, entry) else None
+
+        for tag_data in data:
+            key = freeze(tag_data) if memo is not None else None
+            value = memoized(memo, key, render_value, tag, entry, tag_data, context)
+
+            if value is not utils.NULL and value is not None:
+                tag_data[entry.rendered_key] = value
+
+    for tag_data in data:
+        tag.on_render_data.dispatch(tag.__class__, tag.logger, 'on_render_data', data=tag_data, context=context)
+
+    return data
+
+
+def is_pure(tag, entry):
+    return tag.options.pure or entry.argument.pure
+
+
+def memoized(memo, key, func, *args):
+    """
+    Call func once per distinct key (always if memo is None or key is not hashable)
+    """
+    if memo is None or key is None:
+        return func(*args)
+
+    try:
+        return memo[key]
+    except KeyError:
+        value = memo[key] = func(*args)
+        return value
+    except TypeError:
+        return func(*args)
+
+
+def freeze(tag_data):
+    """
+    Returns hashable snapshot of tag data, None if data contains unhashable values
+    :param tag_data: tag data
+    :return:
+    """
+    try:
+        key = tuple(sorted((name, type(value), value) for name, value in tag_data.items()))
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def get_row_value(argument, kwargs):
+    """
+    Returns raw value of argument from row
+    :param argument: argument
+    :param kwargs: row values (consumed values are removed)
+    :return:
+    """
+    if isinstance(argument, arguments.Positional):
+        value = kwargs.pop(argument.name, ())
+        result = argument.default or []
+        result.extend(value if utils.is_seq(value) else [value])
+        return result
+
+    return argument.get_tag_value([], kwargs)
+
+
+def clean_value(tag, entry, value):
+    """
+    Validate and clean single value (same as `BaseTag.compute_tag_data`)
+    """
+    if entry.has_validators:
+        for validator in entry.validators:
+            try:
+                validator(value)
+            except ValidationError:
+                value = entry.argument.default
+                break
+
+    if entry.tag_clean is not None:
+        value = entry.tag_clean(tag, entry.argument, value)
+        if entry.async_tag_clean:
+            value = utils.run_sync(value)
+    if entry.clean is not None:
+        value = entry.clean(tag, value)
+        if entry.async_clean:
+            value = utils.run_sync(value)
+
+    return value
+
+
+def render_value(tag, entry, tag_data, context):
+    """
+    Render argument of single row
+    """
+    with utils.render_frame(context, tag_data) as frame:
+        entry.argument.logger.debug('Rendering with: %s', tag_data)
+
+        frame['extra_data'] = entry.extra_data
+        frame['argument'] = entry.argument
+
+        value = entry.render(tag, tag_data, context)
+        if entry.async_render:
+            value = utils.run_sync(value)
+        return value
@@ -0,0 +1,196 @@
+"""
+Fragment caching for wrapper tags (Meta.cache)
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import hashlib
+import threading
+import time
+
+import six
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.template import Variable, VariableDoesNotExist
+from django.utils.encoding import force_text
+from django.utils.safestring import mark_safe
+
+from wrapper_tag import rendered
+
+DEFAULT_KEY_PREFIX = 'wrapper_tag'
+
+# how long (seconds) refresh lock of stale fragment is held at most
+DEFAULT_LOCK_TIMEOUT = 30
+
+
+class FragmentCache(object):
+    """
+    FragmentCache serves rendered tag content from django cache framework.
+
+    Tag enables fragment cache in Meta::
+
+        class Meta:
+            cache = {
+                'timeout': 300,
+                'vary_on': ['title'],
+                'vary_on_context': ['request.user.pk'],
+                'alias': 'default',
+            }
+
+    `cache = True` enables cache with default options (`timeout` is TIMEOUT of cache backend, `'timeout': None`
+    caches fragments forever). Cache key is constructed from resolved argument values
+    (all arguments if `vary_on` is not given), values of `vary_on_context` variables and digest of rendered content.
+    Tags assigned to variable (`as var`) are never cached, since rendered tag carries also tag data.
+
+    With `soft_timeout` fragment becomes stale after `soft_timeout` seconds, but is still served (until `timeout`)
+    while exactly one renderer (holding cache lock) refreshes it.
+    """
+
+    timeout = DEFAULT_TIMEOUT
+    soft_timeout = None
+    lock_timeout = None
+    vary_on = None
+    vary_on_context = None
+    alias = None
+    key_prefix = None
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT, vary_on=None, vary_on_context=None, alias=DEFAULT_CACHE_ALIAS,
+                 key_prefix=DEFAULT_KEY_PREFIX, soft_timeout=None, lock_timeout=DEFAULT_LOCK_TIMEOUT):
+        self.timeout = timeout
+        self.soft_timeout = soft_timeout
+        self.lock_timeout = lock_timeout
+        self.vary_on = tuple(vary_on) if vary_on is not None else None
+        self.vary_on_context = tuple(vary_on_context or ())
+        self.alias = alias
+        self.key_prefix = key_prefix
+
+        self._context_variables = tuple(Variable(name) for name in self.vary_on_context)
+
+        # hit/miss counters
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.refreshes = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_meta(cls, value):
+        """
+        Create fragment cache from Meta.cache value (True or dict of options)
+        :param value: Meta.cache
+        :return: FragmentCache instance or None
+        """
+        if not value:
+            return None
+        if value is True:
+            return cls()
+        return cls(**value)
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def get_key(self, tag, context, content):
+        """
+        Construct cache key for tag invocation
+        :param tag: tag instance
+        :param context: render context
+        :param content: rendered content of tag
+        :return:
+        """
+        digest = hashlib.md5()
+
+        for name, value in tag.resolve_arguments(context, names=self.vary_on):
+            digest.update(force_text(name).encode('utf-8'))
+            digest.update(key_part(value).encode('utf-8'))
+
+        for variable in self._context_variables:
+            try:
+                value = variable.resolve(context)
+            except VariableDoesNotExist:
+                value = None
+            digest.update(key_part(value).encode('utf-8'))
+
+        digest.update(force_text(content).encode('utf-8'))
+
+        return '{}:{}:{}'.format(self.key_prefix, tag.options.start_tag, digest.hexdigest())
+
+    def render(self, tag, context):
+        """
+        Render tag, serve from cache if available
+        :param tag: tag instance
+        :param context: render context
+        :return:
+        """
+        content = tag.nodelist.render(context)
+        key = self.get_key(tag, context, content)
+
+        cached = self.cache.get(key)
+
+        if cached is None:
+            self.count('misses')
+            return self.refresh(key, tag, context, content)
+
+        if self.soft_timeout is None or not isinstance(cached, tuple):
+            self.count('hits')
+            return rendered.RenderedTag(mark_safe(cached), tag.options.start_tag)
+
+        cached, fresh_until = cached
+        if time.time() < fresh_until:
+            self.count('hits')
+            return rendered.RenderedTag(mark_safe(cached), tag.options.start_tag)
+
+        # stale fragment, only renderer holding the lock refreshes it, others serve stale content
+        lock_key = '{}:lock'.format(key)
+        if not self.cache.add(lock_key, 1, self.lock_timeout):
+            self.count('stale_hits')
+            return rendered.RenderedTag(mark_safe(cached), tag.options.start_tag)
+
+        try:
+            self.count('refreshes')
+            return self.refresh(key, tag, context, content)
+        finally:
+            self.cache.delete(lock_key)
+
+    def refresh(self, key, tag, context, content):
+        """
+        Render tag and store it to cache
+        :param key: cache key
+        :param tag: tag instance
+        :param context: render context
+        :param content: rendered content
+        :return:
+        """
+        rendered_tag = tag.render_with_data(tag.get_tag_data(context), content, context)
+
+        value = six.text_type(rendered_tag)
+        if self.soft_timeout is not None:
+            value = (value, time.time() + self.soft_timeout)
+
+        self.cache.set(key, value, self.timeout)
+
+        return rendered_tag
+
+    def count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.stale_hits = 0
+            self.refreshes = 0
+
+
+def key_part(value):
+    """
+    Return stable text representation of value for cache key
+    :param value:
+    :return:
+    """
+    if isinstance(value, dict):
+        return '{{{}}}'.format(','.join('{}:{}'.format(force_text(k), key_part(v))
+                                        for k, v in sorted(six.iteritems(value), key=lambda x: force_text(x[0]))))
+    if isinstance(value, (list, tuple)):
+        return '[{}]'.format(','.join(key_part(v) for v in value))
+    return '{}:{}'.format(type(value).__name__, force_text(value))
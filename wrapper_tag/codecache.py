@@ -0,0 +1,190 @@
+"""
+On-disk cache of code generated in compiled mode (see `codegen`)
+
+When WRAPPER_TAG_CODE_CACHE_DIR setting is set, generated source and its marshalled code object are stored per tag
+class, so restarted processes load them instead of generating and compiling them again. Cache key is built from names
+of tag class, its bases and argument classes outside of django/wrapper_tag, modification time and size of their
+modules, tag template source, wrapper_tag, django and python versions (so key is computed with a few `stat` calls, not
+by reading sources). Classes of modules without file (e.g. created dynamically) are not cached.
+
+Cache is built (stale files are removed), verified and cleared by `tagcache` management command.
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import hashlib
+import marshal
+import os
+import re
+import sys
+import tempfile
+
+import django
+import six
+from django.conf import settings
+
+# modules covered by versions in cache key
+VERSIONED_MODULES = ('wrapper_tag', 'django', 'six', 'builtins', '__builtin__')
+
+CACHE_FILE_EXTENSION = '.marshal'
+
+# bump when generated code changes, so cache files of previous generator are not loaded
+GENERATOR_VERSION = '5'
+
+SAFE_FILENAME = re.compile(r'[^\w.-]')
+
+
+def get_cache_dir():
+    """
+    Returns cache directory (WRAPPER_TAG_CODE_CACHE_DIR setting), None if disabled
+    :return:
+    """
+    return getattr(settings, 'WRAPPER_TAG_CODE_CACHE_DIR', None)
+
+
+def get_source_classes(tag_cls):
+    """
+    Returns classes which affect generated code of tag class: tag class with its bases and argument classes
+    :param tag_cls: tag class
+    :return: list of classes
+    """
+    classes = list(tag_cls.__mro__)
+    for entry in tag_cls.argument_plan:
+        classes.extend(klass for klass in type(entry.argument).__mro__ if klass not in classes)
+
+    return [klass for klass in classes if klass.__module__.split('.')[0] not in VERSIONED_MODULES]
+
+
+def get_key(tag_cls):
+    """
+    Returns cache key of tag class, None if module file of tag class (or its bases and arguments) is not available
+    :param tag_cls: tag class
+    :return:
+    """
+    from wrapper_tag import __version__
+
+    digest = hashlib.sha1()
+
+    for part in (GENERATOR_VERSION, __version__, django.get_version(), sys.version):
+        digest.update(part.encode('utf-8'))
+
+    stamps = {}
+    for klass in get_source_classes(tag_cls):
+        digest.update('{}.{}'.format(klass.__module__, getattr(klass, '__qualname__', klass.__name__)).encode('utf-8'))
+
+        if klass.__module__ not in stamps:
+            stamp = get_module_stamp(klass.__module__)
+            if stamp is None:
+                return None
+            stamps[klass.__module__] = stamp
+            digest.update(stamp.encode('utf-8'))
+
+    template = tag_cls.options.template
+    source = getattr(template, 'source', None)
+    if source:
+        digest.update(source.encode('utf-8'))
+
+    return digest.hexdigest()
+
+
+def get_module_stamp(name):
+    """
+    Returns modification time and size of module file
+    :param name: module name
+    :return: text or None if module has no file
+    """
+    filename = getattr(sys.modules.get(name), '__file__', None)
+    if not filename:
+        return None
+
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+
+    return '{}:{}:{}'.format(filename, getattr(stat, 'st_mtime_ns', stat.st_mtime), stat.st_size)
+
+
+def get_path(tag_cls, key):
+    """
+    Returns path of cache file
+    :param tag_cls: tag class
+    :param key: cache key
+    :return:
+    """
+    filename = SAFE_FILENAME.sub('_', '{}.{}-{}'.format(tag_cls.__module__, tag_cls.__name__, key))
+    return os.path.join(get_cache_dir(), filename + CACHE_FILE_EXTENSION)
+
+
+def load(tag_cls):
+    """
+    Load generated source and code object of tag class
+    :param tag_cls: tag class
+    :return: tuple (source, code) or None if not cached
+    """
+    if not get_cache_dir():
+        return None
+
+    key = get_key(tag_cls)
+    if key is None:
+        return None
+
+    try:
+        with open(get_path(tag_cls, key), 'rb') as f:
+            source, code = marshal.load(f)
+    except (IOError, OSError, EOFError, ValueError, TypeError):
+        return None
+
+    return source, code
+
+
+def store(tag_cls, source, code):
+    """
+    Store generated source and code object of tag class (written atomically)
+    :param tag_cls: tag class
+    :param source: generated source
+    :param code: compiled code object
+    :return: path of cache file or None if not stored
+    """
+    cache_dir = get_cache_dir()
+    if not cache_dir:
+        return None
+
+    key = get_key(tag_cls)
+    if key is None:
+        return None
+
+    path = get_path(tag_cls, key)
+
+    try:
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            marshal.dump((six.text_type(source), code), f)
+        os.rename(tmp_path, path)
+    except (IOError, OSError):
+        return None
+
+    return path
+
+
+def clear(keep=()):
+    """
+    Remove cache files
+    :param keep: paths of files which are kept (e.g. files stored by build, so stale files are removed)
+    :return: number of removed files
+    """
+    cache_dir = get_cache_dir()
+    if not cache_dir or not os.path.isdir(cache_dir):
+        return 0
+
+    keep = set(os.path.abspath(path) for path in keep)
+
+    removed = 0
+    for filename in os.listdir(cache_dir):
+        path = os.path.join(cache_dir, filename)
+        if filename.endswith(CACHE_FILE_EXTENSION) and os.path.abspath(path) not in keep:
+            os.remove(path)
+            removed += 1
+    return removed
@@ -0,0 +1,338 @@
+"""
+Compiled mode (WRAPPER_TAG_COMPILED setting)
+
+For every tag class straight-line python source is generated from its argument plan. Arguments are unrolled, so
+generated functions do no getattr lookups nor type branching on render:
+
+* ``compute_tag_data(tag, context, data)`` - resolves bound/unbound arguments, runs validators, clean hooks,
+  dispatches signals and renders arguments (replaces `BaseTag.compute_tag_data`)
+* ``render_tag(tag, tag_kwargs, context)`` - renders segments of simple tag template to ChunkList (replaces
+  `BaseTag.render_tag`)
+
+Functions which cannot be generated (tag overrides the interpreted method or has async hooks, template is not
+simple) are None and interpreted path is used instead. Generated code can be persisted across process restarts (see
+`codecache`).
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+from collections import namedtuple
+
+from django.core.exceptions import ValidationError
+from django.template.exceptions import TemplateSyntaxError
+
+from wrapper_tag import arguments
+from wrapper_tag import codecache
+from wrapper_tag import rendered
+from wrapper_tag import utils
+from wrapper_tag.simple_template import SimpleTemplate
+
+# compiled functions of tag class, `source` is kept for debugging
+CompiledTag = namedtuple('CompiledTag', ['compute_tag_data', 'render_tag', 'source'])
+
+INDENT = '    '
+
+
+class SourceWriter(object):
+    """
+    Collects lines of generated source
+    """
+
+    def __init__(self):
+        self.lines = []
+        self.level = 0
+
+    def line(self, text='', *args):
+        if args:
+            text = text.format(*args)
+        self.lines.append(INDENT * self.level + text if text else '')
+
+    def indent(self):
+        self.level += 1
+
+    def dedent(self):
+        self.level -= 1
+
+    def getvalue(self):
+        return '\n'.join(self.lines) + '\n'
+
+
+def get_compiled(tag_cls):
+    """
+    Return compiled functions of tag class, generated on first access
+    :param tag_cls: tag class
+    :return: CompiledTag
+    """
+    compiled = tag_cls.__dict__.get('_compiled_tag')
+    if compiled is None:
+        compiled = compile_tag(tag_cls)
+        tag_cls._compiled_tag = compiled
+    return compiled
+
+
+def compile_tag(tag_cls):
+    """
+    Generate and compile functions for tag class
+    :param tag_cls: tag class
+    :return: CompiledTag
+    """
+    cached = codecache.load(tag_cls)
+    if cached is not None:
+        source, code = cached
+    else:
+        source, code = generate_code(tag_cls)
+        codecache.store(tag_cls, source, code)
+
+    namespace = build_namespace(tag_cls)
+    exec(code, namespace)
+
+    return CompiledTag(
+        compute_tag_data=namespace.get('compute_tag_data'),
+        render_tag=namespace.get('render_tag'),
+        source=source,
+    )
+
+
+def generate_code(tag_cls):
+    """
+    Generate source of tag class and compile it
+    :param tag_cls: tag class
+    :return: tuple (source, code)
+    """
+    source = generate_source(tag_cls)
+    return source, compile(source, '<wrapper_tag:{}>'.format(tag_cls.options.start_tag), 'exec')
+
+
+def invalidate_compiled(tag_cls):
+    """
+    Drop compiled functions of tag class (e.g. after argument plan changed)
+    :param tag_cls: tag class
+    """
+    if '_compiled_tag' in tag_cls.__dict__:
+        del tag_cls._compiled_tag
+
+
+def can_compile_data(tag_cls):
+    from wrapper_tag.tag import BaseTag
+
+    # async hooks are awaited by interpreted data pipeline (see `BaseTag.iter_tag_data`)
+    return utils.defining_class(tag_cls, 'compute_tag_data') is BaseTag and not tag_cls.options.lazy_render and \
+        not tag_cls.async_hooks
+
+
+def can_compile_render(tag_cls):
+    from wrapper_tag.tag import BaseTag
+
+    return utils.defining_class(tag_cls, 'render_tag') is BaseTag and \
+        isinstance(tag_cls.options.template, SimpleTemplate)
+
+
+def can_inline_resolve(argument):
+    """
+    Returns whether binding of argument can be resolved inline (argument doesn't customize bind/resolve_binding)
+    """
+    return utils.defining_class(type(argument), 'bind') is arguments.Argument and \
+        utils.defining_class(type(argument), 'resolve_binding') in (arguments.Argument, arguments.Keyword)
+
+
+def build_namespace(tag_cls):
+    """
+    Build globals for generated source, names are derived from position of argument in plan
+    :param tag_cls: tag class
+    :return: dict
+    """
+    namespace = {
+        'ValidationError': ValidationError,
+        'TemplateSyntaxError': TemplateSyntaxError,
+        'NULL': utils.NULL,
+        'get_config': utils.get_config,
+        'render_frame': utils.render_frame,
+        'ChunkList': rendered.ChunkList,
+        'RenderedTag': rendered.RenderedTag,
+        'tag_cls': tag_cls,
+        'logger': tag_cls.logger,
+        'options': tag_cls.options,
+        'start_tag': tag_cls.options.start_tag,
+        'on_data': tag_cls.on_data,
+        'on_render_data': tag_cls.on_render_data,
+    }
+
+    for i, entry in enumerate(tag_cls.argument_plan):
+        namespace['argument_{}'.format(i)] = entry.argument
+        namespace['logger_{}'.format(i)] = entry.argument.logger
+        namespace['extra_data_{}'.format(i)] = entry.extra_data
+        namespace['resolve_{}'.format(i)] = entry.resolve
+        namespace['get_tag_value_{}'.format(i)] = entry.argument.get_tag_value
+        namespace['tag_clean_{}'.format(i)] = entry.tag_clean
+        namespace['clean_{}'.format(i)] = entry.clean
+        namespace['render_{}'.format(i)] = entry.render
+        for j, validator in enumerate(entry.validators):
+            namespace['validator_{}_{}'.format(i, j)] = validator
+
+    if can_compile_render(tag_cls):
+        template = tag_cls.options.template
+        namespace['template'] = template
+        namespace['render_chunk'] = template.render_chunk
+        namespace['render_tag_interpreted'] = tag_cls.render_tag
+        namespace['invalidate_compiled'] = invalidate_compiled
+        for i, (is_variable, segment) in enumerate(template.segments):
+            if is_variable:
+                namespace['variable_{}'.format(i)] = segment
+
+    return namespace
+
+
+def generate_source(tag_cls):
+    """
+    Generate python source of tag functions
+    :param tag_cls: tag class
+    :return: source
+    """
+    writer = SourceWriter()
+
+    if can_compile_data(tag_cls):
+        write_compute_tag_data(writer, tag_cls)
+
+    if can_compile_render(tag_cls):
+        write_render_tag(writer, tag_cls)
+
+    return writer.getvalue()
+
+
+def write_compute_tag_data(writer, tag_cls):
+    writer.line('def compute_tag_data(tag, context, data):')
+    writer.indent()
+    writer.line('bindings = tag.bindings')
+    writer.line('kwargs = dict([(key, value.resolve(context)) for key, value in tag.unbound_kwargs.items()])')
+    writer.line('args = list([value.resolve(context) for value in tag.unbound_args])')
+    writer.line('tag_data = dict(data)')
+
+    for i, entry in enumerate(tag_cls.argument_plan):
+        writer.line()
+        writer.line('# argument {}', entry.name)
+        write_argument_value(writer, i, entry)
+
+        if entry.has_validators:
+            writer.line('try:')
+            writer.indent()
+            for j in range(len(entry.validators)):
+                writer.line('validator_{}_{}(value)', i, j)
+            writer.dedent()
+            writer.line('except ValidationError:')
+            writer.indent()
+            writer.line('value = argument_{}.default', i)
+            writer.dedent()
+
+        if entry.tag_clean is not None:
+            writer.line('value = tag_clean_{0}(tag, argument_{0}, value)', i)
+        if entry.clean is not None:
+            writer.line('value = clean_{}(tag, value)', i)
+
+        writer.line('if value is not None:')
+        writer.indent()
+        writer.line('tag_data[{!r}] = value', entry.name)
+        writer.dedent()
+
+    writer.line()
+    writer.line('if args and get_config().template_debug:')
+    writer.indent()
+    writer.line("raise TemplateSyntaxError('Tag `{}` received unhandled args: {}'.format(start_tag, args))")
+    writer.dedent()
+    writer.line('if kwargs and get_config().template_debug:')
+    writer.indent()
+    writer.line("raise TemplateSyntaxError('Tag `{}` received unhandled kwargs: {}'.format(start_tag, kwargs.keys()))")
+    writer.dedent()
+
+    writer.line()
+    writer.line("on_data.dispatch(tag_cls, logger, 'on_data', data=tag_data, context=context)")
+
+    rendered_entries = [(i, entry) for i, entry in enumerate(tag_cls.argument_plan) if entry.render is not None]
+    if rendered_entries:
+        writer.line()
+        writer.line('# rendered keys are checked on render, templates can be recompiled (see `analysis`)')
+        writer.line('rendered_keys = tag.get_rendered_keys()')
+        writer.line('with render_frame(context, tag_data) as frame:')
+        writer.indent()
+        for i, entry in rendered_entries:
+            writer.line('if rendered_keys is None or {!r} in rendered_keys:', entry.rendered_key)
+            writer.indent()
+            writer.line("logger_{}.debug('Rendering with: %s', tag_data)", i)
+            writer.line("frame['extra_data'] = extra_data_{}", i)
+            writer.line("frame['argument'] = argument_{}", i)
+            writer.line('value = render_{}(tag, tag_data, context)', i)
+            writer.line('if value is not NULL and value is not None:')
+            writer.indent()
+            writer.line('tag_data[{!r}] = value', entry.rendered_key)
+            writer.dedent()
+            writer.dedent()
+        writer.dedent()
+
+    writer.line()
+    writer.line("on_render_data.dispatch(tag_cls, logger, 'on_render_data', data=tag_data, context=context)")
+    writer.line('return tag_data')
+    writer.dedent()
+    writer.line()
+
+
+def write_argument_value(writer, i, entry):
+    """
+    Write code which assigns raw argument value to `value`
+    """
+    argument = entry.argument
+
+    if entry.readonly:
+        writer.line('value = argument_{}.default', i)
+        return
+
+    if entry.resolve is None:
+        writer.line('value = get_tag_value_{}(args, kwargs)', i)
+        return
+
+    if not can_inline_resolve(argument):
+        writer.line('value = resolve_{0}(bindings[{0}], context)', i)
+        return
+
+    writer.line('expression, raw = bindings[{}]', i)
+    writer.line('if raw is not None:')
+    writer.indent()
+    writer.line('value = raw.resolve(context)')
+    writer.dedent()
+    writer.line('elif expression is not None:')
+    writer.indent()
+    writer.line('value = expression.resolve(context)')
+    writer.dedent()
+    writer.line('else:')
+    writer.indent()
+    writer.line('value = argument_{}.default', i)
+    writer.dedent()
+
+    # Keyword.resolve_binding checks choices
+    if utils.defining_class(type(argument), 'resolve_binding') is arguments.Keyword and entry.has_choices:
+        writer.line('choices = argument_{}.choices', i)
+        writer.line('if choices and value not in choices:')
+        writer.indent()
+        writer.line('value = argument_{}.default', i)
+        writer.dedent()
+
+
+def write_render_tag(writer, tag_cls):
+    template = tag_cls.options.template
+
+    writer.line('def render_tag(tag, tag_kwargs, context):')
+    writer.indent()
+    writer.line('# template was recompiled (e.g. invalidated), segments below are stale, generate again on next render')
+    writer.line('if options.template is not template:')
+    writer.indent()
+    writer.line('invalidate_compiled(tag_cls)')
+    writer.line('return render_tag_interpreted(tag, tag_kwargs, context)')
+    writer.dedent()
+    writer.line('return RenderedTag(ChunkList((')
+    writer.indent()
+    for i, (is_variable, segment) in enumerate(template.segments):
+        if is_variable:
+            writer.line('render_chunk(variable_{}, context),', i)
+        else:
+            writer.line('{!r},', segment)
+    writer.dedent()
+    writer.line(')), start_tag, arguments=tag_kwargs)')
+    writer.dedent()
+    writer.line()
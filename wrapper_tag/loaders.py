@@ -0,0 +1,355 @@
+"""
+Batched data loading (DataLoader-style) for wrapper tags
+
+Tags which look up data in hooks (e.g. model instances in `clean_<argument>`) issue one query per tag occurrence. With
+loader the lookup is batched over whole page::
+
+    user_loader = loaders.ModelLoader(User)
+
+    class UserTag(wrapper_tag.Tag):
+        user = wrapper_tag.Keyword()
+
+        def clean_user(self, argument, value):
+            return user_loader.load(value)
+
+    html = loaders.render_batched('page.html', {'users': users}, request=request)
+
+`render_batched` renders template in two phases:
+
+1. collect - template is walked without rendering: every wrapper tag only resolves and cleans its arguments
+   (`clean_tag_data`, render hooks and signal receivers are not run), `load` registers keys and returns None. Only
+   `{% for %}`, `{% if %}`, `{% with %}`, `{% block %}`, `{% extends %}` and `{% include %}` are executed to reach
+   nested wrapper tags, other nodes are not. Tags assigned to variable store rendered tag with cleaned data and
+   without content. Fragment cached tags compute their data on cache miss only, so they don't collect. Errors in this
+   phase are logged as warnings (hooks get None instead of loaded values).
+2. render - one bulk `load_many` per loader fetches all collected keys, then template is rendered as usual and `load`
+   returns fetched values (keys which were not collected, e.g. in branches which depend on loaded values, are fetched
+   one by one).
+
+Outside of `render_batched` loader fetches every key immediately.
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import threading
+from logging import getLogger
+
+import six
+from django.template.base import VariableDoesNotExist
+from django.template.context import make_context
+from django.template.defaulttags import ForNode, IfNode, WithNode
+from django.template.loader import get_template
+from django.template.loader_tags import BlockNode, ExtendsNode, IncludeNode
+
+from wrapper_tag import utils
+
+logger = getLogger('wrapper_tag.loaders')
+
+_local = threading.local()
+
+
+def get_batch():
+    """
+    Returns active batch of current thread, None if not rendering with `render_batched`
+    :return: Batch
+    """
+    stack = getattr(_local, 'stack', None)
+    if not stack:
+        return None
+    return stack[-1]
+
+
+class Batch(object):
+    """
+    Keys collected by loaders and fetched values for single render, shared by worker threads of parallel render
+    """
+
+    collecting = False
+
+    def __init__(self):
+        self.keys = {}
+        self.results = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        if not hasattr(_local, 'stack'):
+            _local.stack = []
+        _local.stack.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _local.stack.pop()
+
+    def load(self, loader, key):
+        """
+        Return value for key (None while collecting)
+        :param loader: BatchLoader
+        :param key: normalized key
+        :return:
+        """
+        with self._lock:
+            if self.collecting:
+                self.keys.setdefault(loader, set()).add(key)
+                return None
+
+            results = self.results.setdefault(loader, {})
+            if key not in results:
+                self.fetch_keys(loader, [key])
+            return results[key]
+
+    def fetch(self):
+        """
+        Fetch all collected keys, one `load_many` per loader
+        """
+        with self._lock:
+            for loader, keys in six.iteritems(self.keys):
+                results = self.results.setdefault(loader, {})
+                missing = [key for key in keys if key not in results]
+                if missing:
+                    self.fetch_keys(loader, missing)
+            self.keys = {}
+
+    def fetch_keys(self, loader, keys):
+        # called with lock held
+        found = loader.load_many(keys)
+        results = self.results.setdefault(loader, {})
+        for key in keys:
+            results[key] = found.get(key)
+
+
+class BatchLoader(object):
+    """
+    Base loader, subclasses implement `load_many`
+    """
+
+    def load(self, key):
+        """
+        Load value for key, batched when rendered with `render_batched`
+        :param key: key
+        :return: value or None if not found (or while collecting keys)
+        """
+        if key is None:
+            return None
+
+        key = self.get_key(key)
+
+        batch = get_batch()
+        if batch is None:
+            return self.load_many([key]).get(key)
+        return batch.load(self, key)
+
+    def get_key(self, key):
+        """
+        Normalize key (e.g. string from template to int)
+        :param key: key
+        :return:
+        """
+        return key
+
+    def load_many(self, keys):
+        """
+        Load values for all keys at once
+        :param keys: list of keys
+        :return: dict of key to value (missing keys are not found)
+        """
+        raise NotImplementedError
+
+
+class ModelLoader(BatchLoader):
+    """
+    Loads model instances by field value (primary key by default) with `in_bulk`
+    """
+
+    def __init__(self, model, field_name='pk', queryset=None):
+        self.model = model
+        self.field_name = field_name
+        self.queryset = queryset
+
+        if field_name == 'pk':
+            self.field = model._meta.pk
+        else:
+            self.field = model._meta.get_field(field_name)
+
+    def __repr__(self):
+        return '<ModelLoader: {}.{}>'.format(self.model.__name__, self.field_name)
+
+    def get_key(self, key):
+        if isinstance(key, self.model):
+            return getattr(key, self.field.attname)
+        return self.field.to_python(key)
+
+    def get_queryset(self):
+        if self.queryset is not None:
+            return self.queryset.all()
+        return self.model._default_manager.all()
+
+    def load_many(self, keys):
+        if self.field_name == 'pk':
+            return self.get_queryset().in_bulk(keys)
+        return self.get_queryset().in_bulk(keys, field_name=self.field_name)
+
+
+def render_batched(template, context=None, request=None):
+    """
+    Render template in two phases, so data of all tags are loaded by single query per loader
+    :param template: template name or template returned by `get_template`
+    :param context: context dict
+    :param request: request
+    :return: rendered text
+    """
+    if isinstance(template, six.string_types):
+        template = get_template(template)
+
+    with Batch() as batch:
+        batch.collecting = True
+        try:
+            collect_template(template, context, request)
+        except Exception as error:
+            logger.warning('Collect phase failed: %s', error, exc_info=True)
+        finally:
+            batch.collecting = False
+
+        batch.fetch()
+
+        return template.render(context, request)
+
+
+def collect_template(template, context=None, request=None):
+    """
+    Collect phase of template (see `collect_nodelist`)
+    :param template: template returned by `get_template`
+    :param context: context dict
+    :param request: request
+    """
+    # unwrap backend template
+    backend = getattr(template, 'backend', None)
+    template = getattr(template, 'template', template)
+
+    autoescape = backend.engine.autoescape if backend is not None else template.engine.autoescape
+    context = make_context(context, request, autoescape=autoescape)
+
+    # same as django.template.Template.render
+    with context.render_context.push_state(template):
+        with context.bind_template(template):
+            context.template_name = template.name
+            collect_nodelist(template.nodelist, context)
+
+
+def collect_nodelist(nodelist, context):
+    """
+    Collect keys of wrapper tags in nodelist without rendering it, wrapper tags compute their data (`BaseTag.collect`),
+    control flow nodes are walked, other nodes are not executed
+    :param nodelist: NodeList
+    :param context: render context
+    """
+    for node in nodelist:
+        collect = getattr(node, 'collect', None)
+        if collect is not None:
+            collect(context)
+            continue
+
+        collect_node = COLLECTORS.get(node.__class__)
+        if collect_node is not None:
+            collect_node(node, context)
+
+
+def collect_for(node, context):
+    """
+    Walk loop body for every item, same as `ForNode.render`
+    """
+    parentloop = context['forloop'] if 'forloop' in context else {}
+    with context.push():
+        values = node.sequence.resolve(context, ignore_failures=True)
+        if values is None:
+            values = []
+        if not hasattr(values, '__len__'):
+            values = list(values)
+        len_values = len(values)
+        if len_values < 1:
+            collect_nodelist(node.nodelist_empty, context)
+            return
+        if node.is_reversed:
+            values = reversed(values)
+
+        unpack = len(node.loopvars) > 1
+        loop_dict = context['forloop'] = {'parentloop': parentloop}
+        for i, item in enumerate(values):
+            loop_dict['counter0'] = i
+            loop_dict['counter'] = i + 1
+            loop_dict['revcounter'] = len_values - i
+            loop_dict['revcounter0'] = len_values - i - 1
+            loop_dict['first'] = (i == 0)
+            loop_dict['last'] = (i == len_values - 1)
+
+            if unpack:
+                with context.push(**dict(zip(node.loopvars, item))):
+                    collect_nodelist(node.nodelist_loop, context)
+            else:
+                context[node.loopvars[0]] = item
+                collect_nodelist(node.nodelist_loop, context)
+
+
+def collect_if(node, context):
+    """
+    Walk branch which would be rendered, same as `IfNode.render`
+    """
+    for condition, nodelist in node.conditions_nodelists:
+        if condition is not None:
+            try:
+                match = condition.eval(context)
+            except VariableDoesNotExist:
+                match = None
+        else:
+            match = True
+
+        if match:
+            collect_nodelist(nodelist, context)
+            return
+
+
+def collect_with(node, context):
+    values = dict((key, value.resolve(context)) for key, value in six.iteritems(node.extra_context))
+    with context.push(**values):
+        collect_nodelist(node.nodelist, context)
+
+
+def collect_block(node, context):
+    """
+    Walk block which would be rendered (overridden by child template), same as `BlockNode.render`
+    """
+    with utils.block_scope(node, context) as nodelist:
+        collect_nodelist(nodelist, context)
+
+
+def collect_extends(node, context):
+    """
+    Walk parent template with blocks of child template, same as `ExtendsNode.render`
+    """
+    parent = utils.get_extended_template(node, context)
+    with context.render_context.push_state(parent, isolated_context=False):
+        collect_nodelist(parent.nodelist, context)
+
+
+def collect_include(node, context):
+    """
+    Walk included template, same as `IncludeNode.render`
+    """
+    template = utils.get_included_template(node, context)
+    values = dict((name, value.resolve(context)) for name, value in six.iteritems(node.extra_context))
+    if node.isolated_context:
+        context = context.new(values)
+        values = {}
+
+    with context.push(**values):
+        with context.render_context.push_state(template):
+            collect_nodelist(template.nodelist, context)
+
+
+# nodes executed in collect phase, so wrapper tags in their nodelists are collected
+COLLECTORS = {
+    ForNode: collect_for,
+    IfNode: collect_if,
+    WithNode: collect_with,
+    BlockNode: collect_block,
+    ExtendsNode: collect_extends,
+    IncludeNode: collect_include,
+}
@@ -0,0 +1,70 @@
+from __future__ import print_function, unicode_literals
+
+import six
+from django.core.management.base import BaseCommand, CommandError
+
+from wrapper_tag import codecache, codegen, utils
+from wrapper_tag.tag import BaseTag
+
+
+class Command(BaseCommand):
+    help = "Build, verify or clear on-disk cache of generated tag code (WRAPPER_TAG_CODE_CACHE_DIR)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('action', choices=['build', 'verify', 'clear'])
+
+    def handle(self, *args, **options):
+        if not codecache.get_cache_dir():
+            raise CommandError('WRAPPER_TAG_CODE_CACHE_DIR setting is not set.')
+
+        if options['action'] == 'clear':
+            self.stdout.write('Removed {} cache files.'.format(codecache.clear()))
+            return
+
+        errors = 0
+        stored = []
+        for tag_cls in self.get_tag_classes():
+            if options['action'] == 'build':
+                status = self.build(tag_cls, stored)
+            else:
+                status = self.verify(tag_cls)
+
+            if status not in ('ok', 'built'):
+                errors += 1
+            self.stdout.write('{}: {}'.format(tag_cls.options.start_tag, status))
+
+        # files of previous builds (changed or removed tags) are never loaded again
+        if options['action'] == 'build':
+            self.stdout.write('Removed {} stale cache files.'.format(codecache.clear(keep=stored)))
+
+        if options['action'] == 'verify' and errors:
+            raise CommandError('{} tags are not cached.'.format(errors))
+
+    def get_tag_classes(self):
+        """
+        Returns all wrapper tag classes registered in templatetag libraries
+        :return:
+        """
+        result = []
+        for name, lib in sorted(six.iteritems(utils.get_config().get_templatetag_libs())):
+            for tag_name, compilation_func in sorted(six.iteritems(lib.tags)):
+                if isinstance(compilation_func, type) and issubclass(compilation_func, BaseTag) and \
+                        compilation_func not in result:
+                    result.append(compilation_func)
+        return result
+
+    def build(self, tag_cls, stored):
+        source, code = codegen.generate_code(tag_cls)
+        path = codecache.store(tag_cls, source, code)
+        if path is None:
+            return 'not cacheable'
+        stored.append(path)
+        return 'built'
+
+    def verify(self, tag_cls):
+        cached = codecache.load(tag_cls)
+        if cached is None:
+            return 'missing'
+        if cached[0] != codegen.generate_source(tag_cls):
+            return 'stale'
+        return 'ok'
@@ -5,12 +5,12 @@ from collections import defaultdict
 import six
 from django import template
 from django.template import TemplateSyntaxError
-from django.template.loader import render_to_string
+from django.template.loader import get_template
 from django.utils.html import format_html
 from django.utils.safestring import mark_safe
 from django.utils.translation import ugettext_lazy as _
 
-from wrapper_tag import arguments, validators, utils
+from wrapper_tag import arguments, attributes, validators, utils
 
 IDENTITY_ID_RAND_MAX = 2 ** 32
 
@@ -23,14 +23,32 @@ def tag_attributes_default(cls):
     return defaultdict(utils.StringSet)
 
 
+def ordered_tag_attributes_default(cls):
+    """
+    :param cls:
+    :return:
+    """
+    return defaultdict(attributes.TokenList)
+
+
 class TagAttributes(object):
     attrs = arguments.KeywordGroup(readonly=True, default=tag_attributes_default)
 
+    # html attributes of every rendered tag (e.g. ``{'type': 'button', 'class': 'btn'}``), rendered once per class
+    static_attrs = None
+
     def render_attrs(self, argument, data, context):
         attrs = data.get(argument.name, self.arguments[argument.name].default)
-        full = ' '.join(['{}="{}"'.format(key, value) for key, value in six.iteritems(attrs) if value])
-        full = ' ' + full if full else ''
-        return mark_safe(full)
+        full = attributes.format_attributes(attrs, attributes.get_static_attributes(self.__class__))
+        return mark_safe(' ' + full) if full else full
+
+
+class OrderedTagAttributes(TagAttributes):
+    """
+    TagAttributes with attribute values kept in order in which tokens were added (e.g. css classes), values are
+    `attributes.TokenList` instead of `utils.StringSet`
+    """
+    attrs = arguments.KeywordGroup(readonly=True, default=ordered_tag_attributes_default)
 
 
 def id_data_callback(data, **kwargs):
@@ -108,8 +126,7 @@ class Data(object):
         :param context: context for rendering
         :return:
         """
-        value = data.get(argument.name, {})
-        return ' '.join(['{}="{}"'.format(k.replace('_', '-'), v) for k, v in six.iteritems(value)])
+        return attributes.format_data(data.get(argument.name, {}))
 
 
 class Tag(object):
@@ -257,9 +274,11 @@ class ExtraContent(object):
         raise TemplateSyntaxError('ExtraContent mixin needs extra_content_template property.')
 
     def render_tag(self, tag_kwargs, context):
-        context['extra_content'] = render_to_string(self.extra_content_template, context)
-        print(context['extra_content'])
-        rendered = super(ExtraContent, self).render_tag(tag_kwargs, context)
-        print("rendered", rendered)
-
-        return rendered
\ No newline at end of file
+        # engine template is rendered with context as is (tag data are already pushed), backend template needs dict
+        extra_template = get_template(self.extra_content_template)
+        engine_template = getattr(extra_template, 'template', None)
+        if engine_template is not None:
+            context['extra_content'] = engine_template.render(context)
+        else:
+            context['extra_content'] = extra_template.render(context.flatten())
+        return super(ExtraContent, self).render_tag(tag_kwargs, context)
\ No newline at end of file
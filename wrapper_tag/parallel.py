@@ -0,0 +1,173 @@
+"""
+Parallel render of sibling wrapper tags (Meta.parallel)
+
+Container tag with `Meta.parallel` renders wrapper tags of its content on bounded thread pool, which pays off when
+tag hooks wait for I/O (remote services, slow queries)::
+
+    class Dashboard(wrapper_tag.Tag):
+        class Meta:
+            parallel = 8  # or True for WRAPPER_TAG_PARALLEL_WORKERS threads (4 by default)
+
+Output is always the same as of sequential render:
+
+* every wrapper tag gets its own copy of context (with its own top level dict and render context), so context
+  changes of one tag are not seen by its siblings
+* rendered nodes are reassembled in order of nodelist, the first error (in order of nodelist) is raised, other
+  errors are logged
+* wrapper tags assigned to variable (`as var`) and other template nodes (which can change context) are barriers,
+  they are rendered in order after all preceding siblings
+* active language, timezone and loaders batch are propagated to worker threads, database connections of worker
+  threads are closed after every task (also persistent ones, worker threads outlive requests)
+
+Nested parallel tags are rendered sequentially in worker threads, so pool is never waiting for itself.
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from copy import copy
+from logging import getLogger
+
+from django.conf import settings
+from django.db import close_old_connections, connections
+from django.template.base import TextNode, VariableNode
+from django.utils import timezone, translation
+
+from wrapper_tag import loaders
+
+logger = getLogger('wrapper_tag.parallel')
+
+DEFAULT_MAX_WORKERS = 4
+
+# nodes which only read context, so they can be rendered in any order
+READ_ONLY_NODES = (TextNode, VariableNode)
+
+_executors = {}
+_lock = threading.Lock()
+_local = threading.local()
+
+
+def get_max_workers(parallel):
+    """
+    Returns number of worker threads for `Meta.parallel` value
+    :param parallel: True (WRAPPER_TAG_PARALLEL_WORKERS setting) or number of threads
+    :return:
+    """
+    if parallel is True:
+        return getattr(settings, 'WRAPPER_TAG_PARALLEL_WORKERS', DEFAULT_MAX_WORKERS)
+    return int(parallel)
+
+
+def get_executor(max_workers):
+    """
+    Returns thread pool shared by all tags with the same number of workers
+    :param max_workers: number of worker threads
+    :return: ThreadPoolExecutor
+    """
+    with _lock:
+        executor = _executors.get(max_workers)
+        if executor is None:
+            executor = _executors[max_workers] = ThreadPoolExecutor(max_workers=max_workers)
+        return executor
+
+
+def in_worker():
+    """
+    Returns whether current thread is rendering parallel task
+    :return:
+    """
+    return getattr(_local, 'worker', False)
+
+
+def isolate(context):
+    """
+    Copy context for task, variables set by task are stored to its own dicts
+    :param context: render context
+    :return: Context
+    """
+    duplicate = copy(context)
+    duplicate.push()
+
+    # render context is looked up in top dict only, so it's copied instead of pushed
+    render_context = duplicate.render_context
+    render_context.dicts[-1] = copy(render_context.dicts[-1])
+    return duplicate
+
+
+def render_nodelist(nodelist, context, render_node, max_workers):
+    """
+    Render nodelist, sibling wrapper tags are rendered on thread pool
+    :param nodelist: NodeList
+    :param context: render context
+    :param render_node: callable (node, context) returning rendered node
+    :param max_workers: number of worker threads
+    :return: list of rendered nodes (RenderedTag or text)
+    """
+    if in_worker():
+        return [render_node(node, context) for node in nodelist]
+
+    bits = [None] * len(nodelist)
+    positions = []
+
+    for i, node in enumerate(nodelist):
+        if hasattr(node, 'render_to_tag') and not node.varname:
+            positions.append(i)
+        elif isinstance(node, READ_ONLY_NODES):
+            bits[i] = node.render_annotated(context)
+        else:
+            render_parallel(nodelist, positions, bits, context, render_node, max_workers)
+            positions = []
+            bits[i] = render_node(node, context)
+
+    render_parallel(nodelist, positions, bits, context, render_node, max_workers)
+    return bits
+
+
+def render_parallel(nodelist, positions, bits, context, render_node, max_workers):
+    """
+    Render wrapper tags at given positions of nodelist on thread pool, each with its own copy of context
+    """
+    if not positions:
+        return
+
+    if len(positions) == 1:
+        bits[positions[0]] = render_node(nodelist[positions[0]], context)
+        return
+
+    state = (translation.get_language(), timezone.get_current_timezone(), loaders.get_batch())
+    executor = get_executor(max_workers)
+    futures = [executor.submit(run_task, render_node, nodelist[i], isolate(context), state) for i in positions]
+
+    error = None
+    for i, future in zip(positions, futures):
+        try:
+            bits[i] = future.result()
+        except Exception as e:
+            if error is None:
+                error = e
+            else:
+                logger.error('Parallel render of %s failed: %s', nodelist[i], e, exc_info=e)
+
+    if error is not None:
+        raise error
+
+
+def run_task(render_node, node, context, state):
+    """
+    Render node in worker thread with state of rendering thread
+    """
+    language, tz, batch = state
+
+    _local.worker = True
+    # connection broken by previous task
+    close_old_connections()
+    try:
+        with translation.override(language), timezone.override(tz):
+            if batch is None:
+                return render_node(node, context)
+            with batch:
+                return render_node(node, context)
+    finally:
+        _local.worker = False
+        # pool threads live long, persistent connections (CONN_MAX_AGE) of worker thread are closed too
+        connections.close_all()
@@ -1,22 +1,89 @@
 from __future__ import absolute_import, print_function, unicode_literals
 
 from django.utils.encoding import python_2_unicode_compatible
+from django.utils.safestring import mark_safe
 
 SCRIPT_TAG = 'script'
 
 
 @python_2_unicode_compatible
-class RenderedTag(dict):
+class ChunkList(list):
+    """
+    Rendered safe content as list of text chunks and nested chunk lists (rope).
+
+    Nested wrapper tags append content of children as single item, so no level copies rendered html of its subtree.
+    Chunks are joined exactly once, when content is converted to text (at the outermost boundary).
+    """
+
+    def join(self):
+        """
+        Join all chunks (recursively), chunk list is not modified
+        :return: safe text
+        """
+        if len(self) == 1 and not isinstance(self[0], ChunkList):
+            return mark_safe(self[0])
+
+        bits = []
+        stack = [iter(self)]
+        while stack:
+            for chunk in stack[-1]:
+                if isinstance(chunk, ChunkList):
+                    stack.append(iter(chunk))
+                    break
+                bits.append(chunk)
+            else:
+                stack.pop()
+
+        return mark_safe(''.join(bits))
+
+    def __str__(self):
+        return self.join()
+
+    def __html__(self):
+        return self.join()
+
+
+class Deferred(object):
+    """
+    Content of RenderedTag rendered on first access (see `Meta.deferred`)
+    """
+
+    def __init__(self, render):
+        self.render = render
+
+
+@python_2_unicode_compatible
+class RenderedTag(object):
     """
     Rendered tag curried string object with data, so we can interact with the data on upper levels
+
+    Data are accessed as mapping (`rendered_tag['events']`) or attributes (`{{ tmp.events.on_click }}`). Tag data are
+    stored in `arguments` slot, other data (e.g. events, methods) in mapping allocated on first assignment.
     """
-    content = None
-    tag = None
+    __slots__ = ('chunks', 'tag', 'arguments', '_data')
 
-    def __init__(self, rendered_content, tag_name, **data):
-        self.content = rendered_content
+    def __init__(self, rendered_content, tag_name, arguments=None, **data):
+        self.chunks = rendered_content
         self.tag = tag_name
-        super(RenderedTag, self).__init__(**data)
+        self.arguments = arguments
+        self._data = data or None
+
+    @property
+    def content(self):
+        """
+        Rendered content as text (chunks are joined on first access)
+        :return:
+        """
+        chunks = self.chunks
+        if isinstance(chunks, Deferred):
+            chunks = self.chunks = chunks.render()
+        if isinstance(chunks, ChunkList):
+            return chunks.join()
+        return chunks
+
+    @content.setter
+    def content(self, value):
+        self.chunks = value
 
     def __str__(self):
         """
@@ -27,15 +94,82 @@ class RenderedTag(dict):
 
     def __repr__(self):
         """
-        Return rendered content
+        Return representation of tag, deferred content is not rendered
         :return:
         """
-        return self.content
+        if isinstance(self.chunks, Deferred):
+            return '<RenderedTag: {} (deferred)>'.format(self.tag)
+        return '<RenderedTag: {} {!r}>'.format(self.tag, self.content)
 
     def __getattr__(self, attr):
-        if attr in self.__dict__:
-            return self.__dict__[attr]
-        return self[attr]
+        # slots are always set, so only data keys get here
+        if attr.startswith('_'):
+            raise AttributeError(attr)
+        try:
+            return self[attr]
+        except KeyError:
+            raise AttributeError(attr)
+
+    def __getitem__(self, key):
+        if key == 'arguments' and self.arguments is not None:
+            return self.arguments
+        if self._data is None:
+            raise KeyError(key)
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        if key == 'arguments':
+            self.arguments = value
+            return
+        if self._data is None:
+            self._data = {}
+        self._data[key] = value
+
+    def __delitem__(self, key):
+        if key == 'arguments' and self.arguments is not None:
+            self.arguments = None
+            return
+        if self._data is None:
+            raise KeyError(key)
+        del self._data[key]
+
+    def __contains__(self, key):
+        if key == 'arguments':
+            return self.arguments is not None
+        return self._data is not None and key in self._data
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __bool__(self):
+        return self.content.strip() != ''
+
+    __nonzero__ = __bool__
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def setdefault(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            self[key] = default
+            return default
+
+    def keys(self):
+        keys = [] if self.arguments is None else ['arguments']
+        if self._data is not None:
+            keys.extend(self._data)
+        return keys
+
+    def values(self):
+        return [self[key] for key in self.keys()]
 
-    def __nonzero__(self):
-        return str(self).strip() != ''
\ No newline at end of file
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
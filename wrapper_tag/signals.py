@@ -0,0 +1,107 @@
+"""
+Signals used for tag hooks (on_data, on_render_data, on_render_tag, on_register)
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import asyncio
+import inspect
+from logging import ERROR
+
+from django.dispatch import Signal
+
+from wrapper_tag import utils
+
+
+class TagSignal(Signal):
+    """
+    TagSignal is django signal with fast `dispatch`.
+
+    Receivers of sender are cached by django (`use_caching`), `dispatch` returns immediately when there are no
+    receivers. Errors of receivers are logged (same as with `send_robust`). `version` is changed whenever receivers
+    change, so values computed from receivers (see `analysis`) can be cached.
+
+    Receivers can be `async def`, they are awaited concurrently by `adispatch` (async render), `dispatch` runs them
+    to completion (synchronous render).
+    """
+
+    def __init__(self, providing_args=None):
+        super(TagSignal, self).__init__(providing_args=providing_args, use_caching=True)
+        self.version = 0
+
+    def connect(self, receiver, sender=None, weak=True, dispatch_uid=None):
+        super(TagSignal, self).connect(receiver, sender=sender, weak=weak, dispatch_uid=dispatch_uid)
+        self.version += 1
+
+    def disconnect(self, receiver=None, sender=None, dispatch_uid=None):
+        disconnected = super(TagSignal, self).disconnect(receiver=receiver, sender=sender, dispatch_uid=dispatch_uid)
+        self.version += 1
+        return disconnected
+
+    def _remove_receiver(self, receiver=None):
+        # called when weak receiver is garbage collected (lock is not acquired, same as in django)
+        super(TagSignal, self)._remove_receiver(receiver=receiver)
+        self.version += 1
+
+    def get_receivers(self, sender):
+        """
+        Return tuple of live receivers of sender
+        :param sender: sender
+        :return:
+        """
+        if not self.receivers:
+            return ()
+        return tuple(self._live_receivers(sender))
+
+    def dispatch(self, sender, logger, name, **named):
+        """
+        Send signal to all receivers, errors are logged to logger
+        :param sender: sender
+        :param logger: logger for receiver errors
+        :param name: signal name used in log messages
+        :param named: signal arguments
+        :return:
+        """
+        if not self.receivers:
+            return
+
+        for receiver in self._live_receivers(sender):
+            try:
+                result = receiver(signal=self, sender=sender, **named)
+
+                # async receivers are run to completion in synchronous render
+                if result is not None and inspect.isawaitable(result):
+                    utils.run_sync(result)
+            except Exception as error:
+                if logger.isEnabledFor(ERROR):
+                    logger.error('%s: %s, returned error', name, receiver)
+                    logger.exception(error)
+
+    def has_async_receivers(self, sender):
+        """
+        Returns whether any live receiver of sender is `async def`
+        :param sender: sender
+        :return:
+        """
+        if not self.receivers:
+            return False
+        return any(asyncio.iscoroutinefunction(receiver) for receiver in self._live_receivers(sender))
+
+    def get_live_receivers(self, sender):
+        """
+        Return list of live receivers of sender
+        :param sender: sender
+        :return:
+        """
+        if not self.receivers:
+            return []
+        return self._live_receivers(sender)
+
+    def adispatch(self, sender, logger, name, **named):
+        """
+        Async variant of `dispatch`, async receivers are awaited concurrently
+        :return: awaitable
+        """
+        # aio uses `async def` syntax, so it's imported on use
+        from wrapper_tag import aio
+
+        return aio.dispatch(self, sender, logger, name, **named)
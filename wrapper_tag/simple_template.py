@@ -0,0 +1,185 @@
+"""
+Fast renderer for simple tag templates.
+
+Most of tag templates are plain variable substitutions (e.g. ``<div{{ title__rendered }}>{{ content }}</div>``) without
+tags and filters. Such templates are compiled to list of segments and rendered by joining strings, without django
+template engine. Autoescape, localization and `string_if_invalid` semantics are preserved.
+
+`TemplateMixin.template` (`Meta.template`, argument templates) returns SimpleTemplate for simple templates. It
+renders with django Context like django Template does, but it has no `nodelist`; code which needs django Template
+can use `Template(tag.options.template.source)`.
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import re
+
+from django.template import Engine, Variable, VariableDoesNotExist
+from django.template.base import Lexer, render_value_in_context
+from django.template.exceptions import TemplateSyntaxError
+from django.utils.safestring import mark_safe
+
+from wrapper_tag import rendered
+
+try:
+    from django.template.base import TokenType
+    TOKEN_TEXT, TOKEN_VAR = TokenType.TEXT, TokenType.VAR
+except ImportError:  # django < 2.1
+    from django.template.base import TOKEN_TEXT, TOKEN_VAR
+
+# simple variable lookup, no filters, no string literals, no translations
+SIMPLE_VARIABLE = re.compile(r'^[\w.]+$')
+
+
+class SimpleTemplate(object):
+    """
+    Simple template rendered by joining precomputed segments. Use `SimpleTemplate.compile` to create one.
+    """
+
+    engine = None
+    source = None
+
+    # tuple of (is_variable, text or Variable)
+    segments = None
+
+    def __init__(self, source, segments, engine=None):
+        self.source = source
+        self.segments = segments
+        self.engine = engine or Engine.get_default()
+        self._splits = {}
+
+    def __repr__(self):
+        return '<SimpleTemplate: {!r}>'.format(self.source[:20])
+
+    @classmethod
+    def compile(cls, source, engine=None):
+        """
+        Compile template source to SimpleTemplate
+        :param source: template source
+        :param engine: template engine (default engine if not given)
+        :return: SimpleTemplate instance or None if template is not simple
+        """
+        segments = parse_segments(source)
+        if segments is None:
+            return None
+        return cls(source, segments, engine=engine)
+
+    @property
+    def variables(self):
+        """
+        Return names of all variables used in template
+        :return:
+        """
+        return [segment.var for is_variable, segment in self.segments if is_variable]
+
+    def split(self, name):
+        """
+        Split template around single occurrence of variable `name` (e.g. `content` for streaming)
+        :param name: variable name
+        :return: tuple of (prefix, suffix) SimpleTemplate instances or None if variable is not used exactly once
+        """
+        try:
+            return self._splits[name]
+        except KeyError:
+            pass
+
+        positions = [i for i, (is_variable, segment) in enumerate(self.segments) if is_variable and segment.var == name]
+        if len(positions) != 1:
+            result = None
+        else:
+            position = positions[0]
+            result = (
+                SimpleTemplate(self.source, self.segments[:position], engine=self.engine),
+                SimpleTemplate(self.source, self.segments[position + 1:], engine=self.engine),
+            )
+
+        self._splits[name] = result
+        return result
+
+    def render(self, context):
+        """
+        Render template with context
+        :param context: django Context
+        :return:
+        """
+        bits = []
+        append = bits.append
+        for is_variable, segment in self.segments:
+            append(self.render_variable(segment, context) if is_variable else segment)
+
+        return mark_safe(''.join(bits))
+
+    def render_chunks(self, context):
+        """
+        Render template to ChunkList, ChunkList values (e.g. content of nested tags) are not joined
+        :param context: django Context
+        :return: ChunkList
+        """
+        render_chunk = self.render_chunk
+        return rendered.ChunkList([render_chunk(segment, context) if is_variable else segment
+                                   for is_variable, segment in self.segments])
+
+    def render_chunk(self, variable, context):
+        """
+        Render single variable, ChunkList value is returned as is (it's already safe)
+        :param variable: Variable instance
+        :param context: django Context
+        :return:
+        """
+        try:
+            value = variable.resolve(context)
+        except VariableDoesNotExist:
+            return self.render_variable(variable, context)
+
+        if isinstance(value, rendered.ChunkList):
+            return value
+        return render_value_in_context(value, context)
+
+    def accepts_chunks(self, name):
+        """
+        Returns whether variable `name` can hold ChunkList (it's only rendered, never looked up)
+        :param name: variable name
+        :return:
+        """
+        prefix = '{}.'.format(name)
+        return not any(variable.startswith(prefix) or variable.startswith('parent.' + prefix)
+                       for variable in self.variables)
+
+    def render_variable(self, variable, context):
+        """
+        Resolve and render single variable same as django VariableNode does
+        :param variable: Variable instance
+        :param context: django Context
+        :return:
+        """
+        try:
+            value = variable.resolve(context)
+        except VariableDoesNotExist:
+            string_if_invalid = self.engine.string_if_invalid
+            # same as FilterExpression.resolve, value is rendered (escaped) by render_value_in_context
+            if string_if_invalid and '%s' in string_if_invalid:
+                value = string_if_invalid % variable
+            else:
+                value = string_if_invalid
+
+        return render_value_in_context(value, context)
+
+
+def parse_segments(source):
+    """
+    Parse template source to segments
+    :param source: template source
+    :return: tuple of segments or None if template is not simple
+    """
+    segments = []
+    for token in Lexer(source).tokenize():
+        if token.token_type == TOKEN_TEXT:
+            segments.append((False, token.contents))
+        elif token.token_type == TOKEN_VAR and SIMPLE_VARIABLE.match(token.contents):
+            try:
+                segments.append((True, Variable(token.contents)))
+            except TemplateSyntaxError:
+                return None
+        else:
+            return None
+
+    return tuple(segments)
@@ -0,0 +1,99 @@
+"""
+Streaming render of templates with wrapper tags
+
+Wrapper tags with simple template (see `SimpleTemplate`) are streamed: template prefix is yielded first, then
+chunks of tag content and template suffix at last, so rendered html of nested tags is never joined on every level.
+Other nodes (and tags which cannot be streamed, see `BaseTag.get_stream_templates`) are yielded as single chunk.
+
+Only top level nodes of template are streamed, so templates with `{% extends %}` are rendered as single chunk.
+
+    def view(request):
+        return streaming.streaming_response('page.html', {'items': items}, request=request)
+"""
+from __future__ import absolute_import, print_function, unicode_literals
+
+import six
+from django.http import StreamingHttpResponse
+from django.template.context import make_context
+from django.template.loader import get_template
+
+# size of chunks sent to client by `streaming_response`
+DEFAULT_BUFFER_SIZE = 8192
+
+
+def iter_nodelist(nodelist, context):
+    """
+    Render nodelist as iterator of chunks, wrapper tags are streamed
+    :param nodelist: NodeList
+    :param context: render context
+    :return: iterator of text chunks
+    """
+    for node in nodelist:
+        render_iter = getattr(node, 'render_iter', None)
+        if render_iter is not None:
+            for chunk in render_iter(context):
+                yield chunk
+        else:
+            yield six.text_type(node.render_annotated(context))
+
+
+def iter_template(template, context=None, request=None):
+    """
+    Render template as iterator of chunks
+    :param template: template name or template returned by `get_template`
+    :param context: context dict
+    :param request: request
+    :return: iterator of text chunks
+    """
+    if isinstance(template, six.string_types):
+        template = get_template(template)
+
+    # unwrap backend template
+    backend = getattr(template, 'backend', None)
+    template = getattr(template, 'template', template)
+
+    autoescape = backend.engine.autoescape if backend is not None else template.engine.autoescape
+    context = make_context(context, request, autoescape=autoescape)
+
+    # same as django.template.Template.render
+    with context.render_context.push_state(template):
+        with context.bind_template(template):
+            context.template_name = template.name
+            for chunk in iter_nodelist(template.nodelist, context):
+                yield chunk
+
+
+def buffered(chunks, size=DEFAULT_BUFFER_SIZE):
+    """
+    Join small chunks to chunks of at least `size` characters
+    :param chunks: iterator of text chunks
+    :param size: minimal size of chunk
+    :return: iterator of text chunks
+    """
+    buffer = []
+    length = 0
+    for chunk in chunks:
+        if not chunk:
+            continue
+        buffer.append(chunk)
+        length += len(chunk)
+        if length >= size:
+            yield ''.join(buffer)
+            buffer = []
+            length = 0
+
+    if buffer:
+        yield ''.join(buffer)
+
+
+def streaming_response(template, context=None, request=None, buffer_size=DEFAULT_BUFFER_SIZE, **kwargs):
+    """
+    Return StreamingHttpResponse with streamed template
+    :param template: template name or template returned by `get_template`
+    :param context: context dict
+    :param request: request
+    :param buffer_size: minimal size of chunk sent to client
+    :param kwargs: additional arguments of StreamingHttpResponse (content_type, status)
+    :return: StreamingHttpResponse
+    """
+    return StreamingHttpResponse(buffered(iter_template(template, context, request), buffer_size), **kwargs)
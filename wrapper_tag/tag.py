@@ -2,19 +2,29 @@ from __future__ import absolute_import, print_function, unicode_literals
 
 import copy
 from collections import OrderedDict
-from logging import getLogger, ERROR, INFO
+from functools import partial
+from logging import getLogger, INFO
 
-from django.core.exceptions import ImproperlyConfigured
-from django.dispatch import Signal
+from django.core.exceptions import ImproperlyConfigured, ValidationError
 from django.template import Context, Template
 from django.template import Node
 from django.template.exceptions import TemplateSyntaxError
 from django.template.loader import get_template
 from django.utils import six
+from django.utils.safestring import mark_safe
 
+from wrapper_tag import analysis
 from wrapper_tag import arguments
+from wrapper_tag import bulk
+from wrapper_tag import caching
+from wrapper_tag import codegen
+from wrapper_tag import loaders
+from wrapper_tag import parallel
 from wrapper_tag import rendered
+from wrapper_tag import signals
+from wrapper_tag import streaming
 from wrapper_tag import utils
+from wrapper_tag.simple_template import SimpleTemplate
 
 logger = getLogger('wrapper_tag.tags')
 
@@ -41,6 +51,25 @@ class TagOptions(utils.TemplateMixin):
             self.end_tag = end_tag
 
         self.as_var_only = bool(getattr(options, 'as_var_only', False))
+
+        # pure tag doesn't depend on context in clean/render hooks and signal receivers, so invocations with
+        # literal arguments only are resolved once (constant folding)
+        self.pure = bool(getattr(options, 'pure', False))
+
+        # fragment cache of rendered tag
+        self.cache = caching.FragmentCache.from_meta(getattr(options, 'cache', None))
+
+        # wrapper tags in content are rendered on thread pool (True or number of worker threads)
+        self.parallel = getattr(options, 'parallel', False)
+
+        # html of tag assigned to variable is rendered when variable is printed (see `BaseTag.defer`)
+        self.deferred = bool(getattr(options, 'deferred', False))
+
+        # arguments are rendered on first access in template (see `utils.LazyData`)
+        self.lazy_render = bool(getattr(options, 'lazy_render', False))
+
+        # dead argument elimination (see `analysis`), 'auto' or list of arguments which are always rendered enables it
+        self.used_arguments = getattr(options, 'used_arguments', None)
         self.aliases = getattr(options, 'aliases', [])
         self.tag_name = tag_name
         self.class_prepared = getattr(options, 'class_prepared', 'class_prepared')
@@ -138,10 +167,10 @@ class TagMetaclass(type):
         cls.arguments = copy.deepcopy(cls._declared_arguments)
 
         # signals
-        cls.on_data = Signal(providing_args=["data", "context"])
-        cls.on_render_tag = Signal(providing_args=["rendered_tag", "data", "context"])
-        cls.on_render_data = Signal(providing_args=["data", "context"])
-        cls.on_register = Signal()
+        cls.on_data = signals.TagSignal(providing_args=["data", "context"])
+        cls.on_render_tag = signals.TagSignal(providing_args=["rendered_tag", "data", "context"])
+        cls.on_render_data = signals.TagSignal(providing_args=["data", "context"])
+        cls.on_register = signals.TagSignal()
 
         super(TagMetaclass, cls).__init__(name, bases, attrs)
 
@@ -155,6 +184,11 @@ class TagMetaclass(type):
         # run all class prepared
         cls.__run_class_prepared(bases)
 
+        # precompile argument plan (after class_prepared, so it sees final arguments and methods)
+        cls.argument_plan = tuple(argument.get_plan(cls) for argument in six.itervalues(cls.arguments))
+        cls.async_hooks = any(entry.async_tag_clean or entry.async_clean or entry.async_render
+                              for entry in cls.argument_plan)
+
     def __run_class_prepared(cls, bases):
 
         for base in reversed(cls.__mro__):
@@ -191,9 +225,16 @@ class BaseTag(object):
     """
     args = None
     kwargs = None
+    bindings = ()
+    unbound_args = None
+    unbound_kwargs = None
+    foldable = False
+    folded_data = None
     varname = None
     nodelist = None
     arguments = []
+    argument_plan = ()
+    async_hooks = False
 
     # signals
     on_data = None
@@ -220,9 +261,41 @@ class BaseTag(object):
         # parse args and kwargs
         self.args, self.kwargs = utils.parse_bits(parser, bits, self.options.start_tag)
 
+        # bind args and kwargs to arguments, so render only resolves values
+        self.unbound_args, self.unbound_kwargs = list(self.args), dict(self.kwargs)
+        self.bindings = tuple(
+            entry.argument.bind(self.unbound_args, self.unbound_kwargs) if entry.resolve is not None else None
+            for entry in self.argument_plan
+        )
+
+        # tag data of literal only invocation of pure tag are computed just once
+        self.foldable = self.is_foldable()
+
         # die token die
         parser.delete_first_token()
 
+    def is_foldable(self):
+        """
+        Returns whether tag data can be computed once and reused in all renders. Tag must be pure (Meta.pure or all
+        arguments pure, tag without arguments must set Meta.pure) and invoked with literal arguments only.
+        :return:
+        """
+        if not (self.options.pure or self.argument_plan and all(entry.argument.pure for entry in self.argument_plan)):
+            return False
+
+        if self.unbound_args or self.unbound_kwargs:
+            return False
+
+        for entry, binding in zip(self.argument_plan, self.bindings):
+            if entry.resolve is None or not entry.argument.is_constant_binding(binding):
+                return False
+
+            # argument template reading context variables renders differently in every context
+            if entry.has_template and analysis.reads_context(self.__class__, entry.argument.template):
+                return False
+
+        return True
+
     def get_tag_data(self, context, **data):
         """
         Return tag kwargs for render
@@ -230,21 +303,94 @@ class BaseTag(object):
         :param data: additional data
         :return:
         """
-        kwargs = dict([(key, value.resolve(context)) for key, value in self.kwargs.items()])
-        args = list([value.resolve(context) for value in self.args])
+        compute_tag_data = self.compute_tag_data
+        if utils.is_compiled_mode():
+            compiled = codegen.get_compiled(self.__class__).compute_tag_data
+            if compiled is not None:
+                compute_tag_data = partial(compiled, self)
+
+        if self.foldable and not data:
+            folded = self.folded_data
+            if folded is None:
+                folded = self.folded_data = utils.FoldedData(compute_tag_data(context, data))
+            return folded.copy()
+
+        return compute_tag_data(context, data)
+
+    def compute_tag_data(self, context, data):
+        """
+        Resolve, clean and render all arguments (in compiled mode replaced by generated function, see `codegen`).
+        Async hooks are awaited by async render (see `aio`), synchronous render runs them to completion.
+        :param context: context
+        :param data: additional data
+        :return:
+        """
+        tag_data = self.new_tag_data(data)
+        utils.run_steps(self.iter_tag_data(context, tag_data))
+        return tag_data
 
-        # do we really need to deepcopy this data?
-        tag_data = copy.deepcopy(data)
+    def clean_tag_data(self, context):
+        """
+        Resolve and clean all arguments, arguments are not rendered and signals are not dispatched (collect phase of
+        `loaders.render_batched`)
+        :param context: context
+        :return: dict of cleaned values
+        """
+        tag_data = {}
+        utils.run_steps(self.iter_tag_data(context, tag_data, render=False))
+        return tag_data
 
-        # iterate over arguments and call get_tag_value on it
-        for _, argument in six.iteritems(self.arguments):
-            value = argument.get_tag_value(args, kwargs)
+    def new_tag_data(self, data):
+        """
+        Returns mapping filled by `iter_tag_data`
+        :param data: additional data
+        :return: LazyData if arguments are rendered on first access, otherwise dict
+        """
+        return utils.LazyData(data) if self.is_lazy() else dict(data)
 
-            # clean the value
-            value = argument.full_clean(self, value)
+    def iter_tag_data(self, context, tag_data, render=True):
+        """
+        Data pipeline of synchronous and async render, resolved, cleaned and rendered arguments are stored to tag_data.
+        Awaitables returned by async hooks (and async signal receivers) are yielded, result is sent back.
+        :param context: context
+        :param tag_data: mapping returned by `new_tag_data`
+        :param render: False to stop after arguments are cleaned
+        :return: generator of awaitables
+        """
+        # only args/kwargs not bound at compile time are resolved here
+        kwargs = dict([(key, value.resolve(context)) for key, value in self.unbound_kwargs.items()])
+        args = list([value.resolve(context) for value in self.unbound_args])
+
+        # iterate over argument plan, get values and clean them
+        for entry, binding in zip(self.argument_plan, self.bindings):
+            argument = entry.argument
+
+            if entry.readonly:
+                value = argument.default
+            elif entry.resolve is not None:
+                value = entry.resolve(binding, context)
+            else:
+                value = argument.get_tag_value(args, kwargs)
+
+            if entry.has_validators:
+                for validator in entry.validators:
+                    try:
+                        validator(value)
+                    except ValidationError:
+                        value = argument.default
+                        break
+
+            if entry.tag_clean is not None:
+                value = entry.tag_clean(self, argument, value)
+                if entry.async_tag_clean:
+                    value = yield value
+            if entry.clean is not None:
+                value = entry.clean(self, value)
+                if entry.async_clean:
+                    value = yield value
 
             if value is not None:
-                tag_data[argument.name] = value
+                tag_data[entry.name] = value
 
         # unhandled args
         if utils.get_config().template_debug and args:
@@ -255,75 +401,377 @@ class BaseTag(object):
             raise TemplateSyntaxError('Tag `{}` received unhandled kwargs: {}'.format(
                 self.options.start_tag, kwargs.keys()))
 
+        if not render:
+            return
+
         # dispatch on_data signal
-        self.__dispatch_on_data(tag_data, context)
+        if self.on_data.has_async_receivers(self.__class__):
+            yield self.on_data.adispatch(self.__class__, self.logger, 'on_data', data=tag_data, context=context)
+        else:
+            self.__dispatch_on_data(tag_data, context)
+
+        # render all arguments read by templates, lazy data defer render of arguments, async render is awaited here
+        lazy = isinstance(tag_data, utils.LazyData)
+        rendered_keys = self.get_rendered_keys()
+        eager = []
+        for entry in self.argument_plan:
+            if entry.render is None:
+                continue
+            if rendered_keys is not None and entry.rendered_key not in rendered_keys:
+                continue
+            if lazy and not entry.async_render:
+                tag_data.defer(entry.rendered_key, partial(self.render_argument, entry, tag_data, context))
+            else:
+                eager.append(entry)
+
+        # tag data are pushed once and only argument slots are swapped
+        if eager:
+            with utils.render_frame(context, tag_data) as frame:
+                for entry in eager:
+                    entry.argument.logger.debug('Rendering with: %s', tag_data)
+
+                    frame['extra_data'] = entry.extra_data
+                    frame['argument'] = entry.argument
 
-        # render all arguments
-        for _, argument in six.iteritems(self.arguments):
-            argument.logger.debug('Rendering with: %s', tag_data)
+                    tmp = entry.render(self, tag_data, context)
+                    if entry.async_render:
+                        tmp = yield tmp
 
-            tmp = argument.full_render(self, tag_data, context=context)
-            if tmp is utils.NULL or tmp is None:
+                    if tmp is utils.NULL or tmp is None:
+                        continue
+                    tag_data[entry.rendered_key] = tmp
+
+        # dispatch on_render_data signal
+        if self.on_render_data.has_async_receivers(self.__class__):
+            yield self.on_render_data.adispatch(self.__class__, self.logger, 'on_render_data', data=tag_data,
+                                                context=context)
+        else:
+            self.__dispatch_on_render_data(tag_data, context)
+
+    def has_async_hooks(self):
+        """
+        Returns whether data pipeline awaits hooks (async argument hooks or on_data/on_render_data receivers).
+        Tags overriding `compute_tag_data` are always computed synchronously.
+        :return:
+        """
+        tag_cls = self.__class__
+        if utils.defining_class(tag_cls, 'compute_tag_data') is not BaseTag:
+            return False
+
+        return tag_cls.async_hooks or self.on_data.has_async_receivers(tag_cls) or \
+            self.on_render_data.has_async_receivers(tag_cls)
+
+    def is_lazy(self):
+        """
+        Returns whether arguments are rendered on first access. Data of tags assigned to variable and folded data are
+        always rendered eagerly, since they outlive render of tag.
+        :return:
+        """
+        return self.options.lazy_render and not self.varname and not self.foldable
+
+    def render_argument(self, entry, tag_data, context):
+        """
+        Render single argument (deferred render of `Meta.lazy_render`, async render is never deferred)
+        :param entry: ArgumentPlan
+        :param tag_data: tag data
+        :param context: render context
+        :return: rendered value
+        """
+        entry.argument.logger.debug('Rendering with: %s', tag_data)
+
+        with utils.render_frame(context, tag_data) as frame:
+            frame['extra_data'] = entry.extra_data
+            frame['argument'] = entry.argument
+            return entry.render(self, tag_data, context)
+
+    def get_rendered_keys(self):
+        """
+        Returns rendered keys which must be rendered (dead argument elimination, see `analysis`)
+        :return: frozenset of rendered keys or None if all arguments are rendered
+        """
+        if self.varname:
+            return None
+        return analysis.get_rendered_keys(self.__class__)
+
+    def resolve_arguments(self, context, names=None):
+        """
+        Resolve raw (not cleaned) argument values
+        :param context: context
+        :param names: argument names to resolve, all arguments if None
+        :return: list of (name, value) tuples
+        """
+        result = []
+        for entry, binding in zip(self.argument_plan, self.bindings):
+            if names is not None and entry.name not in names:
                 continue
-            tag_data[argument.rendered_key] = tmp
+            if entry.resolve is not None:
+                result.append((entry.name, entry.resolve(binding, context)))
 
-        # dispatch on_data signal
-        self.__dispatch_on_render_data(tag_data, context)
+        # args/kwargs not bound at compile time
+        if names is None:
+            result.extend((key, value.resolve(context)) for key, value in sorted(self.unbound_kwargs.items()))
+            result.extend(('', value.resolve(context)) for value in self.unbound_args)
 
-        return tag_data
+        return result
 
     def render(self, context):
+        """
+        Render tag to text (template nodes such as {% for %} expect text)
+        :param context: render context
+        :return: safe text
+        """
+        return mark_safe(six.text_type(self.render_to_tag(context)))
+
+    def render_to_tag(self, context):
         """
         Render method does multiple steps
 
         * resolve args/kwargs
         * iterate over all arguments and call get_tag_value
+
+        :param context: render context
+        :return: RenderedTag (empty text if tag is assigned to variable)
         """
+        batch = loaders.get_batch()
+        if batch is not None and batch.collecting:
+            return self.collect(context)
+
+        if self.options.cache is not None and not self.varname:
+            return self.options.cache.render(self, context)
+
         tag_kwargs = self.get_tag_data(context)
+        if self.varname and self.options.deferred:
+            return self.defer(tag_kwargs, context)
 
-        if self.logger.isEnabledFor(INFO):
-            self.logger.info("Rendering with: %s", tag_kwargs.keys())
+        return self.render_with_data(tag_kwargs, self.render_content(context), context)
 
-        self.logger.debug("Rendering with: %s", tag_kwargs)
+    def defer(self, tag_kwargs, context):
+        """
+        Store RenderedTag with deferred content to variable (`Meta.deferred`). Tag data, events and methods are
+        available immediately, content and template are rendered on first conversion to text. Snapshot of context
+        reuses its dicts (nothing is copied), so dicts pushed later (e.g. `{% with %}`) are not seen, but values
+        assigned later to the same dicts are.
+        :param tag_kwargs: tag data
+        :param context: render context
+        :return: empty text
+        """
+        snapshot = parallel.isolate(context)
+        content = rendered.Deferred(partial(self.render_deferred, tag_kwargs, snapshot))
+
+        rendered_tag = rendered.RenderedTag(content, self.options.start_tag, arguments=tag_kwargs)
+        self.__dispatch_on_render_tag(rendered_tag, tag_kwargs, context)
 
-        context_dict = context.flatten()
-        tag_kwargs['content'] = self.nodelist.render(context)
-        context_dict['parent'] = tag_kwargs
+        context[self.varname] = rendered_tag
+        return ''
 
-        # # render content which is isolated from tag data
-        # with context.push(parent=tag_kwargs):
-        #     tag_kwargs['content'] = self.nodelist.render(context)
-        #
-        # context = context.flatten()
+    def render_deferred(self, tag_kwargs, context):
+        """
+        Render deferred content of tag
+        :param tag_kwargs: tag data
+        :param context: snapshot of render context
+        :return: rendered content
+        """
+        self.logger.debug("Rendering deferred: %s", tag_kwargs)
+        return self.render_template(tag_kwargs, self.render_content(context), context).chunks
 
-        # render tag to variable
-        rendered_tag = self.render_tag(tag_kwargs, context_dict)
+    def collect(self, context):
+        """
+        Collect phase of `loaders.render_batched`, arguments are only resolved and cleaned (so loaders in clean hooks
+        collect keys), render hooks and signal receivers are not run. Content is walked by `loaders.collect_nodelist`.
+        Data are never folded, since loaders return None in this phase. Fragment cached tags compute data on cache
+        miss only, so their data are not collected.
+        :param context: render context
+        :return:
+        """
+        if self.options.cache is None or self.varname:
+            try:
+                tag_data = self.clean_tag_data(context)
+            except Exception as error:
+                self.logger.warning('Collecting failed: %s', error, exc_info=True)
+                tag_data = None
 
-        self.logger.debug("Rendered: %s", rendered_tag)
+            # branches reading variable see tag data (without content) as in render phase
+            if self.varname:
+                context[self.varname] = rendered.RenderedTag('', self.options.start_tag, arguments=tag_data)
 
-        # check if render_tag returned RenderedTag, if not wrap the text into it
-        if not isinstance(rendered_tag, rendered.RenderedTag):
-            rendered_tag = rendered.RenderedTag(rendered_tag, self.options.start_tag, arguments=tag_kwargs)
+        loaders.collect_nodelist(self.nodelist, context)
+        return ''
+
+    def render_content(self, context):
+        """
+        Render nodelist. If tag template only outputs `content`, content is ChunkList, where rendered nested tags are
+        kept as chunks, so html of subtree is not copied on every level of nesting. With `Meta.parallel` nested
+        wrapper tags are rendered on thread pool (see `parallel`).
+        :param context: render context
+        :return: text or ChunkList
+        """
+        if self.options.parallel:
+            bits = parallel.render_nodelist(self.nodelist, context, self.render_node,
+                                            parallel.get_max_workers(self.options.parallel))
+            return self.join_content(bits)
+
+        if not self.accepts_chunks():
+            return self.nodelist.render(context)
+
+        return self.join_content([self.render_node(node, context) for node in self.nodelist])
+
+    @staticmethod
+    def render_node(node, context):
+        """
+        Render node of nodelist, nested wrapper tags return RenderedTag, so their chunks are not joined. Exceptions
+        are annotated with template debug info as in `Node.render_annotated`.
+        :param node: template node
+        :param context: render context
+        :return: RenderedTag or text
+        """
+        if not isinstance(node, BaseTag) or utils.defining_class(node.__class__, 'render') is not BaseTag:
+            return node.render_annotated(context)
+
+        try:
+            return node.render_to_tag(context)
+        except Exception as e:
+            if context.template.engine.debug and not hasattr(e, 'template_debug'):
+                e.template_debug = context.render_context.template.get_exception_info(e, node.token)
+            raise
+
+    def join_content(self, bits):
+        """
+        Join rendered nodes of nodelist to content
+        :param bits: list of rendered nodes (RenderedTag or text)
+        :return: ChunkList if tag accepts it, otherwise safe text
+        """
+        if not self.accepts_chunks():
+            return mark_safe(''.join([six.text_type(bit) for bit in bits]))
+
+        chunks = rendered.ChunkList()
+        append = chunks.append
+        for bit in bits:
+            if isinstance(bit, rendered.RenderedTag):
+                append(bit.chunks)
+            else:
+                append(six.text_type(bit))
+        return chunks
+
+    def accepts_chunks(self):
+        """
+        Returns whether content can be passed to tag template as ChunkList, content must not be seen outside of
+        template (`as var`, on_render_tag receivers, customized rendering)
+        :return:
+        """
+        if self.varname or self.on_render_tag.get_receivers(self.__class__):
+            return False
+
+        template = self.get_simple_template()
+        return template is not None and template.accepts_chunks('content')
+
+    def arender(self, context):
+        """
+        Render tag asynchronously, async hooks are awaited and sibling wrapper tags in content are rendered
+        concurrently (see `aio`)
+        :param context: render context
+        :return: awaitable of rendered tag
+        """
+        # aio uses `async def` syntax, so it's imported on use
+        from wrapper_tag import aio
+
+        return aio.render(self, context)
+
+    def render_iter(self, context):
+        """
+        Render tag as iterator of chunks: template prefix, streamed content (nested wrapper tags are streamed too)
+        and template suffix. Tags which cannot be streamed (see `get_stream_templates`) yield single chunk.
+        :param context: render context
+        :return: iterator of text chunks
+        """
+        templates = self.get_stream_templates()
+        if templates is None:
+            yield six.text_type(self.render(context))
+            return
+
+        prefix, suffix = templates
+        tag_kwargs = self.get_tag_data(context)
+
+        self.logger.debug("Streaming with: %s", tag_kwargs)
+
+        with utils.render_frame(context, tag_kwargs) as frame:
+            frame['parent'] = tag_kwargs
+            yield prefix.render(context)
+
+        for chunk in streaming.iter_nodelist(self.nodelist, context):
+            yield chunk
+
+        with utils.render_frame(context, tag_kwargs) as frame:
+            frame['parent'] = tag_kwargs
+            yield suffix.render(context)
+
+        if isinstance(tag_kwargs, utils.LazyData):
+            tag_kwargs.close()
+
+    def render_into(self, context, write):
+        """
+        Render tag chunk by chunk into writer
+        :param context: render context
+        :param write: callable receiving text chunks (e.g. `file.write`)
+        """
+        for chunk in self.render_iter(context):
+            write(chunk)
+
+    def get_stream_templates(self):
+        """
+        Returns (prefix, suffix) templates around `content` if tag can be streamed, otherwise None.
+
+        Tag is not streamed if its rendered tag is needed as whole (`as var`, fragment cache, on_render_tag receivers)
+        or when render is customized or template is not simple.
+        :return:
+        """
+        if self.varname or self.options.as_var_only or self.options.cache is not None:
+            return None
+
+        if self.on_render_tag.get_receivers(self.__class__):
+            return None
+
+        template = self.get_simple_template()
+        if template is None:
+            return None
+
+        return template.split('content')
+
+    def get_simple_template(self):
+        """
+        Returns tag template if it's SimpleTemplate and tag doesn't customize rendering, otherwise None
+        :return:
+        """
+        tag_cls = self.__class__
+        for name in ('render', 'render_to_tag', 'render_with_data', 'render_template', 'render_tag'):
+            if utils.defining_class(tag_cls, name) is not BaseTag:
+                return None
+
+        template = self.options.template
+        if not isinstance(template, SimpleTemplate):
+            return None
+
+        return template
+
+    def render_with_data(self, tag_kwargs, content, context):
+        """
+        Render tag with already computed tag data and rendered content
+        :param tag_kwargs: tag data
+        :param content: rendered nodelist
+        :param context: context
+        :return:
+        """
+        rendered_tag = self.render_template(tag_kwargs, content, context)
 
         # dispatch on_render_tag
         self.__dispatch_on_render_tag(rendered_tag, tag_kwargs, context)
 
+        # values which were not accessed are not rendered anymore
+        if isinstance(tag_kwargs, utils.LazyData):
+            tag_kwargs.close()
+
         # stored to context under self.varname
         if self.varname:
-            try:
-                context[self.varname]
-            except KeyError:
-                pass
-            else:
-                pass
-                # This should be removed because what if we are in for cycle?
-                # if utils.is_template_debug():
-                #     raise TemplateSyntaxError('variable {} already exists on context'.format(self.varname))
-
-            # store value to context and push one context
-            context_dict[self.varname] = rendered_tag
-            # context.push({})
-
+            context[self.varname] = rendered_tag
             return ''
 
         # check if tag is intended as_var_only (can be only stored to variable, not print directly
@@ -333,19 +781,59 @@ class BaseTag(object):
 
         return rendered_tag
 
-    def render_tag(self, tag_kwargs, context: dict):
+    def render_template(self, tag_kwargs, content, context):
         """
-        The method you should override in your custom tags
+        Render tag template with tag data and rendered content
+        :param tag_kwargs: tag data
+        :param content: rendered nodelist
+        :param context: context
+        :return: RenderedTag
         """
-        tmp = ''
-        # with context.push(**tag_kwargs):
-        context.update(**tag_kwargs)
+        if self.logger.isEnabledFor(INFO):
+            # dict.keys doesn't render deferred values of lazy data
+            self.logger.info("Rendering with: %s", dict.keys(tag_kwargs))
 
+        self.logger.debug("Rendering with: %s", tag_kwargs)
+
+        tag_kwargs['content'] = content
+
+        # render tag with single context push of tag data (instead of flattening whole context)
+        render_tag = self.render_tag
+        if utils.is_compiled_mode():
+            compiled = codegen.get_compiled(self.__class__).render_tag
+            if compiled is not None:
+                render_tag = partial(compiled, self)
+
+        # tag data are pushed by reference (lazy data must not be copied)
+        with utils.render_frame(context, tag_kwargs) as frame:
+            frame['parent'] = tag_kwargs
+            rendered_tag = render_tag(tag_kwargs, context)
+
+        self.logger.debug("Rendered: %s", rendered_tag)
+
+        # check if render_tag returned RenderedTag, if not wrap the text into it
+        if not isinstance(rendered_tag, rendered.RenderedTag):
+            rendered_tag = rendered.RenderedTag(rendered_tag, self.options.start_tag, arguments=tag_kwargs)
+
+        return rendered_tag
+
+    def render_tag(self, tag_kwargs, context):
+        """
+        The method you should override in your custom tags
+
+        Tag data are already pushed to context (also available as `parent`). Context is django `Context` (not dict),
+        use `context.flatten()` for APIs which need dict (e.g. `render()` of backend template).
+        :param tag_kwargs: tag data
+        :param context: render context (django Context)
+        """
         template = self.options.template
         if template is None:
             raise ImproperlyConfigured("tag: {}, error: please provide meta.template_name or meta.template".format(
                 self.options.start_tag))
-        tmp = template.render(context)
+        if isinstance(template, SimpleTemplate):
+            tmp = template.render_chunks(context)
+        else:
+            tmp = template.render(context)
 
         return rendered.RenderedTag(tmp, self.options.start_tag, arguments=tag_kwargs)
 
@@ -356,13 +844,7 @@ class BaseTag(object):
         :param context: context
         :return:
         """
-        result = self.on_data.send_robust(sender=self.__class__, data=data, context=context)
-
-        if self.logger.isEnabledFor(ERROR):
-            for method, error in result:
-                if error:
-                    self.logger.error('on_render_tag: %s, returned error', method)
-                    self.logger.exception(error)
+        self.on_data.dispatch(self.__class__, self.logger, 'on_data', data=data, context=context)
 
     def __dispatch_on_render_data(self, data, context):
         """
@@ -371,13 +853,7 @@ class BaseTag(object):
         :param context: context
         :return:
         """
-        result = self.on_render_data.send_robust(sender=self.__class__, data=data, context=context)
-
-        if self.logger.isEnabledFor(ERROR):
-            for method, error in result:
-                if error:
-                    self.logger.error('on_render_data: %s, returned error', method)
-                    self.logger.exception(error)
+        self.on_render_data.dispatch(self.__class__, self.logger, 'on_render_data', data=data, context=context)
 
     def __dispatch_on_render_tag(self, rendered_tag, data, context):
         """
@@ -387,14 +863,19 @@ class BaseTag(object):
         :param context:
         :return:
         """
-        result = self.on_render_tag.send_robust(sender=self.__class__, rendered_tag=rendered_tag, data=data,
-                                                context=context)
+        self.on_render_tag.dispatch(self.__class__, self.logger, 'on_render_tag', rendered_tag=rendered_tag,
+                                    data=data, context=context)
 
-        if self.logger.isEnabledFor(ERROR):
-            for method, error in result:
-                if error:
-                    self.logger.error('on_render_tag: %s, returned error', method)
-                    self.logger.exception(error)
+    @classmethod
+    def render_many(cls, rows, content='', context=None):
+        """
+        Render tag once for every row, tag data are computed column-wise (see `bulk`)
+        :param rows: iterable of dicts with argument values
+        :param content: content of all tags, or callable (row) returning content of tag
+        :param context: Context or dict
+        :return: list of RenderedTag
+        """
+        return bulk.render_many(cls, rows, content=content, context=context)
 
     @classmethod
     def get_template(cls, template=None, template_name=None):
@@ -0,0 +1,71 @@
+from __future__ import absolute_import, print_function, unicode_literals
+
+from django import template
+from django.template.exceptions import TemplateSyntaxError
+from django.utils import six
+from django.utils.safestring import mark_safe
+
+from wrapper_tag import bulk
+from wrapper_tag.tag import BaseTag
+
+register = template.Library()
+
+
+class ForEachTagNode(template.Node):
+    """
+    Renders wrapper tag for every row with `Tag.render_many`
+    """
+
+    def __init__(self, tag_cls, rows, loopvar, nodelist):
+        self.tag_cls = tag_cls
+        self.rows = rows
+        self.loopvar = loopvar
+        self.nodelist = nodelist
+
+    def render(self, context):
+        rows = self.rows.resolve(context)
+        if not rows:
+            return ''
+
+        # content without variables and tags is the same for all rows
+        if self.nodelist.contains_nontext:
+            content = self.render_content(context)
+        else:
+            content = self.nodelist.render(context)
+
+        rendered = bulk.render_many(self.tag_cls, rows, content=content, context=context)
+        return mark_safe(''.join([six.text_type(rendered_tag) for rendered_tag in rendered]))
+
+    def render_content(self, context):
+        def render(row):
+            with context.push(**{self.loopvar: row}):
+                return self.nodelist.render(context)
+
+        return render
+
+
+@register.tag('for_each_tag')
+def for_each_tag(parser, token):
+    """
+    {% for_each_tag <tag name> <rows> [as <row variable>] %}content{% end:for_each_tag %}
+    """
+    bits = token.split_contents()
+
+    loopvar = 'row'
+    if len(bits) == 5 and bits[3] == 'as':
+        loopvar = bits[4]
+        bits = bits[:3]
+
+    if len(bits) != 3:
+        raise TemplateSyntaxError('`{}` tag expects tag name and rows: {{% {} <tag> <rows> [as <row>] %}}'.format(
+            bits[0], bits[0]))
+
+    tag_cls = parser.tags.get(bits[1])
+    if not (isinstance(tag_cls, type) and issubclass(tag_cls, BaseTag)):
+        raise TemplateSyntaxError('`{}` is not loaded wrapper tag'.format(bits[1]))
+
+    rows = parser.compile_filter(bits[2])
+    nodelist = parser.parse(('end:{}'.format(bits[0]),))
+    parser.delete_first_token()
+
+    return ForEachTagNode(tag_cls, rows, loopvar, nodelist)
@@ -3,18 +3,25 @@ Various helper utilities for wrapper tag
 """
 from __future__ import absolute_import, print_function, unicode_literals
 
+import copy
 import random
 import re
+import weakref
+from contextlib import contextmanager
+from decimal import Decimal
+from functools import lru_cache, partial
 
 from django import get_version
 from django.apps import apps
 from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
-from django.template import Context, RequestContext, Template
+from django.template import Context, Engine, RequestContext, Template
 from django.template import TemplateSyntaxError
-from django.template.base import token_kwargs
+from django.template.base import FilterExpression, TextNode, Variable, token_kwargs
 from django.template.context import BaseContext
 from django.template.loader import get_template
+from django.template.loader_tags import BLOCK_CONTEXT_KEY, BlockContext, BlockNode, ExtendsNode
+from django.template.loaders.cached import Loader as CachedLoader
 
 from distutils.version import LooseVersion
 
@@ -22,9 +29,12 @@ import inspect
 # from django.utils import inspect
 from django.utils import six
 from django.utils.encoding import python_2_unicode_compatible
+from django.utils.functional import Promise
 
 from logging import getLogger
 
+from wrapper_tag.simple_template import SimpleTemplate
+
 logger = getLogger('wrapper_tag')
 
 
@@ -38,9 +48,18 @@ CAMEL_TO_SEPARATED = re.compile('((?<=[a-z0-9])[A-Z]|(?!^)[A-Z](?=[a-z]))')
 # regex type for isinstance
 REGEX_TYPE = type(re.compile(''))
 
+# types that are safe to share without copying
+IMMUTABLE_TYPES = six.string_types + six.integer_types + (bytes, float, complex, bool, type(None), Decimal, Promise)
+
 # max rand value to generate id
 ID_RAND_MAX = 2 ** 32
 
+# all TemplateMixin instances that hold compiled template (so we can invalidate them at once)
+_compiled_template_holders = weakref.WeakSet()
+
+# cached WRAPPER_TAG_COMPILED setting (see `is_compiled_mode`)
+_compiled_mode = None
+
 
 class NULL:
     """
@@ -75,6 +94,226 @@ def flatten_context(context):
     return context
 
 
+@contextmanager
+def render_frame(context, data):
+    """
+    Push tag data (by reference, without copying) and small dict for per-argument slots (`argument`, `extra_data`)
+    to context. Yields slots dict, so arguments are rendered with single push of tag data.
+    :param context: render context
+    :param data: tag data
+    :return:
+    """
+    slots = {}
+    context.dicts.append(data)
+    context.dicts.append(slots)
+    try:
+        yield slots
+    finally:
+        context.dicts.pop()
+        context.dicts.pop()
+
+
+def run_sync(awaitable):
+    """
+    Run awaitable returned by async hook to completion in synchronous render (WSGI fallback, see `aio.run_sync`)
+    :param awaitable: awaitable returned by hook
+    :return: result
+    """
+    # aio uses `async def` syntax, so it's imported on use
+    from wrapper_tag import aio
+
+    return aio.run_sync(awaitable)
+
+
+def run_steps(steps):
+    """
+    Run data pipeline (see `BaseTag.iter_tag_data`) synchronously, yielded awaitables are run to completion
+    :param steps: generator of awaitables
+    """
+    result = None
+    while True:
+        try:
+            awaitable = steps.send(result)
+        except StopIteration:
+            return
+
+        try:
+            result = run_sync(awaitable)
+        except BaseException:
+            steps.close()
+            raise
+
+
+def get_included_template(node, context):
+    """
+    Returns template included by IncludeNode (same as `IncludeNode.render`, template is cached in render context)
+    :param node: IncludeNode
+    :param context: render context
+    :return: Template
+    """
+    template = node.template.resolve(context)
+    if not callable(getattr(template, 'render', None)):
+        template_name = template
+        cache = context.render_context.dicts[0].setdefault(node, {})
+        template = cache.get(template_name)
+        if template is None:
+            template = cache[template_name] = context.template.engine.get_template(template_name)
+    elif hasattr(template, 'template'):
+        # unwrap backend template
+        template = template.template
+    return template
+
+
+def get_extended_template(node, context):
+    """
+    Returns parent template of ExtendsNode, blocks of template and its root parent are added to block context (same as
+    `ExtendsNode.render`)
+    :param node: ExtendsNode
+    :param context: render context
+    :return: Template
+    """
+    parent = node.get_parent(context)
+
+    if BLOCK_CONTEXT_KEY not in context.render_context:
+        context.render_context[BLOCK_CONTEXT_KEY] = BlockContext()
+    block_context = context.render_context[BLOCK_CONTEXT_KEY]
+    block_context.add_blocks(node.blocks)
+
+    for child in parent.nodelist:
+        if not isinstance(child, TextNode):
+            if not isinstance(child, ExtendsNode):
+                block_context.add_blocks(dict((block.name, block) for block in
+                                              parent.nodelist.get_nodes_by_type(BlockNode)))
+            break
+    return parent
+
+
+@contextmanager
+def block_scope(node, context):
+    """
+    Yields nodelist rendered in place of BlockNode (block of child template which overrides it), same as
+    `BlockNode.render`
+    :param node: BlockNode
+    :param context: render context
+    :return:
+    """
+    block_context = context.render_context.get(BLOCK_CONTEXT_KEY)
+    with context.push():
+        if block_context is None:
+            context['block'] = node
+            yield node.nodelist
+            return
+
+        push = block = block_context.pop(node.name)
+        if block is None:
+            block = node
+        # new block stores context, same as django
+        block = type(node)(block.name, block.nodelist)
+        block.context = context
+        context['block'] = block
+        try:
+            yield block.nodelist
+        finally:
+            if push is not None:
+                block_context.push(node.name, push)
+
+
+class LazyData(dict):
+    """
+    Tag data with values computed on first access (`Meta.lazy_render`). Deferred value is computed on lookup or
+    membership test, computed value is stored, None/NULL values are treated as missing (so context lookup falls
+    through to outer dicts as in eager mode). Iteration (keys, items, `**data`, ...) computes all deferred values.
+    `len()` (and truth value) counts computed values only, so logging tag data doesn't render them.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(LazyData, self).__init__(*args, **kwargs)
+        self.pending = {}
+
+    def defer(self, key, func):
+        """
+        Compute value of key by calling func on first access
+        :param key: key
+        :param func: callable without arguments
+        """
+        self.pending[key] = func
+
+    def resolve(self, key):
+        """
+        Compute deferred value of key (value set directly takes precedence)
+        :param key: key
+        :return: whether key is present
+        """
+        func = self.pending.pop(key, None)
+        if dict.__contains__(self, key):
+            return True
+        if func is None:
+            return False
+
+        value = func()
+        if value is NULL or value is None:
+            return False
+
+        dict.__setitem__(self, key, value)
+        return True
+
+    def resolve_all(self):
+        """
+        Compute all deferred values
+        """
+        while self.pending:
+            self.resolve(next(iter(self.pending)))
+
+    def __contains__(self, key):
+        return dict.__contains__(self, key) or key in self.pending and self.resolve(key)
+
+    def __missing__(self, key):
+        if key in self.pending and self.resolve(key):
+            return dict.__getitem__(self, key)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __iter__(self):
+        self.resolve_all()
+        return dict.__iter__(self)
+
+    def __eq__(self, other):
+        self.resolve_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    __hash__ = None
+
+    def keys(self):
+        self.resolve_all()
+        return dict.keys(self)
+
+    def values(self):
+        self.resolve_all()
+        return dict.values(self)
+
+    def items(self):
+        self.resolve_all()
+        return dict.items(self)
+
+    def copy(self):
+        self.resolve_all()
+        return dict(self)
+
+    def close(self):
+        """
+        Drop values which were not accessed (and references to render context)
+        """
+        self.pending.clear()
+
+
 def get_config():
     """
     Return wrapper tag config
@@ -122,22 +361,119 @@ def parse_bits(parser, bits, name):
     return args, kwargs
 
 
+def is_constant_expression(expression):
+    """
+    Returns whether compiled expression resolves to the same value in every context (literal without filters)
+    :param expression: FilterExpression instance
+    :return:
+    """
+    if not isinstance(expression, FilterExpression):
+        return False
+
+    if expression.filters:
+        return False
+
+    var = expression.var
+    if isinstance(var, Variable):
+        return var.lookups is None and not var.translate
+
+    return True
+
+
 class TemplateMixin(object):
+    """
+    TemplateMixin provides compiled template from `template` or `template_name`.
+
+    Compiled template is cached on instance, so template is parsed only once per process. Templates loaded by
+    `template_name` are cached only when template engine uses cached loader (or WRAPPER_TAG_CACHE_TEMPLATES is set),
+    so in development template changes are picked up without restart.
+    """
 
     template_errors = {
         'no_template': 'Please provide template or template_name',
     }
 
+    _compiled_template = None
+
     def __init__(self, template=None, template_name=None):
         self._template = template
         self._template_name = template_name
 
     @property
     def template(self):
+        compiled = self._compiled_template
+        if compiled is not None:
+            return compiled
+
+        compiled = self.compile_template()
+
+        if compiled is not None and is_template_cache_enabled(template_name=not self._template):
+            self._compiled_template = compiled
+            _compiled_template_holders.add(self)
+
+        return compiled
+
+    def compile_template(self):
+        """
+        Compile template from `template` or `template_name`. Simple templates (only variables, no tags and filters)
+        are compiled to SimpleTemplate which is rendered without template engine.
+        :return: django.template.Template or SimpleTemplate instance
+        """
         if self._template:
-            return Template(self._template)
+            return SimpleTemplate.compile(self._template) or Template(self._template)
         elif self._template_name:
-            return get_template(self._template_name)
+            # unwrap backend template, so it can be rendered with Context
+            template = get_template(self._template_name)
+            template = getattr(template, 'template', template)
+            return SimpleTemplate.compile(template.source, engine=template.engine) or template
+
+    def invalidate_template(self):
+        """
+        Invalidate compiled template, next access to `template` compiles it again
+        """
+        self._compiled_template = None
+        _compiled_template_holders.discard(self)
+
+
+def invalidate_templates(**kwargs):
+    """
+    Invalidate all compiled templates (e.g. after template files changed in development).
+
+    Can be connected directly as signal receiver.
+    """
+    for holder in list(_compiled_template_holders):
+        holder.invalidate_template()
+
+
+def is_template_cache_enabled(template_name=False):
+    """
+    Returns whether compiled templates should be cached.
+
+    WRAPPER_TAG_CACHE_TEMPLATES setting enables/disables caching, if not set, string templates are always cached and
+    templates loaded by name are cached only if default engine uses cached loader.
+    :param template_name: whether template is loaded by name
+    :return:
+    """
+    enabled = getattr(settings, 'WRAPPER_TAG_CACHE_TEMPLATES', None)
+    if enabled is not None:
+        return bool(enabled)
+
+    if not template_name:
+        return True
+
+    return uses_cached_loader()
+
+
+def uses_cached_loader():
+    """
+    Returns whether default template engine uses cached template loader
+    :return:
+    """
+    try:
+        engine = Engine.get_default()
+    except ImproperlyConfigured:
+        return False
+    return any(isinstance(loader, CachedLoader) for loader in engine.template_loaders)
 
 
 def get_sub_logger(logger, *names):
@@ -161,6 +497,90 @@ def is_seq(iterable):
     return isinstance(iterable, (list, tuple))
 
 
+@lru_cache(maxsize=1024)
+def defining_class(cls, name):
+    """
+    Returns class in mro which defines attribute `name` (cached, classes are not expected to be patched)
+    :param cls: class
+    :param name: attribute name
+    :return:
+    """
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            return klass
+
+
+def is_compiled_mode():
+    """
+    Returns whether tags are rendered with generated functions (WRAPPER_TAG_COMPILED setting, see `codegen`)
+    :return:
+    """
+    global _compiled_mode
+
+    if _compiled_mode is None:
+        _compiled_mode = bool(getattr(settings, 'WRAPPER_TAG_COMPILED', False))
+    return _compiled_mode
+
+
+def reset_compiled_mode(**kwargs):
+    """
+    Read WRAPPER_TAG_COMPILED setting again on next render
+    """
+    global _compiled_mode
+
+    _compiled_mode = None
+
+
+def is_immutable(value):
+    """
+    Returns whether value is immutable (including nested values of tuples and frozensets)
+    :param value:
+    :return:
+    """
+    if isinstance(value, IMMUTABLE_TYPES):
+        return True
+    if isinstance(value, (tuple, frozenset)):
+        return all(is_immutable(item) for item in value)
+    return False
+
+
+def copy_factory(value):
+    """
+    Returns factory which constructs copy of value. Immutable value is returned as is, mutable values are copied
+    (shallow copy if their items are immutable).
+    :param value: value
+    :return: callable without arguments
+    """
+    if is_immutable(value):
+        return lambda: value
+
+    if isinstance(value, (list, set)) and all(is_immutable(item) for item in value):
+        return value.copy
+
+    if isinstance(value, dict) and all(is_immutable(item) for item in value.values()):
+        return value.copy
+
+    return partial(copy.deepcopy, value)
+
+
+class FoldedData(object):
+    """
+    Tag data computed once (constant folding), every render gets its own copy of mutable values, so changes made by
+    one render (e.g. `attrs` added in `render_tag` or receivers) are not seen by others.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.factories = tuple((key, copy_factory(value)) for key, value in six.iteritems(data)
+                               if not is_immutable(value))
+
+    def copy(self):
+        result = dict(self.data)
+        for key, factory in self.factories:
+            result[key] = factory()
+        return result
+
+
 def is_template_debug():
     """
     Returns whether template debug is enabled
@@ -218,6 +638,35 @@ def verify_func_signature(func, *args, **kwargs):
                     prefix, func_name, args, spec_args))
 
 
+def wildcard_pattern(item):
+    """
+    Convert wildcard (`*` any, `+` at least one character) to regular expression pattern
+    :param item: wildcard string
+    :return:
+    """
+    return item.replace('+', '.+').replace('*', '.*')
+
+
+@lru_cache(maxsize=None)
+def compile_wildcard(item):
+    """
+    Returns compiled regular expression for wildcard (compiled once per process)
+    :param item: wildcard string
+    :return:
+    """
+    return re.compile('^{}$'.format(wildcard_pattern(item)))
+
+
+@lru_cache(maxsize=None)
+def compile_wildcards(items):
+    """
+    Returns single compiled regular expression matching any of wildcards (compiled once per process)
+    :param items: tuple of wildcard strings
+    :return:
+    """
+    return re.compile('^(?:{})$'.format('|'.join(wildcard_pattern(item) for item in items)))
+
+
 def find_elements(item, iterable):
     """
     Finds elements with wildcard in iterable (list, tuple..)
@@ -227,17 +676,11 @@ def find_elements(item, iterable):
     :param iterable: list/tuple of elements to find in..
     :return: list of found
     """
-    result = []
-
     if not isinstance(item, REGEX_TYPE):
-        pattern = '^{}$'.format(item.replace('+', '.+').replace('*', '.*'))
-        item = re.compile(pattern)
-
-    for value in iterable:
-        if item.match(value):
-            result.append(value)
+        item = compile_wildcard(item)
 
-    return result
+    match = item.match
+    return [value for value in iterable if match(value)]
 
 
 def register_tag(library, **kwargs):
@@ -289,9 +732,8 @@ def register_tag(library, **kwargs):
 
         # send on_register signal
         # @TODO: add this code also to aliases
-        # @TODO: log errors to debug
         # @TODO: call all on_register on all __mro__ bases
-        cls.on_register.send_robust(sender=cls)
+        cls.on_register.dispatch(cls, cls.logger, 'on_register')
 
         logger.debug("Registered `%s`=>`%s` wrapper tag.", cls.options.start_tag, cls.options.end_tag)
 